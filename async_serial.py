@@ -0,0 +1,318 @@
+"""
+Asyncio serial module.
+
+This module provides an asyncio transport for serial ports opened through
+SerialManager, plus open_connection-style stream helpers. Reads and writes
+are driven by the event loop watching the port's file descriptor, so no
+thread is involved. It has no Qt dependency. POSIX only, since Windows
+serial ports have no descriptor the event loop can watch.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import Any, Callable, Optional
+
+import serial
+
+import globalvar as gl
+from logwrapper import logger
+from serial_manager import SerialManager
+
+
+class SerialTransport(asyncio.Transport):
+    """
+    Asyncio transport over an open SerialManager port.
+
+    Incoming data is read with one non-blocking read whenever the loop
+    reports the descriptor readable and handed to protocol.data_received().
+    Writes go straight to the descriptor; whatever the driver does not
+    take at once is queued and flushed when the port becomes writable,
+    with pause_writing()/resume_writing() flow control on the queue size.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.Protocol,
+        serial_manager: SerialManager,
+    ) -> None:
+        """
+        Initialize the transport and start reading.
+
+        Args:
+            loop: Event loop to register with
+            protocol: Protocol receiving the data
+            serial_manager: Serial manager with an open port
+
+        Raises:
+            serial.SerialException: If the port has no pollable descriptor
+        """
+        super().__init__()
+        fd = serial_manager.fileno()
+        if fd is None:
+            raise serial.SerialException("Port is not open or cannot be watched by the event loop")
+
+        self._loop = loop
+        self._protocol = protocol
+        self._serial_manager = serial_manager
+        self._fd = fd
+        self._write_buffer: deque[memoryview] = deque()
+        self._write_buffer_size = 0
+        self._high_water = gl.ASYNC_WRITE_HIGH_WATER
+        self._low_water = gl.ASYNC_WRITE_HIGH_WATER // 4
+        self._writing_paused = False
+        self._reading = True
+        self._closing = False
+        self._connection_lost = False
+        self.log = logger.logger
+
+        self._loop.call_soon(self._protocol.connection_made, self)
+        self._loop.call_soon(self._start_reading)
+
+    def _start_reading(self) -> None:
+        """Watch the port for data, unless closed or paused in the meantime."""
+        if self._reading and not self._closing:
+            self._loop.add_reader(self._fd, self._read_ready)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """
+        Get transport information.
+
+        Args:
+            name: "serial_manager", "serial" (the pyserial instance) or "port"
+            default: Value returned for unknown names
+
+        Returns:
+            The requested object, or default
+        """
+        if name == "serial_manager":
+            return self._serial_manager
+        if name == "serial":
+            return self._serial_manager.serial_instance
+        if name == "port":
+            return self._serial_manager.serial_instance.port
+        return default
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def is_reading(self) -> bool:
+        return self._reading and not self._closing
+
+    def pause_reading(self) -> None:
+        if self._reading and not self._closing:
+            self._reading = False
+            self._loop.remove_reader(self._fd)
+
+    def resume_reading(self) -> None:
+        if not self._reading and not self._closing:
+            self._reading = True
+            self._loop.add_reader(self._fd, self._read_ready)
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def _read_ready(self) -> None:
+        """Read what the port has and pass it to the protocol."""
+        try:
+            data = self._serial_manager.read_ready()
+        except (serial.SerialException, OSError) as e:
+            self.log.error(f"Serial read error: {str(e)}")
+            self._fatal_error(e)
+            return
+        if data:
+            # Protocols may keep what they are given, so pass a copy rather
+            # than the view into the manager's reusable read buffer
+            self._protocol.data_received(bytes(data))
+
+    def write(self, data: bytes) -> None:
+        """
+        Write data to the port without blocking.
+
+        Args:
+            data: Bytes to write
+        """
+        if not data:
+            return
+        if self._closing:
+            raise RuntimeError("Cannot write to a closing serial transport")
+
+        # Copy anything mutable, since it is written later if the driver is full
+        view = memoryview(data if isinstance(data, bytes) else bytes(data))
+        if not self._write_buffer:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                written = 0
+            except OSError as e:
+                self.log.error(f"Serial write error: {str(e)}")
+                self._fatal_error(e)
+                return
+            view = view[written:]
+            if not view:
+                return
+            self._loop.add_writer(self._fd, self._write_ready)
+
+        self._write_buffer.append(view)
+        self._write_buffer_size += len(view)
+        self._maybe_pause_protocol()
+
+    def _write_ready(self) -> None:
+        """Flush queued data while the driver accepts it."""
+        while self._write_buffer:
+            view = self._write_buffer[0]
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                self.log.error(f"Serial write error: {str(e)}")
+                self._fatal_error(e)
+                return
+            self._write_buffer_size -= written
+            if written < len(view):
+                self._write_buffer[0] = view[written:]
+                break
+            self._write_buffer.popleft()
+
+        self._maybe_resume_protocol()
+        if not self._write_buffer:
+            self._loop.remove_writer(self._fd)
+            if self._closing:
+                self._call_connection_lost(None)
+
+    def _maybe_pause_protocol(self) -> None:
+        if not self._writing_paused and self._write_buffer_size > self._high_water:
+            self._writing_paused = True
+            self._protocol.pause_writing()
+
+    def _maybe_resume_protocol(self) -> None:
+        if self._writing_paused and self._write_buffer_size <= self._low_water:
+            self._writing_paused = False
+            self._protocol.resume_writing()
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return self._write_buffer_size
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return self._low_water, self._high_water
+
+    def set_write_buffer_limits(self, high: Optional[int] = None, low: Optional[int] = None) -> None:
+        if high is None:
+            high = gl.ASYNC_WRITE_HIGH_WATER if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not high >= low >= 0:
+            raise ValueError(f"high ({high!r}) must be >= low ({low!r}) must be >= 0")
+        self._high_water, self._low_water = high, low
+        self._maybe_pause_protocol()
+
+    def close(self) -> None:
+        """Stop reading, flush queued writes, then close the port."""
+        if self._closing:
+            return
+        self._closing = True
+        self._loop.remove_reader(self._fd)
+        if not self._write_buffer:
+            self._loop.call_soon(self._call_connection_lost, None)
+
+    def abort(self) -> None:
+        """Close the port at once, dropping queued writes."""
+        self._abort(None)
+
+    def _fatal_error(self, exc: Exception) -> None:
+        self._abort(exc)
+
+    def _abort(self, exc: Optional[Exception]) -> None:
+        self._closing = True
+        self._loop.remove_reader(self._fd)
+        self._loop.remove_writer(self._fd)
+        self._write_buffer.clear()
+        self._write_buffer_size = 0
+        self._loop.call_soon(self._call_connection_lost, exc)
+
+    def _call_connection_lost(self, exc: Optional[Exception]) -> None:
+        """Close the port and tell the protocol, once."""
+        if self._connection_lost:
+            return
+        self._connection_lost = True
+        self._loop.remove_writer(self._fd)
+        self._serial_manager.close_port()
+        self._protocol.connection_lost(exc)
+
+
+async def create_serial_connection(
+    protocol_factory: Callable[[], asyncio.Protocol],
+    port: str,
+    baudrate: int = 115200,
+    bytesize: int = 8,
+    stopbits: int = 1,
+    parity: str = "N",
+    serial_manager: Optional[SerialManager] = None,
+) -> tuple[SerialTransport, asyncio.Protocol]:
+    """
+    Open a serial port and connect it to a protocol, like loop.create_connection().
+
+    Args:
+        protocol_factory: Callable returning the protocol
+        port: Port name (e.g., '/dev/ttyUSB0')
+        baudrate: Baud rate (default: 115200)
+        bytesize: Data bits (default: 8)
+        stopbits: Stop bits (default: 1)
+        parity: Parity ('N', 'E', 'O') (default: 'N')
+        serial_manager: Serial manager to open the port with (default: a new one)
+
+    Returns:
+        Tuple of (transport, protocol)
+
+    Raises:
+        serial.SerialException: If the port cannot be opened or watched
+    """
+    serial_manager = serial_manager or SerialManager()
+    success, msg = serial_manager.open_port(port, baudrate, bytesize, stopbits, parity)
+    if not success:
+        raise serial.SerialException(msg)
+
+    loop = asyncio.get_running_loop()
+    protocol = protocol_factory()
+    try:
+        transport = SerialTransport(loop, protocol, serial_manager)
+    except serial.SerialException:
+        serial_manager.close_port()
+        raise
+    return transport, protocol
+
+
+async def open_serial_connection(
+    port: str,
+    *,
+    limit: int = 2**16,
+    **kwargs: Any,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Open a serial port as a (reader, writer) stream pair, like asyncio.open_connection().
+
+    Args:
+        port: Port name (e.g., '/dev/ttyUSB0')
+        limit: StreamReader buffer limit (default: 64 KiB)
+        **kwargs: Port settings passed to create_serial_connection()
+
+    Returns:
+        Tuple of (StreamReader, StreamWriter)
+
+    Raises:
+        serial.SerialException: If the port cannot be opened or watched
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit, loop=loop)
+    protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
+    transport, _ = await create_serial_connection(lambda: protocol, port, **kwargs)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return reader, writer
@@ -0,0 +1,6 @@
+"""
+Benchmark suite.
+
+Headless benchmarks for PyCOM's data paths. Run each module from the
+project root, e.g. ``python -m benchmarks.bench_data_handler``.
+"""
@@ -0,0 +1,87 @@
+"""
+Asyncio serial transport benchmarks.
+
+Runs small request/response exchanges through open_serial_connection()
+against an echo peer on the master side of a pty, all on one event loop,
+and reports round trips per second and round-trip latency. Linux/macOS
+only:
+
+    python -m benchmarks.bench_async [--exchanges 10000] [-o results.json]
+"""
+
+import asyncio
+import os
+import time
+
+from async_serial import open_serial_connection
+from benchmarks.common import build_parser, write_results
+from benchmarks.loopback import PtyLoopback, percentile
+
+
+async def run_exchanges(exchanges: int, request_size: int) -> dict:
+    """
+    Send requests one at a time and wait for each echoed reply.
+
+    Args:
+        exchanges: Number of request/response exchanges
+        request_size: Request size in bytes, including the newline
+
+    Returns:
+        Result dictionary
+    """
+    loop = asyncio.get_running_loop()
+    pty = PtyLoopback()
+    os.set_blocking(pty.master_fd, False)
+
+    def echo() -> None:
+        try:
+            os.write(pty.master_fd, os.read(pty.master_fd, 65536))
+        except BlockingIOError:
+            pass
+
+    loop.add_reader(pty.master_fd, echo)
+    reader, writer = await open_serial_connection(pty.device)
+    request = b"R" * (request_size - 1) + b"\n"
+    latencies = []
+    try:
+        start = time.perf_counter()
+        for _ in range(exchanges):
+            sent = time.perf_counter()
+            writer.write(request)
+            if await reader.readline() != request:
+                raise RuntimeError("Echo mismatch")
+            latencies.append(time.perf_counter() - sent)
+        elapsed = time.perf_counter() - start
+    finally:
+        loop.remove_reader(pty.master_fd)
+        writer.close()
+        await writer.wait_closed()
+        pty.close()
+
+    return {
+        "name": "async_request_response",
+        "exchanges": exchanges,
+        "request_size": request_size,
+        "seconds": round(elapsed, 6),
+        "exchanges_per_s": round(exchanges / elapsed, 1),
+        "rtt_avg_us": round(sum(latencies) / len(latencies) * 1e6, 1),
+        "rtt_p99_us": round(percentile(latencies, 99) * 1e6, 1),
+        "rtt_max_us": round(max(latencies) * 1e6, 1),
+    }
+
+
+def main() -> None:
+    parser = build_parser("Request/response rate through the asyncio serial transport")
+    parser.add_argument("--exchanges", type=int, default=10000)
+    parser.add_argument("--request-size", type=int, nargs="+", default=[8, 64, 256])
+    args = parser.parse_args()
+
+    exchanges = min(args.exchanges, 1000) if args.quick else args.exchanges
+    results = [
+        asyncio.run(run_exchanges(exchanges, size)) for size in args.request_size
+    ]
+    write_results("async", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Data handler benchmarks.
+
+Measures MB/s and per-call latency of the data_handler hot paths at several
+chunk sizes, without serial hardware:
+
+    python -m benchmarks.bench_data_handler [--quick] [-o results.json]
+"""
+
+import itertools
+import time
+
+from benchmarks.common import build_parser, chunk_sizes, measure, write_results
+from data_handler import DataConverter, DataReceiver, DataSender
+from framing import DelimiterAssembler, LengthPrefixAssembler
+from hexdump import HexDumper
+from serial_manager import SerialManager
+
+
+class LoopbackSerialManager(SerialManager):
+    """Serial manager stand-in that accepts every write without a port."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bytes_written = 0
+
+    def is_open(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.bytes_written += len(data)
+        return len(data)
+
+
+def sample_text(encoding: str, size: int) -> bytes:
+    """Build a chunk of encoded text, mixing multi-byte characters where possible."""
+    pattern = "PyCOM 串口 data 0123456789\r\n" if encoding != "ascii" else "PyCOM data 0123456789\r\n"
+    encoded = pattern.encode(encoding)
+    return (encoded * (size // len(encoded) + 1))[:size]
+
+
+def bench_converter(sizes: list[int], min_time: float) -> list[dict]:
+    """Benchmark DataConverter conversions."""
+    results = []
+    for encoding in ("utf-8", "gbk", "ascii"):
+        converter = DataConverter(encoding)
+        for size in sizes:
+            chunk = sample_text(encoding, size)
+            results.append(
+                measure(f"bytes_to_text[{encoding}]", lambda: converter.bytes_to_text(chunk), size, min_time)
+            )
+
+    converter = DataConverter()
+    for size in sizes:
+        chunk = bytes(range(256)) * (size // 256 + 1)
+        chunk = chunk[:size]
+        hex_str = chunk.hex(" ")
+        results.append(measure("bytes_to_hex", lambda: converter.bytes_to_hex(chunk), size, min_time))
+        results.append(measure("hex_to_bytes", lambda: converter.hex_to_bytes(hex_str), size, min_time))
+        results.append(measure("is_valid_hex", lambda: converter.is_valid_hex(hex_str), size, min_time))
+    return results
+
+
+def bench_sender(sizes: list[int], min_time: float) -> list[dict]:
+    """Benchmark DataSender against a loopback serial manager."""
+    results = []
+    sender = DataSender(LoopbackSerialManager(), DataConverter("utf-8"))
+    for size in sizes:
+        text = sample_text("utf-8", size).decode("utf-8", "ignore")
+        chunk = text.encode("utf-8")
+        hex_str = chunk.hex(" ")
+        results.append(measure("send_text", lambda: sender.send_text(text), size, min_time))
+        results.append(measure("send_hex", lambda: sender.send_hex(hex_str), size, min_time))
+        results.append(measure("send_bytes", lambda: sender.send_bytes(chunk), size, min_time))
+    return results
+
+
+def bench_receiver(sizes: list[int], min_time: float) -> list[dict]:
+    """Benchmark queuing chunks into DataReceiver and draining them."""
+    results = []
+    receiver = DataReceiver(SerialManager())
+    for size in sizes:
+        chunk = bytes(size)
+
+        def enqueue_and_drain() -> None:
+            receiver._enqueue(chunk, time.perf_counter())
+            receiver.get_data_from_queue()
+
+        results.append(measure("receiver_drain", enqueue_and_drain, size, min_time))
+    return results
+
+
+def bench_hexdump(sizes: list[int], min_time: float) -> list[dict]:
+    """Benchmark rendering received chunks as hexdump rows."""
+    results = []
+    for width in (16, 32):
+        dumper = HexDumper(width)
+        for size in sizes:
+            chunk = (bytes(range(256)) * (size // 256 + 1))[:size]
+            results.append(measure(f"hexdump[{width}]", lambda: dumper.render(chunk), size, min_time))
+    return results
+
+
+def bench_framing(sizes: list[int], min_time: float) -> list[dict]:
+    """Benchmark cutting 32-byte frames out of the stream at each read size."""
+    results = []
+    line = b"PyCOM frame data 0123456789abc\r\n"
+    prefixed = b"\xaa" + bytes([len(line) - 2]) + line[:-2]
+    for name, assembler, frame in (
+        ("frame_delimiter", DelimiterAssembler(b"\r\n"), line),
+        ("frame_length", LengthPrefixAssembler(1, 1), prefixed),
+    ):
+        for size in sizes:
+            # Consecutive reads of a stream of whole frames, frames split across reads
+            stream = frame * size
+            chunks = itertools.cycle([stream[i:i + size] for i in range(0, len(stream), size)])
+            stamps = [(0, 0)]
+            results.append(measure(name, lambda: assembler.feed(next(chunks), stamps), size, min_time))
+    return results
+
+
+def main() -> None:
+    args = build_parser("Benchmark the data_handler hot paths").parse_args()
+    sizes = chunk_sizes(args)
+    results = []
+    results += bench_converter(sizes, args.min_time)
+    results += bench_sender(sizes, args.min_time)
+    results += bench_receiver(sizes, args.min_time)
+    results += bench_hexdump(sizes, args.min_time)
+    results += bench_framing(sizes, args.min_time)
+    write_results("data_handler", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Read path benchmarks.
+
+Feeds a pty with fixed-size chunks and reads them back through
+SerialManager into a DataReceiver, reporting per read mode the bytes
+allocated per MB received and the time per read. Linux/macOS only:
+
+    readall        pyserial readall(), the old polling path
+    read           pyserial read(in_waiting), the old event-driven path
+    read_waiting   readinto the reusable buffer, the polling path
+    read_available readinto the reusable buffer, the event-driven path
+
+    python -m benchmarks.bench_read_path [--megabytes 1] [--chunk 4096] [-o results.json]
+
+Allocations are measured with tracemalloc as the rise of the traced peak
+during each read and enqueue, summed over all reads.
+"""
+
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+from benchmarks.common import build_parser, write_results
+from benchmarks.loopback import PtyLoopback
+from data_handler import DataReceiver
+from serial_manager import SerialManager
+
+MODES = ("readall", "read", "read_waiting", "read_available")
+
+
+def make_reader(mode: str, serial_manager: SerialManager) -> Callable[[], bytes]:
+    """Return a zero-argument read function for a mode."""
+    instance = serial_manager.serial_instance
+    if mode == "readall":
+        return instance.readall
+    if mode == "read":
+        return lambda: instance.read(instance.in_waiting or 1)
+    if mode == "read_waiting":
+        return serial_manager.read_waiting
+    return lambda: serial_manager.read_available(1.0)
+
+
+def run_case(mode: str, total: int, chunk_size: int) -> dict:
+    """
+    Read total bytes in chunk_size writes through one read mode.
+
+    Args:
+        mode: One of MODES
+        total: Bytes to receive
+        chunk_size: Bytes written to the pty before each read
+
+    Returns:
+        Result dictionary
+    """
+    loopback = PtyLoopback()
+    serial_manager = SerialManager()
+    success, msg = serial_manager.open_port(loopback.device, 115200)
+    if not success:
+        loopback.close()
+        raise RuntimeError(msg)
+
+    receiver = DataReceiver(serial_manager, buffer_size_mb=1)
+    read = make_reader(mode, serial_manager)
+    payload = bytes(range(256)) * (chunk_size // 256 + 1)
+    payload = payload[:chunk_size]
+
+    received = 0
+    reads = 0
+    allocated = 0
+    elapsed = 0.0
+    tracemalloc.start()
+    try:
+        while received < total:
+            os.write(loopback.master_fd, payload)
+            pending = chunk_size
+            while pending:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter()
+                data = read()
+                receiver._enqueue(data, start)
+                elapsed += time.perf_counter() - start
+                allocated += tracemalloc.get_traced_memory()[1] - base
+                del data
+                reads += 1
+                pending -= len(receiver.get_data_from_queue())
+            received += chunk_size
+    finally:
+        tracemalloc.stop()
+        serial_manager.close_port()
+        loopback.close()
+
+    megabytes = received / (1024 * 1024)
+    return {
+        "name": f"read_path[{mode}]",
+        "chunk_size": chunk_size,
+        "bytes": received,
+        "reads": reads,
+        "allocated_bytes_per_mb": round(allocated / megabytes),
+        "us_per_read": round(elapsed / reads * 1e6, 3),
+    }
+
+
+def main() -> None:
+    parser = build_parser("Allocations per MB received on the old and new read paths")
+    parser.add_argument("--megabytes", type=float, default=1.0, help="data per mode (default: 1)")
+    parser.add_argument("--chunk", type=int, default=4096, help="bytes per write (default: 4096)")
+    args = parser.parse_args()
+
+    megabytes = min(args.megabytes, 0.25) if args.quick else args.megabytes
+    total = int(megabytes * 1024 * 1024)
+    results = [run_case(mode, total, args.chunk) for mode in MODES]
+    write_results("read_path", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
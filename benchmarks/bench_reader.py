@@ -0,0 +1,199 @@
+"""
+Multi-port reader benchmarks.
+
+Compares the shared ReaderEngine against one receiver thread per port
+(event-driven and polling) at 1, 8, 32 and 64 pty stand-in ports. A
+forked writer process sends timestamped frames to every port at a fixed
+rate, so the reported CPU time is the receive side's alone. Linux/macOS
+only:
+
+    python -m benchmarks.bench_reader [--ports 1 8 32 64] [--rate 100] [-o results.json]
+"""
+
+import os
+import resource
+import struct
+import threading
+import time
+import warnings
+
+from benchmarks.common import build_parser, write_results
+from benchmarks.loopback import PtyLoopback, percentile
+from data_handler import DataReceiver
+from reader_engine import ReaderEngine
+from serial_manager import SerialManager
+
+MODES = ("engine", "threads", "polling")
+PORT_COUNTS = [1, 8, 32, 64]
+QUICK_PORT_COUNTS = [1, 8]
+
+# Frame: perf_counter() send time plus padding to 16 bytes. The clock is
+# system-wide on Linux and macOS, so the writer process can stamp it.
+FRAME = struct.Struct("<d8x")
+
+
+class TimedReceiver(DataReceiver):
+    """Data receiver that records each frame's send-to-enqueue latency."""
+
+    def __init__(self, serial_manager: SerialManager, event_driven: bool = True) -> None:
+        super().__init__(serial_manager, event_driven=event_driven)
+        self.pending = bytearray()
+        self.latencies: list[float] = []
+
+    def _enqueue(self, data: bytes, ready_at: float) -> None:
+        now = time.perf_counter()
+        super()._enqueue(data, ready_at)
+        if not data:
+            return
+        self.pending += data
+        whole = len(self.pending) // FRAME.size * FRAME.size
+        for (sent,) in FRAME.iter_unpack(self.pending[:whole]):
+            self.latencies.append(now - sent)
+        del self.pending[:whole]
+
+
+def start_writer(master_fds: list[int], rate: int, duration: float) -> tuple[int, int]:
+    """
+    Fork a process that writes frames to every master at rate frames/s each.
+
+    The child waits for a byte on the returned go descriptor, so the
+    readers can be set up first.
+
+    Args:
+        master_fds: Pty master descriptors
+        rate: Frames per second per port
+        duration: Seconds to write for
+
+    Returns:
+        (child pid, go descriptor to write one byte to)
+    """
+    go_r, go_w = os.pipe()
+    with warnings.catch_warnings():
+        # The child only calls os.write() and time.sleep(), so threads
+        # left running in the parent (e.g. the log handler) are harmless
+        warnings.simplefilter("ignore", DeprecationWarning)
+        pid = os.fork()
+    if pid:
+        os.close(go_r)
+        return pid, go_w
+
+    # Child: no Qt or threads here, only timed writes
+    os.close(go_w)
+    os.read(go_r, 1)
+    start = time.perf_counter()
+    deadline = start
+    while deadline - start < duration:
+        deadline += 1 / rate
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        for fd in master_fds:
+            os.write(fd, FRAME.pack(time.perf_counter()))
+    os._exit(0)
+
+
+def cpu_seconds() -> float:
+    """Get the user plus system CPU time of this process."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_case(mode: str, ports: int, rate: int, duration: float) -> dict:
+    """
+    Receive from ports pty ports in one mode and collect statistics.
+
+    Args:
+        mode: One of MODES
+        ports: Number of ports
+        rate: Frames per second per port
+        duration: Seconds of traffic
+
+    Returns:
+        Result dictionary
+    """
+    loops = [PtyLoopback() for _ in range(ports)]
+    pid, go = start_writer([loop.master_fd for loop in loops], rate, duration)
+    managers = []
+    receivers = []
+    engine = ReaderEngine() if mode == "engine" else None
+    try:
+        for loop in loops:
+            manager = SerialManager()
+            success, msg = manager.open_port(loop.device)
+            if not success:
+                raise RuntimeError(msg)
+            managers.append(manager)
+            receiver = TimedReceiver(manager, event_driven=(mode != "polling"))
+            receivers.append(receiver)
+            if engine is None:
+                receiver.start()
+        if engine is not None:
+            engine.start()
+            for receiver in receivers:
+                engine.add(receiver)
+        time.sleep(0.2)
+
+        threads = threading.active_count()
+        start_cpu, start = cpu_seconds(), time.perf_counter()
+        os.write(go, b"\0")
+        # Drain the receive buffers like the UI timer does
+        while not os.waitpid(pid, os.WNOHANG)[0]:
+            time.sleep(0.1)
+            for receiver in receivers:
+                receiver.get_data_from_queue()
+        pid = 0
+        time.sleep(0.2)
+        cpu, elapsed = cpu_seconds() - start_cpu, time.perf_counter() - start
+
+        latencies = [latency for receiver in receivers for latency in receiver.latencies]
+        sent = int(duration * rate) * ports
+        wakeups = engine.wakeups if engine is not None else sum(r.wakeups for r in receivers)
+        return {
+            "name": f"reader[{mode}]",
+            "ports": ports,
+            "rate_per_port": rate,
+            "threads": threads,
+            "frames_sent": sent,
+            "frames_received": len(latencies),
+            "cpu_percent": round(cpu / elapsed * 100, 2),
+            "wakeups_per_s": round(wakeups / elapsed, 1),
+            "latency_avg_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "latency_p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "latency_max_ms": round(max(latencies, default=0.0) * 1000, 3),
+        }
+    finally:
+        if pid:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+        os.close(go)
+        if engine is not None:
+            engine.stop()
+        for receiver in receivers:
+            if receiver.isRunning():
+                receiver.requestInterruption()
+                receiver.wait()
+        for manager in managers:
+            manager.close_port()
+        for loop in loops:
+            loop.close()
+
+
+def main() -> None:
+    parser = build_parser("CPU and latency of the shared reader engine vs per-port threads")
+    parser.add_argument("--ports", type=int, nargs="+", help="port counts (default: 1 8 32 64)")
+    parser.add_argument("--mode", choices=MODES + ("all",), default="all")
+    parser.add_argument("--rate", type=int, default=100, help="frames/s per port (default: 100)")
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    port_counts = args.ports or (QUICK_PORT_COUNTS if args.quick else PORT_COUNTS)
+    duration = min(args.duration, 1.0) if args.quick else args.duration
+    modes = MODES if args.mode == "all" else (args.mode,)
+    results = [
+        run_case(mode, ports, args.rate, duration) for ports in port_counts for mode in modes
+    ]
+    write_results("reader", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Startup benchmarks.
+
+Starts PyCOM in fresh interpreters and reports, as the median over several
+runs, the milliseconds from process launch until:
+
+    import_ms        main (or pycom) and its dependencies are imported
+    window_ms        MainWindow() has returned
+    first_paint_ms   the main window has painted for the first time
+    ports_listed_ms  the port combo box has been filled
+
+plus the peak RSS. The GUI runs on the offscreen platform unless
+QT_QPA_PLATFORM is set:
+
+    python -m benchmarks.bench_startup [--repeat 5] [-o results.json]
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import build_parser, write_results
+
+STARTUP_TIMEOUT_S = 10.0
+
+
+def child_gui(launched: float) -> dict:
+    """Start the GUI and time its milestones (runs in the child process)."""
+    marks: dict[str, float] = {}
+
+    def mark(name: str) -> None:
+        marks.setdefault(name, (time.time() - launched) * 1000)
+
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    import main
+
+    mark("import_ms")
+
+    class TimedWindow(main.MainWindow):
+        def paintEvent(self, event) -> None:
+            super().paintEvent(event)
+            mark("first_paint_ms")
+            self._maybe_quit()
+
+        def _post_port_scan(self, count: int) -> None:
+            super()._post_port_scan(count)
+            mark("ports_listed_ms")
+            self._maybe_quit()
+
+        def _maybe_quit(self) -> None:
+            if "first_paint_ms" in marks and "ports_listed_ms" in marks:
+                QTimer.singleShot(0, app.quit)
+
+    app = QApplication([])
+    window = TimedWindow()
+    mark("window_ms")
+    window.show()
+    QTimer.singleShot(int(STARTUP_TIMEOUT_S * 1000), app.quit)
+    app.exec()
+    window.close()
+    return marks
+
+
+def child_headless(launched: float) -> dict:
+    """Import the headless entry point and time it (runs in the child process)."""
+    import pycom
+
+    pycom.build_parser()
+    return {"import_ms": (time.time() - launched) * 1000}
+
+
+def run_child(mode: str) -> dict:
+    """
+    Start one fresh interpreter and collect its milestones.
+
+    Args:
+        mode: "gui" or "headless"
+
+    Returns:
+        Milestones in ms and the child's peak RSS in MB
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    launched = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode, "--launched", repr(launched)],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=STARTUP_TIMEOUT_S * 2,
+    )
+    if proc.returncode:
+        raise RuntimeError(f"Startup child failed: {proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = build_parser("Startup time and memory of the GUI and the headless mode")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per mode (default: 5)")
+    parser.add_argument("--child", choices=("gui", "headless"), help=argparse.SUPPRESS)
+    parser.add_argument("--launched", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        marks = child_gui(args.launched) if args.child == "gui" else child_headless(args.launched)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in KB on Linux and bytes on macOS
+        marks["rss_mb"] = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+        sys.stdout.write(json.dumps(marks) + "\n")
+        return
+
+    repeat = min(args.repeat, 2) if args.quick else args.repeat
+    results = []
+    for mode in ("gui", "headless"):
+        runs = [run_child(mode) for _ in range(repeat)]
+        result = {"name": f"startup[{mode}]", "runs": repeat}
+        for key in runs[0]:
+            result[key] = round(statistics.median(run[key] for run in runs if key in run), 1)
+        results.append(result)
+    write_results("startup", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark helpers.
+
+This module provides timing, result formatting and command line helpers
+shared by the benchmark modules. Results are plain JSON so runs from
+different releases can be diffed.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Optional
+
+CHUNK_SIZES = [1, 16, 256, 4096, 65536]
+QUICK_CHUNK_SIZES = [1, 256, 65536]
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    chunk_size: int,
+    min_time: float = 0.2,
+    max_calls: int = 1_000_000,
+) -> dict:
+    """
+    Call func repeatedly and report throughput and per-call latency.
+
+    Args:
+        name: Case name
+        func: Zero-argument callable processing one chunk per call
+        chunk_size: Bytes processed per call
+        min_time: Minimum measuring time in seconds
+        max_calls: Upper bound on calls
+
+    Returns:
+        Result dictionary
+    """
+    func()  # warm up
+    calls = 0
+    batch = 1
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time and calls < max_calls:
+        for _ in range(batch):
+            func()
+        calls += batch
+        batch = min(batch * 2, max_calls - calls) or 1
+        elapsed = time.perf_counter() - start
+
+    total_bytes = calls * chunk_size
+    return {
+        "name": name,
+        "chunk_size": chunk_size,
+        "calls": calls,
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 6),
+        "mb_per_s": round(total_bytes / elapsed / 1e6, 3) if elapsed else 0.0,
+        "us_per_call": round(elapsed / calls * 1e6, 3) if calls else 0.0,
+    }
+
+
+def build_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Build the common benchmark argument parser.
+
+    Args:
+        description: Parser description
+
+    Returns:
+        Argument parser with --output, --quick and --min-time
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("--quick", action="store_true", help="fewer chunk sizes, shorter runs")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds to measure each case (default: 0.2)"
+    )
+    return parser
+
+
+def chunk_sizes(args: argparse.Namespace) -> list[int]:
+    """Get the chunk sizes selected by the command line arguments."""
+    return QUICK_CHUNK_SIZES if args.quick else CHUNK_SIZES
+
+
+def write_results(suite: str, results: list[dict], output: Optional[str] = None) -> None:
+    """
+    Emit results as JSON to a file or stdout.
+
+    Args:
+        suite: Benchmark suite name
+        results: Result dictionaries
+        output: Output file path (stdout if None)
+    """
+    document = {
+        "suite": suite,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
@@ -0,0 +1,296 @@
+"""
+Pseudo-terminal loopback harness.
+
+Opens a pty pair, points PyCOM's receive pipeline at the slave side and
+feeds the master side from a traffic generator, then reports end-to-end
+throughput, drop rate and UI-update latency for the whole
+DataReceiver -> MainWindow._update_receive_ui pipeline. Linux/macOS only:
+
+    python -m benchmarks.loopback --pattern bursty --rate 2000000 --duration 5
+"""
+
+import os
+import random
+import threading
+import time
+import tty
+from typing import Any
+
+from benchmarks.common import build_parser, write_results
+from hexdump import HEXDUMP_LINE
+
+PATTERNS = ("constant", "bursty", "random")
+
+
+class PtyLoopback:
+    """
+    A raw-mode pty pair standing in for a serial device.
+
+    SerialManager opens the slave path like any other device, while the
+    master file descriptor plays the part of the remote end.
+    """
+
+    def __init__(self) -> None:
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.master_fd)
+        tty.setraw(self.slave_fd)
+        self.device = os.ttyname(self.slave_fd)
+
+    def close(self) -> None:
+        """Close both ends of the pty."""
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class TrafficGenerator(threading.Thread):
+    """
+    Writes a traffic pattern into a file descriptor at a target rate.
+
+    Patterns:
+        constant: frame_size bytes at evenly spaced intervals
+        bursty: burst_frames frames back to back, then an idle gap
+        random: frames of random size between 1 and 2 * frame_size
+
+    Every write is recorded as (perf_counter time, cumulative bytes) so
+    the consumer side can compute when each byte was produced.
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        pattern: str = "constant",
+        rate: int = 115200,
+        frame_size: int = 64,
+        duration: float = 3.0,
+        burst_frames: int = 32,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            fd: File descriptor to write to (pty master)
+            pattern: One of PATTERNS
+            rate: Average rate in bytes per second (0: as fast as possible)
+            frame_size: Frame size in bytes (mean size for "random")
+            duration: Generation time in seconds
+            burst_frames: Frames per burst for "bursty"
+            seed: Random seed for "random"
+        """
+        super().__init__(name="TrafficGenerator", daemon=True)
+        if pattern not in PATTERNS:
+            raise ValueError(f"Unknown pattern: {pattern}")
+        self.fd = fd
+        self.pattern = pattern
+        self.rate = rate
+        self.frame_size = frame_size
+        self.duration = duration
+        self.burst_frames = burst_frames
+        self.random = random.Random(seed)
+        self.marks: list[tuple[float, int]] = []
+        self.total_written = 0
+        self._payload = (b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ\n" * (4 * frame_size // 37 + 2))
+
+    def _next_frame(self, index: int) -> bytes:
+        """Get the frame to send for this index."""
+        if self.pattern == "random":
+            size = self.random.randint(1, 2 * self.frame_size)
+        else:
+            size = self.frame_size
+        return self._payload[:size]
+
+    def _gap_after(self, index: int, size: int) -> float:
+        """Get the delay in seconds to keep after sending a frame."""
+        if not self.rate:
+            return 0.0
+        if self.pattern == "bursty":
+            if (index + 1) % self.burst_frames:
+                return 0.0
+            return self.burst_frames * self.frame_size / self.rate
+        return size / self.rate
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        deadline = start
+        index = 0
+        while time.perf_counter() - start < self.duration:
+            frame = self._next_frame(index)
+            view = memoryview(frame)
+            while view:
+                written = os.write(self.fd, view)
+                view = view[written:]
+            self.total_written += len(frame)
+            self.marks.append((time.perf_counter(), self.total_written))
+
+            deadline += self._gap_after(index, len(frame))
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            index += 1
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Get the pct percentile of values (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def ui_latencies(marks: list[tuple[float, int]], updates: list[tuple[float, int]]) -> list[float]:
+    """
+    Match generator writes with the first UI update that displayed them.
+
+    Args:
+        marks: (time, cumulative bytes written) from the generator
+        updates: (time, cumulative bytes received) after each UI update
+
+    Returns:
+        Latency in seconds for every write that reached the UI
+    """
+    latencies = []
+    u = 0
+    for written_at, total in marks:
+        while u < len(updates) and updates[u][1] < total:
+            u += 1
+        if u == len(updates):
+            break
+        latencies.append(updates[u][0] - written_at)
+    return latencies
+
+
+def create_window() -> Any:
+    """
+    Create an offscreen QApplication and MainWindow for the harness.
+
+    Returns:
+        MainWindow instance
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from main import MainWindow
+
+    if QApplication.instance() is None:
+        QApplication([])
+    return MainWindow()
+
+
+def run_loopback(
+    window: Any,
+    pattern: str,
+    rate: int,
+    frame_size: int,
+    duration: float,
+    hex_mode: bool = False,
+    drain_time: float = 1.0,
+) -> dict:
+    """
+    Run one loopback session through a MainWindow and collect statistics.
+
+    Args:
+        window: MainWindow from create_window()
+        pattern: Traffic pattern
+        rate: Average rate in bytes per second (0: unthrottled)
+        frame_size: Frame size in bytes
+        duration: Generation time in seconds
+        hex_mode: Display received data in hex mode
+        drain_time: Extra seconds to let the pipeline catch up
+
+    Returns:
+        Result dictionary
+    """
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    loop = PtyLoopback()
+    updates: list[tuple[float, int]] = []
+    original_update = window._update_receive_ui
+
+    def traced_update() -> None:
+        original_update()
+        updates.append((time.perf_counter(), window.session.data_receiver.get_total_received()))
+
+    try:
+        window.receive_update_timer.timeout.disconnect()
+        window.receive_update_timer.timeout.connect(traced_update)
+        window.ui.comboBox_SPort.addItem(loop.device)
+        window.ui.comboBox_SPort.setCurrentText(loop.device)
+        window.receive_clear()
+        # The display mode is per session, so set it once the loopback port is shown;
+        # setChecked() does not emit clicked, so apply it as the checkbox would
+        window.ui.checkBox_RHexmode.setChecked(hex_mode)
+        window.set_receive_hex_mode()
+        if not window.open_port():
+            raise RuntimeError(f"Cannot open {loop.device}")
+
+        generator = TrafficGenerator(loop.master_fd, pattern, rate, frame_size, duration)
+        generator.start()
+        QTimer.singleShot(int((duration + drain_time) * 1000), app.quit)
+        app.exec()
+        generator.join()
+
+        first_line = window.session.receive_view.text().partition("\n")[0]
+        if first_line and bool(HEXDUMP_LINE.match(first_line)) != hex_mode:
+            raise RuntimeError(f"Receive view is not in {'hex' if hex_mode else 'text'} mode: {first_line[:40]!r}")
+
+        latencies = ui_latencies(generator.marks, updates)
+        received = window.session.data_receiver.get_total_received()
+        dropped = window.session.data_receiver.get_total_dropped()
+        elapsed = (generator.marks[-1][0] - generator.marks[0][0]) if generator.marks else 0.0
+        return {
+            "name": f"loopback[{pattern}]",
+            "rate": rate,
+            "frame_size": frame_size,
+            "hex_mode": hex_mode,
+            "bytes_written": generator.total_written,
+            "bytes_received": received,
+            "bytes_dropped": dropped,
+            "drop_rate": round(dropped / generator.total_written, 6) if generator.total_written else 0.0,
+            "mb_per_s": round(received / elapsed / 1e6, 3) if elapsed else 0.0,
+            "ui_updates": len(updates),
+            "ui_latency_avg_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "ui_latency_p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "ui_latency_max_ms": round(max(latencies, default=0.0) * 1000, 3),
+            "receiver": window.session.data_receiver.get_latency_stats(),
+        }
+    finally:
+        window.receive_update_timer.timeout.disconnect()
+        window.receive_update_timer.timeout.connect(original_update)
+        # Let the receiver thread close the port, as the UI does
+        window.close_port()
+        closing_deadline = time.perf_counter() + 2.0
+        while window.session.serial_manager.is_open() and time.perf_counter() < closing_deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        loop.close()
+
+
+def main() -> None:
+    parser = build_parser("End-to-end receive throughput over a pty loopback")
+    parser.add_argument("--pattern", choices=PATTERNS + ("all",), default="all")
+    parser.add_argument("--rate", type=int, default=1_000_000, help="bytes/s, 0 = unthrottled")
+    parser.add_argument("--frame-size", type=int, default=256)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--hex", action="store_true", help="display in hex mode")
+    args = parser.parse_args()
+
+    duration = min(args.duration, 1.0) if args.quick else args.duration
+    patterns = PATTERNS if args.pattern == "all" else (args.pattern,)
+    window = create_window()
+    try:
+        results = [
+            run_loopback(window, pattern, args.rate, args.frame_size, duration, args.hex)
+            for pattern in patterns
+        ]
+    finally:
+        window.close()
+    write_results("loopback", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
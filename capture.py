@@ -0,0 +1,212 @@
+"""
+Capture module.
+
+This module provides a CaptureWriter class for streaming raw received bytes
+to disk with buffered writes, periodic fsync and optional file rotation.
+"""
+
+import os
+import time
+from typing import BinaryIO, Optional, TextIO
+
+import globalvar as gl
+from logwrapper import logger
+from timestamps import ReceiveClock
+
+INDEX_HEADER = "offset,monotonic_ns,unix_ns\n"
+
+
+class CaptureWriter:
+    """
+    Writes raw received bytes to a capture file.
+
+    Writes go through a large userspace buffer and are flushed and fsync'ed
+    at a fixed interval, so the reader thread never waits on the disk for
+    every chunk. When a size or time limit is set, the capture rotates to a
+    new numbered file (capture.bin, capture_001.bin, capture_002.bin, ...).
+
+    With the index enabled, each capture file gets a CSV sidecar
+    (capture.bin.idx) with one line per received chunk: its byte offset in
+    the capture file, its time.monotonic_ns() arrival stamp and the
+    matching wall-clock time in ns since the epoch.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_bytes: int = 0,
+        max_seconds: float = 0,
+        buffer_size: int = gl.CAPTURE_BUFFER_SIZE,
+        fsync_interval: float = gl.CAPTURE_FSYNC_INTERVAL_S,
+        index: bool = gl.CAPTURE_TIMESTAMP_INDEX,
+        clock: Optional[ReceiveClock] = None,
+    ) -> None:
+        """
+        Initialize the capture writer.
+
+        Args:
+            file_path: Path of the first capture file
+            max_bytes: Rotate after this many bytes per file (0: no limit)
+            max_seconds: Rotate after this many seconds per file (0: no limit)
+            buffer_size: Write buffer size in bytes (default: gl.CAPTURE_BUFFER_SIZE)
+            fsync_interval: Seconds between flush+fsync (default: gl.CAPTURE_FSYNC_INTERVAL_S)
+            index: Write a timestamp index next to each file (default: gl.CAPTURE_TIMESTAMP_INDEX)
+            clock: Clock mapping chunk stamps to wall-clock time (default: a new one)
+        """
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.buffer_size = buffer_size
+        self.fsync_interval = fsync_interval
+        self.index = index
+        self.clock = clock or ReceiveClock()
+        self.log = logger.logger
+        self.fp: Optional[BinaryIO] = None
+        self.index_fp: Optional[TextIO] = None
+        self.segment = 0
+        self.current_path = ""
+        self.segment_bytes = 0
+        self.segment_started = 0.0
+        self.last_sync = 0.0
+        self.total_written = 0
+
+    def open(self) -> tuple[bool, str]:
+        """
+        Open the first capture file.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        self.segment = 0
+        self.total_written = 0
+        return self._open_segment()
+
+    def _segment_path(self) -> str:
+        """Get the file path for the current segment number."""
+        if self.segment == 0:
+            return self.file_path
+        root, ext = os.path.splitext(self.file_path)
+        return f"{root}_{self.segment:03d}{ext}"
+
+    def _open_segment(self) -> tuple[bool, str]:
+        """Open the file for the current segment number."""
+        path = self._segment_path()
+        try:
+            self.fp = open(path, "wb", buffering=self.buffer_size)
+            if self.index:
+                self.index_fp = open(f"{path}.idx", "w", encoding="ascii")
+                self.index_fp.write(INDEX_HEADER)
+        except (OSError, IOError) as e:
+            if self.fp is not None:
+                self.fp.close()
+            self.fp = None
+            self.log.error(f"Error opening capture file {path}: {e}")
+            return False, f"Cannot open capture file: {e}"
+
+        self.current_path = path
+        self.segment_bytes = 0
+        self.segment_started = self.last_sync = time.monotonic()
+        self.log.info(f"Capture started: {path}")
+        return True, f"Capturing to {path}"
+
+    def write(self, data: bytes, stamp_ns: Optional[int] = None) -> bool:
+        """
+        Append data to the capture, rotating and syncing as needed.
+
+        Args:
+            data: Bytes-like object to write
+            stamp_ns: time.monotonic_ns() the chunk arrived (default: now)
+
+        Returns:
+            True if written, False if the capture is not open or failed
+        """
+        if self.fp is None:
+            return False
+
+        now = time.monotonic()
+        if self._rotation_due(now):
+            self._close_segment()
+            self.segment += 1
+            if not self._open_segment()[0]:
+                return False
+
+        try:
+            if self.index_fp is not None:
+                if stamp_ns is None:
+                    stamp_ns = time.monotonic_ns()
+                self.index_fp.write(f"{self.segment_bytes},{stamp_ns},{self.clock.wall_ns(stamp_ns)}\n")
+            self.fp.write(data)
+        except (OSError, IOError) as e:
+            self.log.error(f"Error writing capture file: {e}")
+            self.close()
+            return False
+
+        self.segment_bytes += len(data)
+        self.total_written += len(data)
+        if now - self.last_sync >= self.fsync_interval:
+            self.sync(now)
+        return True
+
+    def _rotation_due(self, now: float) -> bool:
+        """Check whether the current segment hit its size or time limit."""
+        if self.max_bytes and self.segment_bytes >= self.max_bytes:
+            return True
+        if self.max_seconds and now - self.segment_started >= self.max_seconds:
+            return True
+        return False
+
+    def sync(self, now: Optional[float] = None) -> None:
+        """
+        Flush buffered data and fsync it to disk.
+
+        Args:
+            now: Current time.monotonic() value (optional)
+        """
+        if self.fp is None:
+            return
+
+        try:
+            for fp in (self.fp, self.index_fp):
+                if fp is not None:
+                    fp.flush()
+                    os.fsync(fp.fileno())
+        except (OSError, IOError) as e:
+            self.log.error(f"Error syncing capture file: {e}")
+        self.last_sync = time.monotonic() if now is None else now
+
+    def sync_if_due(self) -> None:
+        """Sync if the fsync interval has elapsed (call when the line is idle)."""
+        if self.fp is not None and time.monotonic() - self.last_sync >= self.fsync_interval:
+            self.sync()
+
+    def _close_segment(self) -> None:
+        """Sync and close the current segment file."""
+        if self.fp is None:
+            return
+
+        self.sync()
+        try:
+            self.fp.close()
+            if self.index_fp is not None:
+                self.index_fp.close()
+        except (OSError, IOError) as e:
+            self.log.error(f"Error closing capture file: {e}")
+        self.fp = None
+        self.index_fp = None
+
+    def close(self) -> None:
+        """Stop capturing and close the current file."""
+        if self.fp is None:
+            return
+
+        self._close_segment()
+        self.log.info(f"Capture stopped: {self.total_written} bytes written")
+
+    def is_open(self) -> bool:
+        """
+        Check if the capture is active.
+
+        Returns:
+            True if a capture file is open
+        """
+        return self.fp is not None
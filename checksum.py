@@ -0,0 +1,183 @@
+"""
+Checksum module.
+
+This module provides the checksums used to check received frames and to
+append to sent payloads. Each CRC runs one table lookup per byte instead
+of eight shift-and-xor steps. It has no Qt dependency.
+"""
+
+import binascii
+import functools
+import operator
+import zlib
+from typing import Callable
+
+def reflected_crc_table(poly: int) -> list[int]:
+    """
+    Build the 256-entry lookup table of a reflected (LSB-first) CRC.
+
+    Args:
+        poly: Reflected polynomial, e.g. 0xA001 for CRC-16/MODBUS
+
+    Returns:
+        Table of the CRC of each byte value
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+def normal_crc_table(poly: int, width: int) -> list[int]:
+    """
+    Build the 256-entry lookup table of a normal (MSB-first) CRC.
+
+    Args:
+        poly: Polynomial, e.g. 0x07 for CRC-8
+        width: CRC width in bits, 8 or more
+
+    Returns:
+        Table of the CRC of each byte value
+    """
+    top = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for byte in range(256):
+        crc = byte << (width - 8)
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & mask if crc & top else (crc << 1) & mask
+        table.append(crc)
+    return table
+
+
+CRC8_TABLE = normal_crc_table(0x07, 8)
+CRC16_MODBUS_TABLE = reflected_crc_table(0xA001)
+
+
+def crc16_modbus(data: bytes, crc: int = 0xFFFF) -> int:
+    """
+    Compute the CRC-16/MODBUS of data.
+
+    A frame followed by its CRC (low byte first, as sent on the wire)
+    gives 0, which checks a frame in one pass.
+
+    Args:
+        data: Bytes-like object
+        crc: Initial or running CRC (default: 0xFFFF)
+
+    Returns:
+        CRC value
+    """
+    table = CRC16_MODBUS_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def sum8(data: bytes) -> int:
+    """
+    Compute the 8-bit sum of data.
+
+    Args:
+        data: Bytes-like object
+
+    Returns:
+        Sum of the bytes modulo 256
+    """
+    return sum(data) & 0xFF
+
+
+def xor8(data: bytes) -> int:
+    """
+    Compute the XOR of all bytes of data.
+
+    Args:
+        data: Bytes-like object
+
+    Returns:
+        XOR of the bytes
+    """
+    return functools.reduce(operator.xor, data, 0)
+
+
+def crc8(data: bytes, crc: int = 0) -> int:
+    """
+    Compute the CRC-8 (polynomial 0x07, as in SMBus) of data.
+
+    Args:
+        data: Bytes-like object
+        crc: Initial or running CRC (default: 0)
+
+    Returns:
+        CRC value
+    """
+    table = CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def crc16_ccitt(data: bytes, crc: int = 0xFFFF) -> int:
+    """
+    Compute the CRC-16/CCITT-FALSE (polynomial 0x1021) of data.
+
+    binascii runs the same table lookup in C.
+
+    Args:
+        data: Bytes-like object
+        crc: Initial or running CRC (default: 0xFFFF)
+
+    Returns:
+        CRC value
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def crc32(data: bytes, crc: int = 0) -> int:
+    """
+    Compute the CRC-32 (as in zlib and Ethernet) of data.
+
+    Args:
+        data: Bytes-like object
+        crc: Running CRC (default: 0)
+
+    Returns:
+        CRC value
+    """
+    return zlib.crc32(data, crc)
+
+
+# Checksums that can be appended to sent payloads:
+# name -> (function, size in bytes, byte order on the wire)
+CHECKSUMS: dict[str, tuple[Callable[[bytes], int], int, str]] = {
+    "Sum8": (sum8, 1, "big"),
+    "XOR8": (xor8, 1, "big"),
+    "CRC-8": (crc8, 1, "big"),
+    "CRC-16/MODBUS": (crc16_modbus, 2, "little"),
+    "CRC-16/CCITT": (crc16_ccitt, 2, "big"),
+    "CRC-32": (crc32, 4, "little"),
+}
+
+
+def checksum_bytes(name: str, data: bytes) -> bytes:
+    """
+    Compute a checksum as the bytes to append to data.
+
+    Cycle and script sends append it once when their payloads are built,
+    so it is not computed again on every send.
+
+    Args:
+        name: One of CHECKSUMS
+        data: Payload
+
+    Returns:
+        Checksum bytes in wire order
+
+    Raises:
+        KeyError: If the checksum is unknown
+    """
+    func, size, byteorder = CHECKSUMS[name]
+    return func(data).to_bytes(size, byteorder)
@@ -0,0 +1,109 @@
+"""
+Cycle sender module.
+
+This module provides a CycleSender thread that sends payloads on a fixed
+schedule, off the GUI event loop.
+"""
+
+import threading
+from typing import Iterable
+
+from PySide6.QtCore import QThread, Signal
+
+from data_handler import DataSender
+from logwrapper import logger
+from scheduler import JitterStats, run_schedule
+
+
+class CycleSender(QThread):
+    """
+    Sends pre-built payloads on absolute deadlines in a separate thread.
+
+    The steps are (payload, interval_ms) pairs prepared on the GUI thread,
+    so the scheduler never touches widgets. A tick that finds the transmit
+    queue full is skipped rather than stopping the cycle, unless
+    skip_when_busy is off, as for scripts where every item must go out.
+    A write the transmit thread fails ends the cycle as "failed".
+
+    Signals:
+        cycle_finished: (status, jitter_summary) where status is "done",
+            "stopped" or "failed"
+    """
+
+    cycle_finished = Signal(str, str)
+
+    def __init__(
+        self,
+        data_sender: DataSender,
+        steps: Iterable[tuple[bytes, float]],
+        name: str = "cycle",
+        skip_when_busy: bool = True,
+        parent=None,
+    ) -> None:
+        """
+        Initialize the cycle sender.
+
+        Args:
+            data_sender: Data sender used for writing
+            steps: Iterable of (payload, interval_ms)
+            name: Name used in logs (default: "cycle")
+            skip_when_busy: Skip ticks while the transmit queue is full instead of waiting
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.data_sender = data_sender
+        self.steps = steps
+        self.name = name
+        self.skip_when_busy = skip_when_busy
+        self.jitter = JitterStats()
+        self.skipped = 0
+        self.write_errors = 0  # DataSender failed write count when the cycle started
+        self.log = logger.logger
+
+    def run(self) -> None:
+        """
+        Run the schedule until it ends, fails or is interrupted.
+        """
+        threading.current_thread().name = "CycleSenderThread"
+        self.write_errors = self.data_sender.get_write_errors()
+        status = run_schedule(self.steps, self._send, self.isInterruptionRequested, self.jitter)
+        if status == "done":
+            # The last payloads may still be queued; wait for their writes
+            if not self.data_sender.wait_until_written(self.isInterruptionRequested):
+                status = "stopped"
+            elif self.data_sender.get_write_errors() != self.write_errors:
+                status = "failed"
+        summary = str(self.jitter)
+        if self.skipped:
+            summary += f", {self.skipped} skipped"
+        self.log.info(f"{self.name} cycle send {status}: {summary}")
+        self.cycle_finished.emit(status, summary)
+
+    def _send(self, payload: bytes) -> bool:
+        """Queue one payload, skipping the tick or waiting if the transmit queue is full."""
+        if self.data_sender.get_write_errors() != self.write_errors:
+            return False
+        while self.data_sender.is_busy():
+            if self.skip_when_busy:
+                self.skipped += 1
+                return True
+            if self.isInterruptionRequested():
+                return True
+            self.msleep(1)
+        success, _ = self.data_sender.send_bytes(payload)
+        return success
+
+    def get_jitter_stats(self, with_p99: bool = True) -> dict:
+        """
+        Get the jitter statistics so far.
+
+        Args:
+            with_p99: Include the p99, which sorts the kept samples; pass
+                False while the thread is running
+
+        Returns:
+            Dictionary with count, overruns, min_us, avg_us, max_us, p99_us and skipped
+        """
+        stats = self.jitter.summary(with_p99)
+        stats["skipped"] = self.skipped
+        return stats
@@ -0,0 +1,338 @@
+"""
+Data converter module.
+
+This module provides the DataConverter class for converting between text,
+hex and bytes. It has no Qt dependency so headless tools can use it.
+"""
+
+import codecs
+import os
+import re
+from typing import Optional
+
+from checksum import CHECKSUMS, checksum_bytes
+from logwrapper import logger
+
+# Hex input may separate bytes with whitespace (incl. newlines), commas and
+# 0x/0X prefixes. A prefix glued to a preceding hex digit is not a prefix.
+HEX_MISPLACED_PREFIX = re.compile(r"(?<=[^\s,])0[xX]|0[xX](?![0-9A-Fa-f])")
+HEX_TOKENS = re.compile(r"\b0[xX](?=[0-9A-Fa-f])|[\s,]+|[0-9A-Fa-f]+")
+HEX_DIGITS = re.compile(r"[0-9A-Fa-f]*")
+
+
+class DataConverter:
+    """
+    Handles data format conversions.
+
+    Provides methods for converting between text, hex, and bytes formats.
+    """
+
+    def __init__(self, encoding: str = "gbk") -> None:
+        """
+        Initialize the data converter.
+
+        Args:
+            encoding: Default encoding for text conversion (default: "gbk")
+        """
+        self.encoding = encoding
+        self.checksum = ""  # Appended to sent payloads, "" or a checksum.CHECKSUMS name
+        self.log = logger.logger
+        # Carries incomplete multi-byte characters across received chunks
+        self.decoder: codecs.IncrementalDecoder = self._new_decoder(encoding)
+
+    def _new_decoder(self, encoding: str) -> codecs.IncrementalDecoder:
+        """
+        Create an incremental decoder for the encoding.
+
+        Args:
+            encoding: Encoding name
+
+        Returns:
+            Incremental decoder that replaces undecodable bytes
+        """
+        return codecs.getincrementaldecoder(encoding)("replace")
+
+    def set_encoding(self, encoding: str) -> None:
+        """
+        Set the encoding for text conversion.
+
+        Args:
+            encoding: Encoding name (e.g., "utf-8", "gbk")
+        """
+        self.encoding = encoding
+        self.decoder = self._new_decoder(encoding)
+        self.log.info(f"Encoding set to: {encoding}")
+
+    def set_checksum(self, checksum: str) -> None:
+        """
+        Set the checksum appended to sent payloads.
+
+        Args:
+            checksum: Name from checksum.CHECKSUMS, or "" for none
+
+        Raises:
+            ValueError: If the checksum is unknown
+        """
+        if checksum and checksum not in CHECKSUMS:
+            raise ValueError(f"Unknown checksum: {checksum}")
+        self.checksum = checksum
+        self.log.info(f"Send checksum set to: {checksum or 'none'}")
+
+    def append_checksum(self, data: bytes, checksum: Optional[str] = None) -> bytes:
+        """
+        Append a checksum of the payload to it.
+
+        Args:
+            data: Payload
+            checksum: Name from checksum.CHECKSUMS, "" for none (default: the one set)
+
+        Returns:
+            Payload followed by its checksum
+        """
+        checksum = self.checksum if checksum is None else checksum
+        if not checksum or not data:
+            return data
+        return bytes(data) + checksum_bytes(checksum, data)
+
+    def _normalize_hex(self, text: str) -> Optional[str]:
+        """
+        Turn every accepted separator into a space.
+
+        Args:
+            text: Hex string
+
+        Returns:
+            String of hex digits and whitespace, or None if a 0x prefix does
+            not start a token or has no digits, as in "010x02", "0x0x01" or "0x"
+        """
+        text = text.replace(",", " ")
+        if "x" in text or "X" in text:
+            if HEX_MISPLACED_PREFIX.search(text):
+                return None
+            text = text.replace("0x", " ").replace("0X", " ")
+        return text
+
+    def is_valid_hex(self, text: str) -> tuple[bool, str]:
+        """
+        Check if the text is valid hex and return cleaned hex string.
+
+        Args:
+            text: Text to validate
+
+        Returns:
+            Tuple of (is_valid: bool, cleaned_hex: str); text without any
+            byte is not valid
+        """
+        normalized = self._normalize_hex(text)
+        if normalized is None:
+            return False, "".join(text.split())
+
+        cleaned = "".join(normalized.split())
+        try:
+            return len(bytes.fromhex(cleaned)) > 0, cleaned
+        except ValueError:
+            return False, cleaned
+
+    def parse_hex(self, text: str) -> tuple[bool, bytes, int]:
+        """
+        Parse a hex string into bytes.
+
+        Accepts spaces, newlines, commas and one 0x prefix per token, e.g.
+        "48 65 6C", "0x48,0x65,0x6C" or "48656C". Text without any byte,
+        such as "" or "0x", is an error. All scanning is done by str/bytes
+        builtins; the per-character walk only runs on error.
+
+        Args:
+            text: Hex string to parse
+
+        Returns:
+            Tuple of (success: bool, data: bytes, error_offset: int), where
+            error_offset is the index of the first bad character in text
+            (len(text) if it holds no byte, -1 on success)
+        """
+        normalized = self._normalize_hex(text)
+        if normalized is not None:
+            try:
+                data = bytes.fromhex(normalized)
+            except ValueError:
+                try:
+                    # fromhex() needs whole bytes between spaces; also accept "4 865"
+                    data = bytes.fromhex("".join(normalized.split()))
+                except ValueError:
+                    data = None
+            if data:
+                return True, data, -1
+            if data is not None:
+                return False, b"", len(text)
+        return False, b"", self._find_hex_error(text)
+
+    def _find_hex_error(self, text: str) -> int:
+        """
+        Locate the first character that makes text invalid hex.
+
+        Only called on the error path, so the token walk costs nothing for
+        valid input.
+
+        Args:
+            text: Hex string that failed to parse
+
+        Returns:
+            Offset of the first invalid character, or of the last hex digit
+            if the only problem is an incomplete final byte
+        """
+        position = 0
+        last_digit = len(text)
+        for match in HEX_TOKENS.finditer(text):
+            if match.start() != position:
+                return position
+            if HEX_DIGITS.fullmatch(match.group()):
+                last_digit = match.end() - 1
+            position = match.end()
+        if position != len(text):
+            return position
+        return last_digit
+
+    def text_to_bytes(self, text: str, add_newline: bool = False) -> bytes:
+        """
+        Convert text to a payload, followed by its checksum if one is set.
+
+        Args:
+            text: Text to convert
+            add_newline: Whether to add newline at the end, after the checksum
+
+        Returns:
+            Converted bytes
+        """
+        try:
+            bytes_data = self.append_checksum(text.encode(self.encoding, "replace"))
+            if add_newline:
+                bytes_data += os.linesep.encode(self.encoding, "replace")
+            return bytes_data
+        except (ValueError, UnicodeEncodeError) as e:
+            self.log.error(f"Error converting text to bytes: {e}")
+            return b""
+
+    def hex_to_bytes(self, hex_str: str, add_newline: bool = False) -> tuple[bool, bytes]:
+        """
+        Convert hex string to a payload, followed by its checksum if one is set.
+
+        Args:
+            hex_str: Hex string to convert (e.g., "48 65 6C 6C 6F")
+            add_newline: Whether to add newline at the end, after the checksum
+
+        Returns:
+            Tuple of (success: bool, converted_bytes: bytes)
+        """
+        success, bytes_data, error_offset = self.parse_hex(hex_str)
+        if not success:
+            self.log.warning(f"Invalid hex format at offset {error_offset}")
+            return False, b""
+
+        try:
+            bytes_data = self.append_checksum(bytes_data)
+            if add_newline:
+                bytes_data += os.linesep.encode(self.encoding, "replace")
+            return True, bytes_data
+        except (ValueError, UnicodeEncodeError) as e:
+            self.log.error(f"Error converting hex to bytes: {e}")
+            return False, b""
+
+    def bytes_to_text(self, data: bytes) -> str:
+        """
+        Convert bytes to text with support for multi-byte characters.
+        A character split across chunks is kept by the incremental decoder
+        and completed by the next call.
+
+        Args:
+            data: Bytes to convert
+
+        Returns:
+            Converted text
+        """
+        if not data:
+            return ""
+
+        try:
+            return self.decoder.decode(data)
+        except (ValueError, UnicodeDecodeError) as e:
+            self.log.error(f"Error converting bytes to text: {e}")
+            self.decoder.reset()  # Drop pending bytes on error
+            return ""
+
+    def reset_decoder(self) -> None:
+        """Discard any incomplete multi-byte character held by the decoder."""
+        self.decoder.reset()
+
+    def bytes_to_hex(self, data: bytes, separator: str = " ") -> str:
+        """
+        Convert bytes to hex string.
+
+        Args:
+            data: Bytes to convert
+            separator: Separator between hex values (default: " ")
+
+        Returns:
+            Hex string
+        """
+        try:
+            return data.hex(separator)
+        except Exception as e:
+            self.log.error(f"Error converting bytes to hex: {e}")
+            return ""
+
+    def text_to_hex(self, text: str) -> str:
+        """
+        Convert text to hex string.
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Hex string with space separator
+        """
+        try:
+            return text.encode(self.encoding, "replace").hex(" ")
+        except (ValueError, UnicodeEncodeError) as e:
+            self.log.error(f"Error converting text to hex: {e}")
+            return ""
+
+    def hex_to_text(self, hex_str: str) -> tuple[bool, str]:
+        """
+        Convert hex string to text.
+
+        Args:
+            hex_str: Hex string to convert
+
+        Returns:
+            Tuple of (success: bool, converted_text: str)
+        """
+        success, bytes_data, _ = self.parse_hex(hex_str)
+        if not success:
+            return False, ""
+
+        try:
+            text = bytes_data.decode(self.encoding, "replace")
+            return True, text
+        except (ValueError, UnicodeDecodeError) as e:
+            self.log.error(f"Error converting hex to text: {e}")
+            return False, ""
+
+    def prepare_send_data(
+        self, text: str, is_hex: bool, add_newline: bool = False
+    ) -> tuple[bool, bytes]:
+        """
+        Prepare data for sending based on format, with the checksum set.
+
+        Args:
+            text: Text or hex string to prepare
+            is_hex: Whether the input is hex format
+            add_newline: Whether to add newline at the end
+
+        Returns:
+            Tuple of (success: bool, prepared_bytes: bytes)
+        """
+        if is_hex:
+            return self.hex_to_bytes(text, add_newline)
+        else:
+            bytes_data = self.text_to_bytes(text, add_newline)
+            return len(bytes_data) > 0, bytes_data
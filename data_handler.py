@@ -5,328 +5,120 @@ This module provides classes for handling data operations including conversion,
 sending, and receiving data through serial port.
 """
 
-import os
+import itertools
 import queue
-import string
 import threading
-from typing import Optional
+import time
+from collections import deque
+from typing import Callable, Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, Qt, Signal
 
+from capture import CaptureWriter
+from data_converter import DataConverter  # Re-exported: data_handler.DataConverter
+from ring_buffer import RingBuffer
 from serial_manager import SerialManager
+from timestamps import ReceiveClock
 import globalvar as gl
 from logwrapper import logger
 
 
-class DataConverter:
+class DataSender:
     """
-    Handles data format conversions.
+    Handles data sending operations.
 
-    Provides methods for converting between text, hex, and bytes formats.
+    This class manages sending data through serial port with support for
+    text, hex, and file formats. With a DataTransmitter, frames are queued
+    to the transmit thread and the sent and failed write counters are
+    updated from that thread when the write completes, under a lock; without
+    one, frames are written synchronously.
     """
 
-    def __init__(self, encoding: str = "gbk") -> None:
+    def __init__(
+        self,
+        serial_manager: SerialManager,
+        data_converter: Optional[DataConverter] = None,
+        transmitter: Optional["DataTransmitter"] = None,
+    ) -> None:
         """
-        Initialize the data converter.
+        Initialize the data sender.
 
         Args:
-            encoding: Default encoding for text conversion (default: "gbk")
+            serial_manager: Serial port manager instance
+            data_converter: Data converter instance (optional)
+            transmitter: Transmit thread that owns the port's write side (optional)
         """
-        self.encoding = encoding
+        self.serial_manager = serial_manager
+        self.data_converter = data_converter or DataConverter()
+        self.transmitter = transmitter
         self.log = logger.logger
-        self.byte_buffer: bytes = b""  # Buffer for incomplete multi-byte characters
-
-    def set_encoding(self, encoding: str) -> None:
-        """
-        Set the encoding for text conversion.
-
-        Args:
-            encoding: Encoding name (e.g., "utf-8", "gbk")
-        """
-        self.encoding = encoding
-        self.log.info(f"Encoding set to: {encoding}")
-
-    def is_valid_hex(self, text: str) -> tuple[bool, str]:
-        """
-        Check if the text is valid hex and return cleaned hex string.
-
-        Args:
-            text: Text to validate
-
-        Returns:
-            Tuple of (is_valid: bool, cleaned_hex: str)
-        """
-        cleaned = text.replace(" ", "")
-        is_valid = (len(cleaned) % 2 == 0) and all(c in string.hexdigits for c in cleaned)
-        return is_valid, cleaned
-
-    def text_to_bytes(self, text: str, add_newline: bool = False) -> bytes:
-        """
-        Convert text to bytes.
-
-        Args:
-            text: Text to convert
-            add_newline: Whether to add newline at the end
-
-        Returns:
-            Converted bytes
-        """
-        try:
-            if add_newline:
-                text += os.linesep
-            return text.encode(self.encoding, "replace")
-        except (ValueError, UnicodeEncodeError) as e:
-            self.log.error(f"Error converting text to bytes: {e}")
-            return b""
-
-    def hex_to_bytes(self, hex_str: str, add_newline: bool = False) -> tuple[bool, bytes]:
-        """
-        Convert hex string to bytes.
-
-        Args:
-            hex_str: Hex string to convert (e.g., "48 65 6C 6C 6F")
-            add_newline: Whether to add newline at the end
-
-        Returns:
-            Tuple of (success: bool, converted_bytes: bytes)
-        """
-        is_valid, cleaned_hex = self.is_valid_hex(hex_str)
-        if not is_valid:
-            self.log.warning(f"Invalid hex format: {hex_str}")
-            return False, b""
-
-        try:
-            bytes_data = bytes.fromhex(cleaned_hex)
-            if add_newline:
-                bytes_data += os.linesep.encode(self.encoding, "replace")
-            return True, bytes_data
-        except (ValueError, UnicodeEncodeError) as e:
-            self.log.error(f"Error converting hex to bytes: {e}")
-            return False, b""
+        self.counter_lock = threading.Lock()
+        self.total_sent = 0
+        self.write_errors = 0
+        if self.transmitter is not None:
+            # Count in the transmit thread, before the frame is marked done
+            self.transmitter.frame_sent.connect(self._on_frame_sent, Qt.ConnectionType.DirectConnection)
 
-    def bytes_to_text(self, data: bytes) -> str:
+    def _write(self, data: bytes) -> tuple[bool, int]:
         """
-        Convert bytes to text with support for multi-byte characters.
-        Handles incomplete multi-byte characters using a buffer.
+        Write or queue data for the serial port.
 
         Args:
-            data: Bytes to convert
+            data: Bytes to send
 
         Returns:
-            Converted text
+            Tuple of (success: bool, bytes_sent: int); with a transmitter,
+            bytes_sent is the number of bytes queued
         """
-        if not data:
-            return ""
-
-        # Add new data to buffer
-        self.byte_buffer += data
-
-        if self.encoding.lower() in ["utf-8", "utf8"]:
-            return self._utf8_bytes_to_text()
-        elif self.encoding.lower() in ["gbk", "cp936"]:
-            return self._gbk_bytes_to_text()
-        else:
-            # For other encodings, use simple decode
-            try:
-                text = self.byte_buffer.decode(self.encoding, "replace")
-                self.byte_buffer = b""  # Clear buffer
-                return text
-            except (ValueError, UnicodeDecodeError) as e:
-                self.log.error(f"Error converting bytes to text: {e}")
-                self.byte_buffer = b""  # Clear buffer on error
-                return ""
-
-    def _utf8_bytes_to_text(self) -> str:
-        """
-        Convert UTF-8 bytes to text, handling incomplete characters.
-        """
-        buffer_len = len(self.byte_buffer)
-        if buffer_len == 0:
-            return ""
-
-        # Find the last complete UTF-8 character boundary
-        i = buffer_len - 1
-        while i >= 0:
-            byte = self.byte_buffer[i]
-            # Check if this byte is the start of a UTF-8 character
-            if byte < 0x80:  # Single-byte character
-                break
-            elif (byte & 0xC0) == 0xC0:  # Start of multi-byte character
-                # Determine how many bytes this character should have
-                if (byte & 0xE0) == 0xC0:  # 2-byte
-                    required = 2
-                elif (byte & 0xF0) == 0xE0:  # 3-byte
-                    required = 3
-                elif (byte & 0xF8) == 0xF0:  # 4-byte
-                    required = 4
-                else:
-                    # Invalid UTF-8 leading byte, treat as error
-                    i -= 1
-                    continue
+        if self.transmitter is not None:
+            if self.transmitter.submit(data) < 0:
+                return False, 0
+            return True, len(data)
 
-                # Check if we have enough bytes for this character
-                if buffer_len - i >= required:
-                    break
-                else:
-                    # Not enough bytes, move to previous potential start
-                    i -= 1
-            else:
-                # Continuation byte, move back
-                i -= 1
-
-        if i < 0:
-            # No complete characters
-            return ""
-
-        # Split buffer into complete and incomplete parts
-        complete_data = self.byte_buffer[: i + 1]
-        self.byte_buffer = self.byte_buffer[i + 1 :]
-
-        try:
-            return complete_data.decode("utf-8", "replace")
-        except (ValueError, UnicodeDecodeError) as e:
-            self.log.error(f"Error converting UTF-8 bytes to text: {e}")
-            self.byte_buffer = b""  # Clear buffer on error
-            return ""
-
-    def _gbk_bytes_to_text(self) -> str:
-        """
-        Convert GBK bytes to text, handling incomplete characters.
-        """
-        buffer_len = len(self.byte_buffer)
-        if buffer_len == 0:
-            return ""
-
-        # Find the last complete GBK character boundary
-        i = buffer_len - 1
-        while i >= 0:
-            byte = self.byte_buffer[i]
-            # Check if this byte is the start of a GBK character
-            if byte < 0x80:  # Single-byte (ASCII)
-                break
-            elif 0x81 <= byte <= 0xFE:  # Start of 2-byte GBK
-                # Check if we have enough bytes
-                if i + 1 < buffer_len:
-                    break
-                else:
-                    # Not enough bytes, move to previous
-                    i -= 1
-            else:
-                # Invalid GBK byte, move back
-                i -= 1
-
-        if i < 0:
-            # No complete characters
-            return ""
-
-        # Split buffer into complete and incomplete parts
-        complete_data = self.byte_buffer[: i + 1]
-        self.byte_buffer = self.byte_buffer[i + 1 :]
-
-        try:
-            return complete_data.decode("gbk", "replace")
-        except (ValueError, UnicodeDecodeError) as e:
-            self.log.error(f"Error converting GBK bytes to text: {e}")
-            self.byte_buffer = b""  # Clear buffer on error
-            return ""
-
-    def bytes_to_hex(self, data: bytes, separator: str = " ") -> str:
-        """
-        Convert bytes to hex string.
-
-        Args:
-            data: Bytes to convert
-            separator: Separator between hex values (default: " ")
+        bytes_sent = self.serial_manager.write(data)
+        if bytes_sent > 0:
+            with self.counter_lock:
+                self.total_sent += bytes_sent
+            return True, bytes_sent
 
-        Returns:
-            Hex string
-        """
-        try:
-            return data.hex(separator)
-        except Exception as e:
-            self.log.error(f"Error converting bytes to hex: {e}")
-            return ""
+        return False, 0
 
-    def text_to_hex(self, text: str) -> str:
+    def _on_frame_sent(self, frame_id: int, bytes_sent: int, latency_ms: float) -> None:
         """
-        Convert text to hex string.
-
-        Args:
-            text: Text to convert
+        Count bytes written and writes failed by the transmit thread.
 
-        Returns:
-            Hex string with space separator
+        Called directly in the transmit thread, so the counters are up to date
+        once wait_until_written() returns.
         """
-        try:
-            return text.encode(self.encoding, "replace").hex(" ")
-        except (ValueError, UnicodeEncodeError) as e:
-            self.log.error(f"Error converting text to hex: {e}")
-            return ""
+        with self.counter_lock:
+            self.total_sent += bytes_sent
+            if bytes_sent == 0:
+                self.write_errors += 1
 
-    def hex_to_text(self, hex_str: str) -> tuple[bool, str]:
+    def is_busy(self) -> bool:
         """
-        Convert hex string to text.
-
-        Args:
-            hex_str: Hex string to convert
+        Check if the transmit queue is full.
 
         Returns:
-            Tuple of (success: bool, converted_text: str)
+            True if a new frame would be rejected
         """
-        is_valid, cleaned_hex = self.is_valid_hex(hex_str)
-        if not is_valid:
-            return False, ""
-
-        try:
-            text = bytes.fromhex(cleaned_hex).decode(self.encoding, "replace")
-            return True, text
-        except (ValueError, UnicodeDecodeError) as e:
-            self.log.error(f"Error converting hex to text: {e}")
-            return False, ""
+        return self.transmitter is not None and self.transmitter.is_full()
 
-    def prepare_send_data(
-        self, text: str, is_hex: bool, add_newline: bool = False
-    ) -> tuple[bool, bytes]:
+    def wait_until_written(self, cancelled: Callable[[], bool]) -> bool:
         """
-        Prepare data for sending based on format.
+        Block until every queued frame has been written or dropped.
 
         Args:
-            text: Text or hex string to prepare
-            is_hex: Whether the input is hex format
-            add_newline: Whether to add newline at the end
+            cancelled: Returns True to stop waiting
 
         Returns:
-            Tuple of (success: bool, prepared_bytes: bytes)
-        """
-        if is_hex:
-            return self.hex_to_bytes(text, add_newline)
-        else:
-            bytes_data = self.text_to_bytes(text, add_newline)
-            return len(bytes_data) > 0, bytes_data
-
-
-class DataSender:
-    """
-    Handles data sending operations.
-
-    This class manages sending data through serial port with support for
-    text, hex, and file formats.
-    """
-
-    def __init__(
-        self, serial_manager: SerialManager, data_converter: Optional[DataConverter] = None
-    ) -> None:
-        """
-        Initialize the data sender.
-
-        Args:
-            serial_manager: Serial port manager instance
-            data_converter: Data converter instance (optional)
+            False if cancelled or the port closed while waiting
         """
-        self.serial_manager = serial_manager
-        self.data_converter = data_converter or DataConverter()
-        self.log = logger.logger
-        self.total_sent = 0
+        while self.transmitter is not None and not self.transmitter.is_idle():
+            if cancelled() or not self.serial_manager.is_open():
+                return False
+            time.sleep(0.001)
+        return True
 
     def send_text(self, text: str, add_newline: bool = False) -> tuple[bool, int]:
         """
@@ -351,12 +143,7 @@ class DataSender:
         if not bytes_data:
             return False, 0
 
-        bytes_sent = self.serial_manager.write(bytes_data)
-        if bytes_sent > 0:
-            self.total_sent += bytes_sent
-            return True, bytes_sent
-
-        return False, 0
+        return self._write(bytes_data)
 
     def send_hex(self, hex_str: str, add_newline: bool = False) -> tuple[bool, int]:
         """
@@ -382,12 +169,7 @@ class DataSender:
             self.log.warning("Invalid hex format")
             return False, 0
 
-        bytes_sent = self.serial_manager.write(bytes_data)
-        if bytes_sent > 0:
-            self.total_sent += bytes_sent
-            return True, bytes_sent
-
-        return False, 0
+        return self._write(bytes_data)
 
     def send_data(self, text: str, is_hex: bool, add_newline: bool = False) -> tuple[bool, int]:
         """
@@ -424,46 +206,207 @@ class DataSender:
             self.log.warning("Cannot send: port is not open")
             return False, 0
 
-        bytes_sent = self.serial_manager.write(data)
-        if bytes_sent > 0:
-            self.total_sent += bytes_sent
-            return True, bytes_sent
-
-        return False, 0
+        return self._write(data)
 
-    def send_file_content(self, content: str) -> tuple[bool, int]:
+    def get_total_sent(self) -> int:
         """
-        Send file content.
-
-        Args:
-            content: File content to send
+        Get total bytes sent.
 
         Returns:
-            Tuple of (success: bool, bytes_sent: int)
+            Total bytes sent
         """
-        return self.send_text(content, add_newline=False)
+        with self.counter_lock:
+            return self.total_sent
 
-    def get_total_sent(self) -> int:
+    def get_write_errors(self) -> int:
         """
-        Get total bytes sent.
+        Get the number of queued frames the transmit thread failed to write.
+
+        The count is never reset, so senders compare it with the value they
+        saw when they started.
 
         Returns:
-            Total bytes sent
+            Failed write count
         """
-        return self.total_sent
+        with self.counter_lock:
+            return self.write_errors
 
     def reset_counter(self) -> None:
         """Reset the sent bytes counter."""
-        self.total_sent = 0
+        with self.counter_lock:
+            self.total_sent = 0
         self.log.debug("Sent bytes counter reset")
 
 
+class DataTransmitter(QThread):
+    """
+    Writes data to the serial port in a separate thread.
+
+    Frames are taken from a bounded queue and written in order, so large
+    or flow-controlled writes never block the UI thread.
+
+    Signals:
+        frame_sent: (frame_id, bytes_sent, latency_ms) after each write;
+            bytes_sent is 0 if the write failed
+    """
+
+    frame_sent = Signal(int, "qint64", float)
+
+    def __init__(
+        self, serial_manager: SerialManager, queue_size: int = gl.TRANSMIT_QUEUE_SIZE, parent=None
+    ) -> None:
+        """
+        Initialize the data transmitter.
+
+        Args:
+            serial_manager: Serial port manager instance
+            queue_size: Maximum queued frames (default: gl.TRANSMIT_QUEUE_SIZE)
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.serial_manager = serial_manager
+        self.transmit_queue: queue.Queue = queue.Queue(queue_size)
+        self.frame_ids = itertools.count(1)
+        self.log = logger.logger
+        self._reset_stats()
+
+    def submit(self, data: bytes) -> int:
+        """
+        Queue a frame for transmission without blocking.
+
+        Args:
+            data: Bytes-like object to send; views are copied so the caller
+                can reuse its buffer
+
+        Returns:
+            Frame id, or -1 if the queue is full or data is empty
+        """
+        if not data:
+            return -1
+
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        frame_id = next(self.frame_ids)
+        try:
+            self.transmit_queue.put_nowait((frame_id, data, time.perf_counter()))
+        except queue.Full:
+            self.log.warning(f"Transmit queue is full, rejected {len(data)} bytes")
+            return -1
+
+        self.max_depth = max(self.max_depth, self.transmit_queue.qsize())
+        return frame_id
+
+    def run(self) -> None:
+        """
+        Run the transmit thread.
+        """
+        threading.current_thread().name = "DataTransmitterThread"
+        self.log.info("Data transmitter thread started")
+        wait_timeout = gl.RECEIVE_WAIT_TIMEOUT_MS / 1000
+
+        while not self.isInterruptionRequested():
+            try:
+                frame_id, data, queued_at = self.transmit_queue.get(timeout=wait_timeout)
+            except queue.Empty:
+                continue
+
+            write_start = time.perf_counter()
+            bytes_sent = self.serial_manager.write(data)
+            done = time.perf_counter()
+
+            self.frames += 1
+            self.bytes_sent += bytes_sent
+            self.write_total += done - write_start
+            self.write_max = max(self.write_max, done - write_start)
+            latency = done - queued_at
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.frame_sent.emit(frame_id, bytes_sent, latency * 1000)
+            self.transmit_queue.task_done()
+
+        self.log.info("Data transmitter thread stopped")
+
+    def is_full(self) -> bool:
+        """
+        Check if the transmit queue is full.
+
+        Returns:
+            True if the queue is full
+        """
+        return self.transmit_queue.full()
+
+    def is_idle(self) -> bool:
+        """
+        Check if every submitted frame has been written or dropped.
+
+        Returns:
+            True if no frame is queued or being written
+        """
+        with self.transmit_queue.all_tasks_done:
+            return self.transmit_queue.unfinished_tasks == 0
+
+    def queue_depth(self) -> int:
+        """
+        Get the number of frames waiting to be written.
+
+        Returns:
+            Queued frame count
+        """
+        return self.transmit_queue.qsize()
+
+    def clear(self) -> None:
+        """Discard all frames that have not been written yet."""
+        while True:
+            try:
+                self.transmit_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.transmit_queue.task_done()
+        self.log.debug("Transmit queue cleared")
+
+    def _reset_stats(self) -> None:
+        """Reset the transmit statistics."""
+        self.frames = 0
+        self.bytes_sent = 0
+        self.max_depth = 0
+        self.write_total = 0.0
+        self.write_max = 0.0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def get_stats(self) -> dict:
+        """
+        Get transmit queue and write latency statistics.
+
+        Write time is the duration of the serial write itself; latency is
+        measured from submit() to the end of the write.
+
+        Returns:
+            Dictionary with queue_depth, max_depth, frames, bytes,
+            avg/max_write_ms and avg/max_latency_ms
+        """
+        frames = self.frames
+        return {
+            "queue_depth": self.queue_depth(),
+            "max_depth": self.max_depth,
+            "frames": frames,
+            "bytes": self.bytes_sent,
+            "avg_write_ms": (self.write_total / frames * 1000) if frames else 0.0,
+            "max_write_ms": self.write_max * 1000,
+            "avg_latency_ms": (self.latency_total / frames * 1000) if frames else 0.0,
+            "max_latency_ms": self.latency_max * 1000,
+        }
+
+
 class DataReceiver(QThread):
     """
     Receives data from serial port in a separate thread.
 
     This class runs in a separate thread to continuously read data from
-    the serial port without blocking the UI.
+    the serial port without blocking the UI. Every chunk is stamped with
+    time.monotonic_ns() as it is read, in a compact (stream offset, stamp)
+    record kept next to the ring buffer, so the UI and the capture index
+    see arrival times rather than drain times.
 
     Signals:
         port_closed: Emitted when port is closed
@@ -471,48 +414,78 @@ class DataReceiver(QThread):
 
     port_closed = Signal()
 
-    def __init__(self, serial_manager: SerialManager, parent=None) -> None:
+    def __init__(
+        self,
+        serial_manager: SerialManager,
+        parent=None,
+        event_driven: Optional[bool] = None,
+        buffer_size_mb: Optional[float] = None,
+    ) -> None:
         """
         Initialize the data receiver.
 
         Args:
             serial_manager: Serial port manager instance
             parent: Parent QObject (optional)
+            event_driven: Block on the port until data arrives instead of
+                sleep polling (default: gl.RECEIVE_EVENT_DRIVEN)
+            buffer_size_mb: Receive buffer capacity in MB
+                (default: gl.RECEIVE_BUFFER_SIZE_MB)
         """
         super().__init__(parent)
         self.serial_manager = serial_manager
-        self.receive_queue = queue.Queue(gl.RECEIVE_QUEUE_SIZE)
+        if buffer_size_mb is None:
+            buffer_size_mb = gl.RECEIVE_BUFFER_SIZE_MB
+        self.receive_buffer = RingBuffer(int(buffer_size_mb * 1024 * 1024))
+        self.clock = ReceiveClock()
+        # (ring buffer stream offset, time.monotonic_ns()) of each chunk, at
+        # most gl.RECEIVE_STAMP_QUEUE_SIZE; appended by the reader, popped by the UI
+        self.chunk_stamps: deque[tuple[int, int]] = deque()
+        self.last_stamp_ns = 0  # Stamp of the chunk the next drain starts in
+        self.stamps_full = False  # Chunks are sharing the stamp of an earlier one
+        self.capture_writer: Optional[CaptureWriter] = None
+        self.capture_lock = threading.Lock()
         self.close_port_flag = False
+        self.engine = None  # ReaderEngine servicing this receiver, if any
         self.total_received = 0
         self.total_dropped = 0  # Track dropped data
+        self.event_driven = gl.RECEIVE_EVENT_DRIVEN if event_driven is None else event_driven
         self.log = logger.logger
+        self._reset_latency_stats()
 
     def run(self) -> None:
         """
         Run the receive thread.
 
         This method continuously reads data from the serial port and
-        emits signals when data is received.
+        queues it for the UI. In event-driven mode the thread sleeps in the
+        kernel until the port becomes readable; in polling mode it reads and
+        then sleeps for a fixed interval.
         """
         threading.current_thread().name = "DataReceiverThread"
-        self.log.info("Data receiver thread started")
+        mode = "event-driven" if self.event_driven else "polling"
+        self.log.info(f"Data receiver thread started ({mode})")
+        wait_timeout = gl.RECEIVE_WAIT_TIMEOUT_MS / 1000
+        poll_start = time.perf_counter()
 
         while not self.isInterruptionRequested():
             # Handle port closed state
             if not self.serial_manager.is_open():
                 self.msleep(100)
+                poll_start = time.perf_counter()
                 continue
 
             # Read data from serial port
             try:
-                data = self.serial_manager.read_all()
-                if data:
-                    try:
-                        self.receive_queue.put_nowait(data)
-                        self.total_received += len(data)
-                    except queue.Full:
-                        self.total_dropped += len(data)
-                        self.log.error(f"Receive queue is full, dropped {len(data)} bytes")
+                if self.event_driven:
+                    data = self.serial_manager.read_available(wait_timeout)
+                    # The wait returns as soon as the port is readable
+                    ready_at = time.perf_counter()
+                else:
+                    data = self.serial_manager.read_waiting()
+                    # Data may have arrived any time since the last sleep began
+                    ready_at = poll_start
+                self._enqueue(data, ready_at)
             except Exception as e:
                 self.log.error(f"Error reading from serial port: {str(e)}")
                 self.close_port_flag = True
@@ -520,39 +493,227 @@ class DataReceiver(QThread):
 
             # Handle port closing request
             if self.close_port_flag:
-                success, msg = self.serial_manager.close_port()
-                if success:
-                    self.close_port_flag = False
-                    self.port_closed.emit()
-                    self.log.info("Port closed by receiver thread")
-                else:
-                    self.log.error(f"Failed to close port: {msg}")
+                self.service_close_request()
 
-            # Small sleep to prevent CPU overuse
-            self.msleep(10)
+            if not self.event_driven:
+                # Small sleep to prevent CPU overuse
+                poll_start = time.perf_counter()
+                self.msleep(gl.RECEIVE_POLL_INTERVAL_MS)
 
         self.log.info("Data receiver thread stopped")
 
+    def service_close_request(self) -> bool:
+        """
+        Close the port on behalf of a pending close request.
+
+        Called from the thread that reads the port, either this receiver's
+        own thread or the shared reader engine, so the port is never
+        closed under a read in progress.
+
+        Returns:
+            True if the port was closed
+        """
+        success, msg = self.serial_manager.close_port()
+        if not success:
+            self.log.error(f"Failed to close port: {msg}")
+            return False
+
+        self.close_port_flag = False
+        self.port_closed.emit()
+        self.log.info("Port closed by receiver thread")
+        return True
+
+    def read_ready(self, ready_at: float) -> None:
+        """
+        Read and queue a chunk from a port the reader engine found readable.
+
+        A read error requests the port close, which the engine then services.
+
+        Args:
+            ready_at: perf_counter() time the engine's select returned
+        """
+        try:
+            data = self.serial_manager.read_ready()
+        except Exception as e:
+            self.log.error(f"Error reading from serial port: {str(e)}")
+            self.close_port_flag = True
+            return
+        self._enqueue(data, ready_at)
+
+    def idle(self, now: float) -> None:
+        """
+        Record an idle wakeup from the reader engine and sync the capture if due.
+
+        Args:
+            now: perf_counter() time the engine's select timed out
+        """
+        self._enqueue(b"", now)
+
+    def _enqueue(self, data: bytes, ready_at: float) -> None:
+        """
+        Queue a received chunk and record wakeup and latency statistics.
+
+        The chunk is copied into the ring buffer (and the capture file)
+        here, so it may be a view into the serial manager's read buffer.
+
+        Args:
+            data: Bytes-like chunk read from the port (may be empty)
+            ready_at: perf_counter() time the data was available to the reader
+        """
+        self.wakeups += 1
+        if not data:
+            self.idle_wakeups += 1
+            if self.capture_writer is not None:
+                with self.capture_lock:
+                    if self.capture_writer is not None:
+                        self.capture_writer.sync_if_due()
+            return
+
+        stamp_ns = time.monotonic_ns()
+
+        # Capture first, straight from the reader thread, so recording
+        # never depends on the display keeping up
+        if self.capture_writer is not None:
+            with self.capture_lock:
+                if self.capture_writer is not None:
+                    self.capture_writer.write(data, stamp_ns)
+
+        # Publish the stamp before the bytes, so a drain never sees bytes
+        # whose stamp is still missing. When the queue is full the oldest
+        # stamps are kept and this chunk counts as part of the previous one.
+        if len(self.chunk_stamps) < gl.RECEIVE_STAMP_QUEUE_SIZE:
+            self.chunk_stamps.append((self.receive_buffer.written(), stamp_ns))
+            self.stamps_full = False
+        elif not self.stamps_full:
+            self.stamps_full = True
+            self.log.warning("Receive stamp queue is full, chunks share the arrival time of an earlier one")
+        written = self.receive_buffer.write(data)
+        self.total_received += written
+        if written < len(data):
+            dropped = len(data) - written
+            self.total_dropped += dropped
+            self.log.error(f"Receive buffer is full, dropped {dropped} bytes")
+
+        latency = time.perf_counter() - ready_at
+        self.latency_count += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def _reset_latency_stats(self) -> None:
+        """Reset the wakeup and latency statistics."""
+        self.wakeups = 0
+        self.idle_wakeups = 0
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def get_latency_stats(self) -> dict:
+        """
+        Get receive loop wakeup and latency statistics.
+
+        Latency is the time from when a chunk was available to the reader
+        until it was queued. For the polling loop this is measured from the
+        start of the preceding sleep, i.e. the worst case a chunk may have
+        waited in the driver.
+
+        Returns:
+            Dictionary with mode ("engine", "event" or "poll"), wakeups,
+            idle_wakeups, chunks, avg_latency_ms and max_latency_ms
+        """
+        count = self.latency_count
+        return {
+            "mode": "engine" if self.engine is not None else ("event" if self.event_driven else "poll"),
+            "wakeups": self.wakeups,
+            "idle_wakeups": self.idle_wakeups,
+            "chunks": count,
+            "avg_latency_ms": (self.latency_total / count * 1000) if count else 0.0,
+            "max_latency_ms": self.latency_max * 1000,
+        }
+
+    def start_capture(
+        self, file_path: str, max_bytes: int = 0, max_seconds: float = 0
+    ) -> tuple[bool, str]:
+        """
+        Start recording raw received bytes to a file.
+
+        Args:
+            file_path: Path of the capture file
+            max_bytes: Rotate after this many bytes per file (0: no limit)
+            max_seconds: Rotate after this many seconds per file (0: no limit)
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        writer = CaptureWriter(file_path, max_bytes, max_seconds, clock=self.clock)
+        success, msg = writer.open()
+        if not success:
+            return False, msg
+
+        with self.capture_lock:
+            if self.capture_writer is not None:
+                self.capture_writer.close()
+            self.capture_writer = writer
+        return True, msg
+
+    def stop_capture(self) -> None:
+        """Stop recording and close the capture file."""
+        with self.capture_lock:
+            if self.capture_writer is not None:
+                self.capture_writer.close()
+                self.capture_writer = None
+
+    def is_capturing(self) -> bool:
+        """
+        Check if received data is being recorded.
+
+        Returns:
+            True if a capture is active
+        """
+        writer = self.capture_writer
+        return writer is not None and writer.is_open()
+
     def request_close_port(self) -> None:
         """Request to close the serial port."""
         self.close_port_flag = True
+        if self.engine is not None:
+            self.engine.wake()
         self.log.debug("Port close requested")
 
-    def get_data_from_queue(self) -> list[bytes]:
+    def get_data_from_queue(self) -> memoryview:
         """
-        Get all data from the receive queue.
+        Get all data from the receive buffer.
+
+        The arrival stamps of the drained chunks are dropped, so later
+        stamped reads stay in step.
 
         Returns:
-            List of received data chunks
+            Contiguous view of all received data, valid until the next call
         """
-        data_list = []
-        while not self.receive_queue.empty():
-            try:
-                data = self.receive_queue.get_nowait()
-                data_list.append(data)
-            except queue.Empty:
-                break
-        return data_list
+        data = self.receive_buffer.drain()
+        self._drop_stamps(self.receive_buffer.drained())
+        return data
+
+    def get_stamped_data_from_queue(self) -> tuple[memoryview, list[tuple[int, int]]]:
+        """
+        Get all data from the receive buffer with the arrival time of each chunk in it.
+
+        Returns:
+            Tuple of (contiguous view of all received data, valid until the
+            next call; list of (index in the view, time.monotonic_ns()) for
+            each chunk with bytes in the view, in order)
+        """
+        data = self.receive_buffer.drain()
+        end = self.receive_buffer.drained()
+        start = end - len(data)
+
+        # The first bytes may belong to a chunk that began in the last drain
+        stamps = [(0, self.last_stamp_ns)] if data else []
+        chunk_stamps = self.chunk_stamps
+        while chunk_stamps and chunk_stamps[0][0] < end:
+            offset, stamp_ns = chunk_stamps.popleft()
+            stamps.append((max(offset - start, 0), stamp_ns))
+            self.last_stamp_ns = stamp_ns
+        return data, stamps
 
     def get_total_received(self) -> int:
         """
@@ -565,7 +726,7 @@ class DataReceiver(QThread):
 
     def get_total_dropped(self) -> int:
         """
-        Get total bytes dropped due to queue full.
+        Get total bytes dropped due to buffer full.
 
         Returns:
             Total bytes dropped
@@ -576,13 +737,19 @@ class DataReceiver(QThread):
         """Reset the received bytes counter."""
         self.total_received = 0
         self.total_dropped = 0
+        self._reset_latency_stats()
         self.log.debug("Received bytes counter reset")
 
     def clear_queue(self) -> None:
-        """Clear the receive queue."""
-        while not self.receive_queue.empty():
-            try:
-                self.receive_queue.get_nowait()
-            except queue.Empty:
-                break
-        self.log.debug("Receive queue cleared")
+        """Clear the receive buffer and the arrival stamps of the cleared data."""
+        self.receive_buffer.clear()
+        # Bytes the reader writes from now on follow the cleared position;
+        # one still being written belongs to the last stamp dropped here
+        self._drop_stamps(self.receive_buffer.drained())
+        self.log.debug("Receive buffer cleared")
+
+    def _drop_stamps(self, end: int) -> None:
+        """Drop the stamps of chunks starting before end, keeping the last one's time."""
+        chunk_stamps = self.chunk_stamps
+        while chunk_stamps and chunk_stamps[0][0] < end:
+            self.last_stamp_ns = chunk_stamps.popleft()[1]
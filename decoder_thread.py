@@ -0,0 +1,106 @@
+"""
+Decoder thread module.
+
+This module provides a DecoderThread that runs a protocol decoder on
+received data off the GUI thread.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QThread
+
+import globalvar as gl
+from decoders import Decoder
+from logwrapper import logger
+
+
+class DecoderThread(QThread):
+    """
+    Decodes one port's received blocks in a separate thread.
+
+    The UI timer hands over each drained block with its chunk stamps
+    through a bounded queue and collects the decoded rows on its next
+    tick, the same way it polls the receive buffer, so decoding never
+    blocks the UI and rows need no cross-thread signals.
+    """
+
+    def __init__(self, decoder: Decoder, parent=None) -> None:
+        """
+        Initialize the decoder thread.
+
+        Args:
+            decoder: Protocol decoder to run
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.decoder = decoder
+        self.input_queue: queue.Queue = queue.Queue(gl.DECODER_QUEUE_SIZE)
+        self.rows: deque = deque()  # Appended by this thread, popped by the UI
+        self.total_dropped = 0
+        self.log = logger.logger
+
+    def submit(self, data: bytes, stamps: list[tuple[int, int]]) -> bool:
+        """
+        Queue a received block for decoding.
+
+        Args:
+            data: Received bytes (not a view that will be reused)
+            stamps: (index in data, time.monotonic_ns()) of each chunk in data
+
+        Returns:
+            True if queued, False if the decoder is too far behind
+        """
+        try:
+            self.input_queue.put_nowait((data, stamps))
+            return True
+        except queue.Full:
+            self.total_dropped += len(data)
+            self.log.error(f"{self.decoder.name} decoder is behind, dropped {len(data)} bytes")
+            return False
+
+    def take_rows(self) -> list[tuple[int, bytes, str]]:
+        """
+        Take the rows decoded since the last call.
+
+        Returns:
+            List of (arrival stamp, raw frame, description)
+        """
+        rows = []
+        while self.rows:
+            rows.append(self.rows.popleft())
+        return rows
+
+    def run(self) -> None:
+        """
+        Run the decode loop.
+        """
+        threading.current_thread().name = "DecoderThread"
+        self.log.info(f"{self.decoder.name} decoder thread started")
+        wait_timeout = gl.RECEIVE_WAIT_TIMEOUT_MS / 1000
+
+        while not self.isInterruptionRequested():
+            try:
+                data, stamps = self.input_queue.get(timeout=wait_timeout)
+            except queue.Empty:
+                data = None
+            try:
+                if data is not None:
+                    self.rows.extend(self.decoder.feed(data, stamps))
+                # Frames ended by silence, and partial frames given up on
+                self.rows.extend(self.decoder.poll(time.monotonic_ns()))
+            except Exception as e:
+                # A faulty plugin must not take the thread down
+                self.log.error(f"{self.decoder.name} decoder error: {e}")
+                self.decoder.reset()
+
+        self.log.info(f"{self.decoder.name} decoder thread stopped")
+
+    def stop(self) -> None:
+        """Stop the thread and wait for it."""
+        if self.isRunning():
+            self.requestInterruption()
+            if not self.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                self.log.warning(f"{self.decoder.name} decoder thread may not have stopped properly")
@@ -0,0 +1,415 @@
+"""
+Decoders module.
+
+This module provides the protocol decoder plugin interface and the
+built-in Modbus RTU, SLIP and COBS decoders. Decoders turn the received
+byte stream into rows of (arrival stamp, raw frame, description). It has
+no Qt dependency.
+
+A plugin is a module that subclasses Decoder and registers it:
+
+    from decoders import Decoder, register_decoder
+    from framing import DelimiterAssembler
+
+    @register_decoder
+    class MyDecoder(Decoder):
+        name = "My Protocol"
+
+        def create_assembler(self):
+            return DelimiterAssembler(b"\\r\\n")
+
+        def decode_frame(self, frame: bytes) -> tuple[bool, str]:
+            return True, f"{len(frame)} bytes"
+
+and is listed in gl.DECODER_PLUGINS to be imported at startup.
+"""
+
+import importlib
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+import globalvar as gl
+from checksum import crc16_modbus
+from framing import DelimiterAssembler, FrameAssembler, IdleGapAssembler
+from logwrapper import logger
+
+# Registered decoder classes by name
+DECODERS: dict[str, type["Decoder"]] = {}
+
+
+def register_decoder(cls: type["Decoder"]) -> type["Decoder"]:
+    """
+    Register a decoder class under its name (usable as a class decorator).
+
+    Args:
+        cls: Decoder subclass with a unique name
+
+    Returns:
+        The class
+    """
+    DECODERS[cls.name] = cls
+    return cls
+
+
+def create_decoder(name: str) -> "Decoder":
+    """
+    Create a registered decoder.
+
+    Args:
+        name: Decoder name
+
+    Returns:
+        New decoder instance
+
+    Raises:
+        KeyError: If no decoder is registered under name
+    """
+    return DECODERS[name]()
+
+
+def load_decoder_plugins(modules: Iterable[str] = gl.DECODER_PLUGINS) -> list[str]:
+    """
+    Import plugin modules so they can register their decoders.
+
+    Args:
+        modules: Module names (default: gl.DECODER_PLUGINS)
+
+    Returns:
+        Names of the modules that failed to import
+    """
+    failed = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.logger.error(f"Cannot load decoder plugin {module}: {e}")
+            failed.append(module)
+    return failed
+
+
+class Decoder(ABC):
+    """
+    Base class of protocol decoders.
+
+    A decoder owns a FrameAssembler that cuts the stream into frames and
+    carries partial frames and their arrival stamps across reads; the
+    subclass then describes each frame in decode_frame(). Decoders keep
+    all their state between feed() calls, so data may be split anywhere;
+    poll() completes frames that end in silence and gives up on partial
+    frames the line has left unfinished.
+
+    Attributes:
+        name: Name shown in the decoder menu
+        frames: Frames decoded
+        errors: Frames that failed to decode
+    """
+
+    name = ""
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self.assembler = self.create_assembler()
+        self.frames = 0
+        self.errors = 0
+
+    @abstractmethod
+    def create_assembler(self) -> FrameAssembler:
+        """
+        Create the frame assembler for this protocol.
+
+        Returns:
+            Frame assembler
+        """
+
+    def reset(self) -> None:
+        """Drop partial frames and reset the counters."""
+        self.assembler.reset()
+        self.frames = 0
+        self.errors = 0
+
+    def feed(
+        self, data: bytes, stamps: Optional[list[tuple[int, int]]] = None
+    ) -> list[tuple[int, bytes, str]]:
+        """
+        Decode received bytes.
+
+        Args:
+            data: Received bytes
+            stamps: (index in data, time.monotonic_ns()) of each chunk in data (optional)
+
+        Returns:
+            List of (arrival stamp, raw frame, description) rows
+        """
+        return self._rows(self.assembler.feed(data, stamps))
+
+    def poll(self, now_ns: int) -> list[tuple[int, bytes, str]]:
+        """
+        Decode frames that complete because time passed without data.
+
+        A partial frame is decoded as it is once the line has been silent
+        for gl.DECODER_FLUSH_TIMEOUT_MS, so trailing garbage is reported
+        rather than held back forever.
+
+        Args:
+            now_ns: Current time.monotonic_ns()
+
+        Returns:
+            List of (arrival stamp, raw frame, description) rows
+        """
+        assembler = self.assembler
+        frames = assembler.poll(now_ns)
+        timeout_ns = gl.DECODER_FLUSH_TIMEOUT_MS * 1_000_000
+        if not frames and assembler.pending and now_ns - assembler.last_stamp_ns > timeout_ns:
+            frames = assembler.flush()
+        return self._rows(frames)
+
+    def _rows(self, frames: list[tuple[bytes, int]]) -> list[tuple[int, bytes, str]]:
+        """Decode assembled frames into rows."""
+        rows = []
+        for frame, stamp_ns in frames:
+            if self.skip_frame(frame):
+                continue
+            ok, text = self.decode_frame(frame)
+            self.frames += 1
+            if not ok:
+                self.errors += 1
+                text = f"! {text}"
+            rows.append((stamp_ns, frame, text))
+        return rows
+
+    def skip_frame(self, frame: bytes) -> bool:
+        """
+        Check whether a frame is filler not worth a row, e.g. a lone delimiter.
+
+        Args:
+            frame: Raw frame
+
+        Returns:
+            True to drop the frame silently
+        """
+        return False
+
+    @abstractmethod
+    def decode_frame(self, frame: bytes) -> tuple[bool, str]:
+        """
+        Describe one frame.
+
+        Args:
+            frame: Raw frame as received
+
+        Returns:
+            Tuple of (valid, description)
+        """
+
+
+@register_decoder
+class SlipDecoder(Decoder):
+    """
+    SLIP (RFC 1055): frames end with 0xC0, with 0xC0 and 0xDB escaped as DB DC and DB DD.
+    """
+
+    name = "SLIP"
+    END = b"\xc0"
+    ESC = b"\xdb"
+
+    def create_assembler(self) -> FrameAssembler:
+        return DelimiterAssembler(self.END)
+
+    def skip_frame(self, frame: bytes) -> bool:
+        # Senders often open a frame with END to flush line noise
+        return frame == self.END
+
+    def decode_frame(self, frame: bytes) -> tuple[bool, str]:
+        if not frame.endswith(self.END):
+            return False, f"unterminated frame, {len(frame)} bytes"
+        payload = frame[:-1]
+        if self.ESC in payload:
+            escaped = payload.replace(b"\xdb\xdc", b"").replace(b"\xdb\xdd", b"")
+            if self.ESC in escaped:
+                return False, "invalid escape"
+            payload = payload.replace(b"\xdb\xdc", b"\xc0").replace(b"\xdb\xdd", b"\xdb")
+        return True, f"{len(payload)} bytes: {payload.hex(' ')}"
+
+
+@register_decoder
+class CobsDecoder(Decoder):
+    """
+    COBS: zero-free frames ending with 0x00, each block led by a code byte
+    giving the distance to the next (removed) zero.
+    """
+
+    name = "COBS"
+
+    def create_assembler(self) -> FrameAssembler:
+        return DelimiterAssembler(b"\x00")
+
+    def skip_frame(self, frame: bytes) -> bool:
+        return frame == b"\x00"
+
+    def decode_frame(self, frame: bytes) -> tuple[bool, str]:
+        if not frame.endswith(b"\x00"):
+            return False, f"unterminated frame, {len(frame)} bytes"
+        encoded = frame[:-1]
+        blocks = []
+        pos = 0
+        size = len(encoded)
+        while pos < size:
+            code = encoded[pos]
+            end = pos + code
+            if end > size:
+                return False, "block runs past the end of the frame"
+            blocks.append(encoded[pos + 1:end])
+            # Code 0xFF marks a full block without a zero after it
+            if code < 0xFF and end < size:
+                blocks.append(b"\x00")
+            pos = end
+        payload = b"".join(blocks)
+        return True, f"{len(payload)} bytes: {payload.hex(' ')}"
+
+
+MODBUS_FUNCTIONS = {
+    1: "Read Coils",
+    2: "Read Discrete Inputs",
+    3: "Read Holding Registers",
+    4: "Read Input Registers",
+    5: "Write Single Coil",
+    6: "Write Single Register",
+    15: "Write Multiple Coils",
+    16: "Write Multiple Registers",
+}
+
+MODBUS_EXCEPTIONS = {
+    1: "illegal function",
+    2: "illegal data address",
+    3: "illegal data value",
+    4: "server device failure",
+    5: "acknowledge",
+    6: "server device busy",
+}
+
+
+class ModbusRtuAssembler(IdleGapAssembler):
+    """
+    Cuts Modbus RTU frames at the silent gap that ends each frame.
+
+    The CRC only validates what the gap cut out. Frames read back to back
+    without a visible gap, such as a request and its quick response in
+    one read, are split again where consecutive frames with valid CRCs
+    cover the block exactly; anything else is passed on as one frame for
+    the decoder to reject.
+    """
+
+    def __init__(self, gap_ms: float = gl.MODBUS_IDLE_GAP_MS, max_size: int = gl.MODBUS_MAX_FRAME) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            gap_ms: Silence ending a frame in milliseconds (default: gl.MODBUS_IDLE_GAP_MS)
+            max_size: Largest frame in bytes (default: gl.MODBUS_MAX_FRAME)
+        """
+        super().__init__(gap_ms, max_size)
+
+    def feed(self, data: bytes, stamps: Optional[list[tuple[int, int]]] = None) -> list[tuple[bytes, int]]:
+        return self._split(super().feed(data, stamps))
+
+    def flush(self) -> list[tuple[bytes, int]]:
+        return self._split(super().flush())
+
+    @staticmethod
+    def candidate_lengths(frame: bytes, pos: int) -> list[int]:
+        """
+        Get the frame lengths the function code at a position allows.
+
+        Args:
+            frame: Received bytes
+            pos: Frame start
+
+        Returns:
+            Candidate lengths (request or response), shortest first
+        """
+        available = len(frame) - pos
+        if available < 2:
+            return []
+        function = frame[pos + 1]
+        if function & 0x80:
+            return [5]
+        if function in (1, 2, 3, 4):
+            # Request: address + quantity; response: byte count + data
+            return sorted({8, 5 + frame[pos + 2]}) if available >= 3 else []
+        if function in (5, 6):
+            return [8]
+        if function in (15, 16):
+            return sorted({8, 9 + frame[pos + 6]}) if available >= 7 else []
+        return []
+
+    def _split(self, frames: list[tuple[bytes, int]]) -> list[tuple[bytes, int]]:
+        """Split gap-delimited blocks holding several valid frames."""
+        result = []
+        for frame, stamp_ns in frames:
+            parts = []
+            pos = 0
+            if crc16_modbus(frame):
+                while pos < len(frame):
+                    for length in self.candidate_lengths(frame, pos):
+                        if pos + length <= len(frame) and crc16_modbus(frame[pos:pos + length]) == 0:
+                            parts.append(frame[pos:pos + length])
+                            pos += length
+                            break
+                    else:
+                        break
+            if parts and pos == len(frame):
+                result.extend((part, stamp_ns) for part in parts)
+            else:
+                result.append((frame, stamp_ns))
+        return result
+
+
+@register_decoder
+class ModbusRtuDecoder(Decoder):
+    """
+    Modbus RTU requests, responses and exceptions, checked by CRC-16/MODBUS.
+    """
+
+    name = "Modbus RTU"
+
+    def create_assembler(self) -> FrameAssembler:
+        return ModbusRtuAssembler()
+
+    def decode_frame(self, frame: bytes) -> tuple[bool, str]:
+        if len(frame) < 5 or crc16_modbus(frame):
+            return False, f"invalid frame (CRC), {len(frame)} bytes"
+
+        unit, function = frame[0], frame[1]
+        body = frame[2:-2]
+        if function & 0x80:
+            code = body[0]
+            name = MODBUS_FUNCTIONS.get(function & 0x7F, f"function {function & 0x7F}")
+            return True, (
+                f"unit {unit} {name} exception {code} "
+                f"({MODBUS_EXCEPTIONS.get(code, 'unknown')})"
+            )
+
+        name = MODBUS_FUNCTIONS.get(function, f"function {function}")
+        # An 8-byte read is taken as the request; a response of the same
+        # length (3 data bytes) is only possible for coils and inputs
+        if function in (1, 2, 3, 4) and len(frame) != 8 and len(body) == body[0] + 1:
+            data = body[1:]
+            if function in (3, 4) and len(data) % 2 == 0:
+                values = [int.from_bytes(data[i:i + 2], "big") for i in range(0, len(data), 2)]
+                return True, f"unit {unit} {name} response: {values}"
+            return True, f"unit {unit} {name} response: {data.hex(' ')}"
+        if len(body) >= 4:
+            address = int.from_bytes(body[0:2], "big")
+            value = int.from_bytes(body[2:4], "big")
+            if function == 5:
+                return True, f"unit {unit} {name} {address} {'ON' if value == 0xFF00 else 'OFF'}"
+            if function == 6:
+                return True, f"unit {unit} {name} {address} = {value}"
+            if function == 16 and len(body) > 5:
+                data = body[5:]
+                values = [int.from_bytes(data[i:i + 2], "big") for i in range(0, len(data) - 1, 2)]
+                return True, f"unit {unit} {name} {address} = {values}"
+            if function == 15 and len(body) > 5:
+                return True, f"unit {unit} {name} {address} x{value}: {body[5:].hex(' ')}"
+            return True, f"unit {unit} {name} address {address} quantity {value}"
+        return True, f"unit {unit} {name}: {body.hex(' ')}"
@@ -6,14 +6,13 @@ reading, encoding detection, and JSON processing.
 """
 
 import os
-import string
 from typing import Optional
 
-import chardet
-
+from checksum import CHECKSUMS
 from jsonparser import JsonParser, JsonFlag
-from data_handler import DataConverter
+from data_converter import DataConverter
 from logwrapper import logger
+from scheduler import SendPlan
 
 
 class FileHandler:
@@ -44,6 +43,9 @@ class FileHandler:
         Returns:
             Detected encoding name (default: "utf-8")
         """
+        # chardet is slow to import and only needed for text file sends
+        import chardet
+
         try:
             with open(file_path, "rb") as f:
                 sample_size = min(1024 * 1024, os.path.getsize(file_path))
@@ -112,52 +114,136 @@ class FileHandler:
         self.log.info(f"Successfully read JSON file: {file_path}")
         return True, json_dict
 
-    def process_json_send_data(self, json_data: dict) -> tuple[bool, list[list]]:
+    def compile_send_plan(self, json_data: dict) -> tuple[bool, Optional[SendPlan]]:
         """
-        Process JSON data for sending.
+        Compile JSON send data into an execution plan.
+
+        Only selected items are kept, each encoded to bytes once, so the
+        scheduler does no per-tick lookup or conversion. Repeats and loops
+        are kept as counts and only expanded while sending.
 
         Args:
             json_data: JSON data dictionary with 'cycle_ms', 'hexmode', 'datas'
+                and optionally 'checksum' (default: the one set on the data converter)
 
         Returns:
-            Tuple of (success: bool, send_list: list)
-            send_list format: [[select, hexmode, sent_flag, data_bytes], ...]
+            Tuple of (success: bool, plan: SendPlan or None)
         """
         try:
-            cycle_time = json_data.get("cycle_ms", 0)
-            hex_mode = json_data.get("hexmode", 0)
             datas = json_data.get("datas", [])
-
             if not datas:
                 self.log.warning("No data items in JSON file")
-                return False, []
+                return False, None
+
+            checksum = self._checksum_directive(json_data, self.data_converter.checksum, "script")
+            nodes = self._compile_items(
+                datas, json_data.get("cycle_ms", 0), json_data.get("hexmode", 0), checksum, "datas"
+            )
+            plan = SendPlan(nodes)
+            total = plan.total_steps()
+            self.log.info(
+                f"Compiled JSON send plan: {len(nodes)} top-level items, "
+                f"{'endless' if total is None else total} sends"
+            )
+            return True, plan
+
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.log.error(f"Error processing JSON data: {e}")
+            return False, None
+
+    def _compile_items(
+        self, datas: list, cycle_time: int, hex_mode: int, checksum: str, path: str
+    ) -> list[tuple]:
+        """
+        Compile a list of JSON items and loop blocks into SendPlan nodes.
 
-            send_list = []
+        Items may override the script's cycle_ms, hexmode and checksum with
+        their own delay_ms, hexmode and checksum, and may set repeat. A loop
+        block is {"loop": count, "datas": [...]}, where count 0 loops forever.
+        Items and loop blocks alike are skipped unless select is set.
+        Checksums are appended here, once per item however often it is sent.
 
-            for item in datas:
-                data_str = item.get("data", "")
-                select = item.get("select", 0)
+        Args:
+            datas: JSON items
+            cycle_time: Default delay before each send in milliseconds
+            hex_mode: Default data format (0: text, 1: hex)
+            checksum: Default checksum appended to each item ("" for none)
+            path: Location of datas in the script, for error messages
 
-                if hex_mode:
-                    # Validate and convert hex data
-                    cleaned_data = data_str.replace(" ", "")
-                    if not all(c in string.hexdigits for c in cleaned_data):
-                        self.log.error(f"Invalid hex data: {data_str}")
-                        return False, []
-                    data_bytes = bytes.fromhex(cleaned_data)
-                else:
-                    # Convert text data
-                    data_bytes = data_str.encode(self.data_converter.encoding, "ignore")
+        Returns:
+            List of SendPlan nodes
 
-                # Format: [select, hexmode, sent_flag, data_bytes]
-                send_list.append([select, hex_mode, 0, data_bytes])
+        Raises:
+            ValueError: If an item has invalid data or directives
+        """
+        nodes = []
+        encoding = self.data_converter.encoding
+
+        for index, item in enumerate(datas):
+            where = f"{path}[{index}]"
+            if "loop" in item:
+                count = self._count_directive(item, "loop", 1, 0, where)
+                if not item.get("select", 0):
+                    continue
+                children = self._compile_items(
+                    item.get("datas", []), cycle_time, hex_mode, checksum, f"{where}.datas"
+                )
+                if children:
+                    nodes.append(("loop", count, children))
+                continue
+
+            if not item.get("select", 0):
+                continue
+            data_str = item.get("data", "")
+            delay = self._count_directive(item, "delay_ms", cycle_time, 0, where, allow_float=True)
+            repeat = self._count_directive(item, "repeat", 1, 1, where)
+
+            if item.get("hexmode", hex_mode):
+                # Validate and convert hex data
+                success, data_bytes, error_offset = self.data_converter.parse_hex(data_str)
+                if not success:
+                    raise ValueError(
+                        f"Invalid hex data in {where} at offset {error_offset}: "
+                        f"{data_str[error_offset:error_offset + 16]!r}"
+                    )
+            else:
+                # Convert text data
+                data_bytes = data_str.encode(encoding, "ignore")
+
+            if data_bytes:
+                item_checksum = self._checksum_directive(item, checksum, where)
+                data_bytes = self.data_converter.append_checksum(data_bytes, item_checksum)
+                nodes.append(("send", data_bytes, delay, repeat))
+        return nodes
+
+    def _checksum_directive(self, item: dict, default: str, where: str) -> str:
+        """
+        Read the checksum directive from a JSON item or script.
 
-            self.log.info(f"Processed {len(send_list)} items from JSON")
-            return True, send_list
+        Raises:
+            ValueError: If the checksum is unknown
+        """
+        checksum = item.get("checksum", default)
+        if not isinstance(checksum, str) or (checksum and checksum not in CHECKSUMS):
+            raise ValueError(
+                f"Invalid checksum in {where}: {checksum!r}, expected one of {', '.join(CHECKSUMS)} or \"\""
+            )
+        return checksum
+
+    def _count_directive(
+        self, item: dict, key: str, default: float, minimum: int, where: str, allow_float: bool = False
+    ) -> float:
+        """
+        Read a numeric directive from a JSON item.
 
-        except (KeyError, TypeError, ValueError) as e:
-            self.log.error(f"Error processing JSON data: {e}")
-            return False, []
+        Raises:
+            ValueError: If the value is not a number >= minimum
+        """
+        value = item.get(key, default)
+        types = (int, float) if allow_float else int
+        if isinstance(value, bool) or not isinstance(value, types) or value < minimum:
+            raise ValueError(f"Invalid {key} in {where}: {value!r}, expected a number >= {minimum}")
+        return value
 
     def get_file_type(self, file_path: str) -> str:
         """
@@ -167,7 +253,7 @@ class FileHandler:
             file_path: Path to the file
 
         Returns:
-            File type: "json", "txt", or "unknown"
+            File type: "json", "txt", or "bin"
         """
         basename = os.path.basename(file_path).lower()
         if "json" in basename:
@@ -175,4 +261,4 @@ class FileHandler:
         elif basename.endswith((".txt", ".log")):
             return "txt"
         else:
-            return "unknown"
+            return "bin"
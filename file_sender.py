@@ -0,0 +1,207 @@
+"""
+File sender module.
+
+This module provides a FileSender thread that streams a file to the serial
+port in fixed-size chunks, off the GUI thread.
+"""
+
+import codecs
+import os
+import threading
+import time
+from typing import Optional
+
+from PySide6.QtCore import QThread, Signal
+
+import globalvar as gl
+from data_handler import DataSender
+from file_handler import FileHandler
+from logwrapper import logger
+
+
+class FileSender(QThread):
+    """
+    Streams a file to the serial port in a separate thread.
+
+    Binary files (and text files already in the target encoding) are sent
+    as raw bytes. Text files in another encoding are re-encoded chunk by
+    chunk with incremental codecs, so the whole file is never held in
+    memory. Writes wait while the driver's output queue is above a
+    threshold, so the port paces the sender instead of the sender
+    flooding the driver. A write the transmit thread fails stops the send,
+    and the send only succeeds once the last chunk has been written.
+
+    Signals:
+        progress: (bytes_sent, total_bytes, bytes_per_second, eta_seconds)
+        finished_sending: (success, message)
+    """
+
+    progress = Signal("qint64", "qint64", float, float)
+    finished_sending = Signal(bool, str)
+
+    def __init__(
+        self,
+        data_sender: DataSender,
+        file_path: str,
+        text_mode: bool = False,
+        file_handler: Optional[FileHandler] = None,
+        chunk_size: int = gl.FILE_SEND_CHUNK_SIZE,
+        parent=None,
+    ) -> None:
+        """
+        Initialize the file sender.
+
+        Args:
+            data_sender: Data sender used for writing
+            file_path: Path of the file to send
+            text_mode: Re-encode text to the sender's encoding if needed
+            file_handler: File handler used to detect the text encoding (optional)
+            chunk_size: Bytes read and written per chunk (default: gl.FILE_SEND_CHUNK_SIZE)
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.data_sender = data_sender
+        self.serial_manager = data_sender.serial_manager
+        self.file_path = file_path
+        self.text_mode = text_mode
+        self.file_handler = file_handler or FileHandler(data_sender.data_converter)
+        self.chunk_size = chunk_size
+        self.bytes_sent = 0
+        self.write_errors = 0  # DataSender failed write count when the send started
+        self.log = logger.logger
+
+    def run(self) -> None:
+        """
+        Run the send thread.
+        """
+        threading.current_thread().name = "FileSenderThread"
+        try:
+            success, msg = self._send_file()
+        except (OSError, IOError, LookupError, ValueError) as e:
+            self.log.error(f"Error sending file: {e}")
+            success, msg = False, f"Error sending file: {e}"
+        self.finished_sending.emit(success, msg)
+
+    def _make_transcoder(self) -> Optional[tuple]:
+        """
+        Get an incremental (decoder, encoder) pair if the file needs re-encoding.
+
+        Returns:
+            (decoder, encoder) or None to send raw bytes
+        """
+        if not self.text_mode:
+            return None
+
+        source = self.file_handler.predict_encoding(self.file_path)
+        target = self.data_sender.data_converter.encoding
+        if codecs.lookup(source).name == codecs.lookup(target).name:
+            return None
+
+        self.log.info(f"Re-encoding {self.file_path} from {source} to {target}")
+        decoder = codecs.getincrementaldecoder(source)("replace")
+        encoder = codecs.getincrementalencoder(target)("replace")
+        return decoder, encoder
+
+    def _wait_for_output_space(self) -> bool:
+        """
+        Block while the transmit queue is full or the driver's output queue
+        is above the high-water mark.
+
+        Returns:
+            False if interrupted or the port closed while waiting
+        """
+        while (
+            self.data_sender.is_busy()
+            or self.serial_manager.out_waiting() > gl.FILE_SEND_MAX_OUT_WAITING
+        ):
+            if self.isInterruptionRequested() or not self.serial_manager.is_open():
+                return False
+            self.msleep(1)
+        return True
+
+    def _send_chunk(self, chunk: bytes) -> tuple[bool, str]:
+        """
+        Send one chunk once there is room for it.
+
+        Args:
+            chunk: Bytes to send
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not self._wait_for_output_space():
+            return False, "File send stopped"
+        success, _ = self.data_sender.send_bytes(chunk)
+        if not success or self.data_sender.get_write_errors() != self.write_errors:
+            return False, "Serial write failed"
+        return True, ""
+
+    def _send_file(self) -> tuple[bool, str]:
+        """
+        Stream the file chunk by chunk.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        total = os.path.getsize(self.file_path)
+        transcoder = self._make_transcoder()
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        start = last_report = time.monotonic()
+        self.write_errors = self.data_sender.get_write_errors()
+
+        with open(self.file_path, "rb") as fp:
+            while True:
+                if self.isInterruptionRequested():
+                    return False, "File send cancelled"
+
+                size = fp.readinto(buffer)
+                if not size:
+                    break
+
+                if transcoder is None:
+                    chunk = view[:size]
+                else:
+                    decoder, encoder = transcoder
+                    chunk = encoder.encode(decoder.decode(view[:size]))
+
+                if chunk:
+                    success, msg = self._send_chunk(chunk)
+                    if not success:
+                        return False, msg
+
+                # Progress is measured in file bytes so it matches the total
+                self.bytes_sent += size
+                now = time.monotonic()
+                if now - last_report >= gl.FILE_SEND_PROGRESS_INTERVAL_S:
+                    last_report = now
+                    self._report_progress(total, now - start)
+
+            if transcoder is not None:
+                decoder, encoder = transcoder
+                tail = encoder.encode(decoder.decode(b"", final=True), final=True)
+                if tail:
+                    success, msg = self._send_chunk(tail)
+                    if not success:
+                        return False, msg
+
+        if not self.data_sender.wait_until_written(self.isInterruptionRequested):
+            return False, "File send stopped"
+        if self.data_sender.get_write_errors() != self.write_errors:
+            return False, "Serial write failed"
+
+        self._report_progress(total, time.monotonic() - start)
+        self.log.info(f"Sent file {self.file_path}: {self.bytes_sent} bytes")
+        return True, f"File sent: {self.bytes_sent} bytes"
+
+    def _report_progress(self, total: int, elapsed: float) -> None:
+        """
+        Emit progress with throughput and estimated time remaining.
+
+        Args:
+            total: File size in bytes
+            elapsed: Seconds since the send started
+        """
+        rate = self.bytes_sent / elapsed if elapsed > 0 else 0.0
+        eta = (total - self.bytes_sent) / rate if rate > 0 else 0.0
+        self.progress.emit(self.bytes_sent, total, rate, eta)
@@ -0,0 +1,374 @@
+"""
+Framing module.
+
+This module provides streaming frame assemblers that cut the received byte
+stream into frames: delimiter-terminated, length-prefixed, fixed-size or
+separated by an idle gap on the line. It has no Qt dependency.
+"""
+
+import bisect
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import globalvar as gl
+
+FRAMING_MODES = ("delimiter", "length", "fixed", "gap")
+
+
+class FrameAssembler(ABC):
+    """
+    Cuts a byte stream into frames, carrying partial frames across reads.
+
+    Received blocks are appended to one bytearray, complete frames are cut
+    from its front and the consumed bytes are removed once per feed(), so
+    a frame arriving in many small reads costs linear, not quadratic,
+    copying. Each frame is returned as (payload, stamp_ns) with the
+    arrival stamp of its first byte. A partial frame that grows beyond
+    max_size is emitted as it is, so a missing delimiter cannot hold back
+    the display forever.
+
+    Subclasses implement _frame_ends().
+    """
+
+    def __init__(self, max_size: int = gl.FRAME_MAX_SIZE) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            max_size: Largest frame in bytes (default: gl.FRAME_MAX_SIZE)
+        """
+        self.max_size = max_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop any partial frame and reset the statistics."""
+        self.pending = bytearray()
+        self.pending_stamp_ns = 0  # Arrival of the partial frame's first byte
+        self.last_stamp_ns = 0  # Arrival of the latest chunk
+        self.frames = 0
+        self.frame_bytes = 0
+        self.min_frame = 0
+        self.max_frame = 0
+        self.oversized = 0  # Frames cut at max_size
+        self.errors = 0  # Bytes the framing could not make sense of, emitted as frames
+
+    def feed(self, data: bytes, stamps: Optional[list[tuple[int, int]]] = None) -> list[tuple[bytes, int]]:
+        """
+        Add received bytes and take the frames they complete.
+
+        Args:
+            data: Received bytes
+            stamps: (index in data, time.monotonic_ns()) of each chunk in
+                data, as from DataReceiver.get_stamped_data_from_queue()
+                (optional)
+
+        Returns:
+            List of (payload, arrival stamp of its first byte)
+        """
+        stamps = stamps or []
+        buffer = self.pending
+        base = len(buffer)
+        buffer += data
+        if stamps:
+            self.last_stamp_ns = stamps[-1][1]
+        indexes = [index + base for index, _ in stamps]
+
+        def stamp_at(pos: int) -> int:
+            if pos < base or not stamps:
+                return self.pending_stamp_ns if pos < base else self.last_stamp_ns
+            return stamps[max(bisect.bisect_right(indexes, pos) - 1, 0)][1]
+
+        frames = []
+        start = 0
+        for end in self._frame_ends(buffer, base, indexes, stamps):
+            frames.append(self._take(buffer, start, end, stamp_at(start)))
+            start = end
+        while len(buffer) - start > self.max_size:
+            self.oversized += 1
+            frames.append(self._take(buffer, start, start + self.max_size, stamp_at(start)))
+            start += self.max_size
+
+        if start:
+            self.pending_stamp_ns = stamp_at(start)
+            del buffer[:start]
+            self._consumed(start)
+        elif not base:
+            self.pending_stamp_ns = stamp_at(0)
+        return frames
+
+    def poll(self, now_ns: int) -> list[tuple[bytes, int]]:
+        """
+        Take frames that complete because time passed without data.
+
+        Args:
+            now_ns: Current time.monotonic_ns()
+
+        Returns:
+            List of (payload, arrival stamp of its first byte)
+        """
+        return []
+
+    def flush(self) -> list[tuple[bytes, int]]:
+        """
+        Take the partial frame as a frame of its own.
+
+        Returns:
+            List with the partial frame, or an empty list
+        """
+        if not self.pending:
+            return []
+        frame = self._take(self.pending, 0, len(self.pending), self.pending_stamp_ns)
+        self.pending.clear()
+        self._consumed(len(frame[0]))
+        return [frame]
+
+    def _take(self, buffer: bytearray, start: int, end: int, stamp_ns: int) -> tuple[bytes, int]:
+        """Copy a frame out of the buffer and count it."""
+        payload = bytes(buffer[start:end])
+        size = end - start
+        self.min_frame = min(self.min_frame, size) if self.frames else size
+        self.max_frame = max(self.max_frame, size)
+        self.frames += 1
+        self.frame_bytes += size
+        return payload, stamp_ns
+
+    @abstractmethod
+    def _frame_ends(
+        self, buffer: bytearray, base: int, indexes: list[int], stamps: list[tuple[int, int]]
+    ) -> list[int]:
+        """
+        Find where complete frames end.
+
+        Args:
+            buffer: Partial frame followed by the new bytes
+            base: Length of the partial frame, i.e. where the new bytes start
+            indexes: Buffer index of each chunk in the new bytes
+            stamps: (index in the new bytes, time.monotonic_ns()) of each chunk
+
+        Returns:
+            Ascending end offsets (exclusive) of the complete frames
+        """
+
+    def _consumed(self, size: int) -> None:
+        """Called after size bytes were removed from the front of the buffer."""
+
+    def get_stats(self) -> dict:
+        """
+        Get frame statistics.
+
+        Returns:
+            Dictionary with frames, bytes, min_size, avg_size, max_size,
+            oversized, errors and pending (bytes of the partial frame)
+        """
+        return {
+            "frames": self.frames,
+            "bytes": self.frame_bytes,
+            "min_size": self.min_frame,
+            "avg_size": self.frame_bytes / self.frames if self.frames else 0.0,
+            "max_size": self.max_frame,
+            "oversized": self.oversized,
+            "errors": self.errors,
+            "pending": len(self.pending),
+        }
+
+
+class DelimiterAssembler(FrameAssembler):
+    """
+    Frames end with a delimiter, e.g. b"\\n" or b"\\r\\n"; the delimiter stays in the frame.
+
+    The search resumes where the previous one stopped, so bytes of a long
+    partial frame are scanned once rather than on every read.
+    """
+
+    def __init__(self, delimiter: bytes = b"\n", max_size: int = gl.FRAME_MAX_SIZE) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            delimiter: Bytes ending each frame (default: b"\\n")
+            max_size: Largest frame in bytes (default: gl.FRAME_MAX_SIZE)
+
+        Raises:
+            ValueError: If the delimiter is empty
+        """
+        if not delimiter:
+            raise ValueError("Frame delimiter must not be empty")
+        self.delimiter = bytes(delimiter)
+        super().__init__(max_size)
+
+    def reset(self) -> None:
+        super().reset()
+        self.scan_from = 0
+
+    def _frame_ends(self, buffer, base, indexes, stamps) -> list[int]:
+        ends = []
+        delimiter = self.delimiter
+        pos = buffer.find(delimiter, self.scan_from)
+        while pos >= 0:
+            pos += len(delimiter)
+            ends.append(pos)
+            pos = buffer.find(delimiter, pos)
+        # A delimiter may straddle this block and the next one
+        self.scan_from = max(ends[-1] if ends else 0, len(buffer) - len(delimiter) + 1)
+        return ends
+
+    def _consumed(self, size: int) -> None:
+        self.scan_from = max(self.scan_from - size, 0)
+
+
+class LengthPrefixAssembler(FrameAssembler):
+    """
+    Frames carry their length in a header field.
+
+    A frame is offset bytes of header, a size-byte length field, then
+    length + adjust more bytes; adjust covers trailers such as a CRC (or
+    is negative if the length counts the header too). A length that gives
+    a frame below one byte or above max_size means the stream is out of
+    step: the rest of the buffer is emitted as one error frame and
+    framing starts again with the next bytes.
+    """
+
+    def __init__(
+        self,
+        offset: int = 0,
+        size: int = 1,
+        byteorder: str = "big",
+        adjust: int = 0,
+        max_size: int = gl.FRAME_MAX_SIZE,
+    ) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            offset: Header bytes before the length field (default: 0)
+            size: Length field size in bytes, 1, 2 or 4 (default: 1)
+            byteorder: "big" or "little" (default: "big")
+            adjust: Bytes to add to the length (default: 0)
+            max_size: Largest frame in bytes (default: gl.FRAME_MAX_SIZE)
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if offset < 0 or size not in (1, 2, 4) or byteorder not in ("big", "little"):
+            raise ValueError("Length field needs offset >= 0, size 1, 2 or 4 and byte order big or little")
+        self.offset = offset
+        self.size = size
+        self.byteorder = byteorder
+        self.adjust = adjust
+        super().__init__(max_size)
+
+    def _frame_ends(self, buffer, base, indexes, stamps) -> list[int]:
+        ends = []
+        pos = 0
+        header = self.offset + self.size
+        while len(buffer) - pos >= header:
+            field = buffer[pos + self.offset:pos + header]
+            total = header + int.from_bytes(field, self.byteorder) + self.adjust
+            if not 0 < total <= self.max_size:
+                self.errors += 1
+                ends.append(len(buffer))
+                break
+            if len(buffer) - pos < total:
+                break
+            pos += total
+            ends.append(pos)
+        return ends
+
+
+class FixedSizeAssembler(FrameAssembler):
+    """Frames are a fixed number of bytes."""
+
+    def __init__(self, frame_size: int = 16, max_size: int = gl.FRAME_MAX_SIZE) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            frame_size: Bytes per frame (default: 16)
+            max_size: Largest frame in bytes (default: gl.FRAME_MAX_SIZE)
+
+        Raises:
+            ValueError: If frame_size is not between 1 and max_size
+        """
+        if not 0 < frame_size <= max_size:
+            raise ValueError(f"Frame size must be between 1 and {max_size}")
+        self.frame_size = frame_size
+        super().__init__(max_size)
+
+    def _frame_ends(self, buffer, base, indexes, stamps) -> list[int]:
+        return list(range(self.frame_size, len(buffer) + 1, self.frame_size))
+
+
+class IdleGapAssembler(FrameAssembler):
+    """
+    Frames are separated by a silent gap on the line, as in Modbus RTU.
+
+    Gaps are measured between the arrival stamps of received chunks, so
+    frames split exactly where the reader saw the line go quiet however
+    late the bytes are processed. The last frame completes in poll() once
+    the line has been quiet for the gap.
+    """
+
+    def __init__(self, gap_ms: float = 20, max_size: int = gl.FRAME_MAX_SIZE) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            gap_ms: Silence ending a frame in milliseconds (default: 20)
+            max_size: Largest frame in bytes (default: gl.FRAME_MAX_SIZE)
+
+        Raises:
+            ValueError: If gap_ms is not positive
+        """
+        if gap_ms <= 0:
+            raise ValueError("Idle gap must be greater than 0 ms")
+        self.gap_ns = int(gap_ms * 1_000_000)
+        super().__init__(max_size)
+
+    def reset(self) -> None:
+        super().reset()
+        self.previous_stamp_ns = 0  # Arrival of the chunk before the current one
+
+    def _frame_ends(self, buffer, base, indexes, stamps) -> list[int]:
+        ends = []
+        previous = self.previous_stamp_ns
+        for index, (_, stamp_ns) in zip(indexes, stamps):
+            if index and previous and stamp_ns - previous > self.gap_ns:
+                ends.append(index)
+            previous = stamp_ns
+        self.previous_stamp_ns = previous
+        return ends
+
+    def poll(self, now_ns: int) -> list[tuple[bytes, int]]:
+        if self.pending and now_ns - self.last_stamp_ns > self.gap_ns:
+            return self.flush()
+        return []
+
+
+def build_assembler(mode: str, param: str) -> FrameAssembler:
+    """
+    Create an assembler from a mode and its parameter as typed by the user.
+
+    Args:
+        mode: One of FRAMING_MODES
+        param: "delimiter": delimiter as hex, e.g. "0D 0A";
+            "length": "offset,size,byteorder,adjust", e.g. "2,1,big,2";
+            "fixed": bytes per frame; "gap": idle gap in ms
+
+    Returns:
+        The frame assembler
+
+    Raises:
+        ValueError: If the mode is unknown or the parameter is invalid
+    """
+    if mode == "delimiter":
+        return DelimiterAssembler(bytes.fromhex(param))
+    if mode == "length":
+        fields = [field.strip() for field in param.split(",")]
+        if len(fields) != 4:
+            raise ValueError("Length prefix needs offset,size,byteorder,adjust")
+        return LengthPrefixAssembler(int(fields[0]), int(fields[1]), fields[2].lower(), int(fields[3]))
+    if mode == "fixed":
+        return FixedSizeAssembler(int(param))
+    if mode == "gap":
+        return IdleGapAssembler(float(param))
+    raise ValueError(f"Unknown framing mode: {mode}")
@@ -31,6 +31,15 @@ SERIAL_INFO = {
     "timeout": 0.01,
 }
 
+# Serial settings of a new port session, as combo box texts
+SESSION_DEFAULT_SETTINGS = {"baudrate": "115200", "bytesize": "8", "stopbit": "1", "paritybit": "None"}
+
+# Port discovery constants
+PORT_WATCH_DIR = "/dev"  # watched with inotify on Linux
+PORT_WATCH_PATTERNS = ("ttyS*", "ttyUSB*", "ttyXRUSB*", "ttyACM*", "ttyAMA*", "rfcomm*", "ttyAP*")
+PORT_WATCH_SETTLE_MS = 50  # wait for a burst of device node changes to finish
+PORT_POLL_INTERVAL_MS = 2000  # rescan interval where inotify is unavailable
+
 # About dialog information
 ABOUT_INFO = f"""
     Project: {GUI_INFO["proj"]}
@@ -44,6 +53,25 @@ ABOUT_INFO = f"""
 GUIDE_INFO = """
     Encoding: the default encoding is gbk, plese change in the settings menu if needed.
 
+    Ports: several ports can be open at once. Selecting a port in the port list shows its settings,
+        received datas and counters; the other ports keep receiving and sending in the background.
+        Besides the byte counters, the status bar shows the transmit queue depth and the average/max time of
+        a serial write in ms once something has been sent, and the average/max jitter of a running cycle send.
+
+    Receive:
+        HexMode shows the received datas as hex, Save writes the whole session to a text file.
+        Record streams the raw received bytes straight to a file, independent of the display.
+        Time prefixes each line (each row in HexMode) with the arrival time of its first byte in ms or µs;
+        recordings then also get a .idx file with the arrival time of every received chunk.
+        Receive Framing in the settings menu shows one line per frame, cut by a delimiter, a length field,
+        a fixed size or an idle gap on the line; the status bar counts the frames, shows their min/avg/max size
+        and counts invalid length fields and frames cut at the maximum size.
+        Receive Decoder in the settings menu decodes Modbus RTU, SLIP or COBS in the background and shows
+        each frame as a row of raw bytes and decoded fields; rows starting with ! are invalid frames.
+
+    Send Checksum: Send Checksum in the settings menu appends Sum8, XOR8, CRC-8, CRC-16/MODBUS, CRC-16/CCITT
+        or CRC-32 to every single, multi and json file send, before the newline.
+
     Single Send: 
         Send the datas directly with Send button, or send the datas with a cycle time.
 
@@ -51,16 +79,67 @@ GUIDE_INFO = """
         Send each data item directly with its Send button, or send the selected items one by one with a cycle time.
 
     File Send:
-        Support txt file and json file.
-        1. for txt file: just send the file contents directly with Send button.
+        Support txt file, json file and any other file as binary.
+        1. for txt file: send the file contents in the background with Send button, click Stop to cancel.
+           other files are sent as raw bytes without any encoding conversion.
         2. for json file: it is similar to multi send function, user can customize the datas and cycle time.
         check the details in demo_txt_data.json or demo_hex_data.json, the meaning of the tags in them as below.
         cycle_ms tag: 0: send the selected items directly; 1000: send the selected items one by one with a cycle time.
         hexmode tag: 0: send the selected items as txt contents; 1: send the selected items as hex contents.
+        hex datas may be separated by spaces, commas or newlines, and may use 0x prefixes, e.g. "0x01, 0x02".
         select tag: 0: the data is not selected to be sent; 1: the data is selected to be sent.
+        an item or loop block without a select tag is not sent.
+        optional item tags: delay_ms: delay before this item instead of cycle_ms; repeat: send this item n times;
+        hexmode: override the file's hexmode for this item.
+        checksum tag (in the file or an item): checksum appended to the datas, e.g. "CRC-16/MODBUS", "" for none;
+        without it the Send Checksum setting is used.
+        loop block: {"loop": n, "select": 1, "datas": [...]} sends the items inside n times, 0 loops until stopped,
+        see demo_soak_profile.json for a 10 minute traffic profile.
 """
 
+# Receive display constants
+RECEIVE_SCROLLBACK_LINES = 10000  # lines kept in the receive view
+RECEIVE_SCROLLBACK_CHARS = 2 * 1024 * 1024  # characters kept in the receive view
+RECEIVE_HEXDUMP_WIDTH = 16  # bytes per hexdump row in receive hex mode (16 or 32)
+RECEIVE_SPOOL_CONVERT_CHUNK = 1024 * 1024  # spool bytes converted at a time on a display mode change
+# Receive timestamp options and their digits after the seconds
+RECEIVE_TIMESTAMP_OPTIONS = {"Time: off": 0, "Time: ms": 3, "Time: µs": 6}
+
+# Receive framing constants
+FRAME_MAX_SIZE = 64 * 1024  # longer partial frames are emitted as they are
+FRAMING_DEFAULT_PARAMS = {"delimiter": "0A", "length": "0,1,big,0", "fixed": "16", "gap": "20"}
+
+# Receive decoder constants
+DECODER_PLUGINS: tuple = ()  # modules imported at startup that register more decoders
+DECODER_QUEUE_SIZE = 256  # drained blocks waiting for a port's decoder thread
+DECODER_FLUSH_TIMEOUT_MS = 1000  # a partial frame silent this long is decoded as it is
+MODBUS_MAX_FRAME = 256  # largest Modbus RTU frame (ADU) in bytes
+MODBUS_IDLE_GAP_MS = 4  # silence ending a Modbus RTU frame, 3.5 characters at 9600 baud
+
+# Capture (record to disk) constants
+CAPTURE_BUFFER_SIZE = 1024 * 1024  # write buffer in bytes
+CAPTURE_FSYNC_INTERVAL_S = 1.0  # seconds between flush+fsync
+CAPTURE_TIMESTAMP_INDEX = True  # write a .idx file of chunk arrival times next to captures
+
+# File send constants
+FILE_SEND_CHUNK_SIZE = 64 * 1024  # bytes read and written per chunk
+FILE_SEND_MAX_OUT_WAITING = 16 * 1024  # pause while the driver holds more than this
+FILE_SEND_PROGRESS_INTERVAL_S = 0.2  # seconds between progress updates
+
+# Cycle send scheduler constants
+SCHEDULER_SPIN_S = 0.002  # yield-spin this long before each deadline instead of sleeping
+SCHEDULER_MAX_SLEEP_S = 0.05  # longest single sleep, bounds stop reaction time
+SCHEDULER_JITTER_SAMPLES = 100000  # recent sends kept for the p99 jitter
+
 # Thread and queue constants
-RECEIVE_QUEUE_SIZE = 50
+TRANSMIT_QUEUE_SIZE = 64  # frames waiting for the transmit thread
+RECEIVE_BUFFER_SIZE_MB = 1  # receive ring buffer per port, drained every 100 ms
+RECEIVE_EVENT_DRIVEN = True  # block on the port fd instead of sleep polling
+RECEIVE_WAIT_TIMEOUT_MS = 100  # max block time, bounds close/stop reaction time
+RECEIVE_POLL_INTERVAL_MS = 10  # sleep between reads in polling mode
+RECEIVE_SHARED_READER = True  # one selector thread reads all ports (POSIX only)
+RECEIVE_READ_CHUNK = 64 * 1024  # max bytes per read from a readable port
+RECEIVE_STAMP_QUEUE_SIZE = 64 * 1024  # chunk arrival stamps kept between drains
+ASYNC_WRITE_HIGH_WATER = 64 * 1024  # asyncio transport pauses writers above this
 THREAD_WAIT_TIMEOUT_MS = 500
 MAX_MULTI_SEND_CHANNELS = 6
@@ -0,0 +1,125 @@
+"""
+Hexdump module.
+
+This module provides a streaming hexdump renderer for the receive view:
+an offset column, fixed-width rows of hex bytes and an ASCII gutter. It
+has no Qt dependency.
+"""
+
+import re
+from typing import Callable, Optional
+
+import globalvar as gl
+
+# Printable ASCII maps to itself, everything else to "."
+ASCII_TABLE = bytes(b if 0x20 <= b < 0x7F else ord(".") for b in range(256))
+HEXDUMP_LINE = re.compile(r"^(?:\[[^\]]*\] )?[0-9a-f]{8,}  ((?:[0-9a-f]{2} ?)*?) *  \|")
+
+
+class HexDumper:
+    """
+    Renders received bytes as hexdump rows, continuing across chunks.
+
+        00000000  48 65 6c 6c 6f 2c 20 50 79 43 4f 4d 0d 0a 00 ff  |Hello, PyCOM....|
+
+    The whole chunk is converted in one bytes.hex() call and one
+    bytes.translate() through a 256-entry table, and rows are cut from
+    those two strings by slicing, so Python-level work is one format per
+    row however large the burst. A trailing partial row is shown at once;
+    the next chunk re-renders it as part of the full row and reports how
+    many characters of the view to replace. Rows may be prefixed with a
+    label, such as the arrival time of their first byte.
+    """
+
+    def __init__(self, width: int = gl.RECEIVE_HEXDUMP_WIDTH) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            width: Bytes per row, e.g. 16 or 32 (default: gl.RECEIVE_HEXDUMP_WIDTH)
+        """
+        self.width = width
+        self.reset()
+
+    def reset(self) -> None:
+        """Start again at offset 0 with no partial row."""
+        self.offset = 0  # Offset of the first byte of the pending row
+        self.pending = b""  # Bytes of the partial last row already shown
+        self.pending_chars = 0  # Characters the partial row occupies in the view
+        self.pending_label = ""  # Label of the partial row
+
+    def render(self, data: bytes, label: Optional[Callable[[int], str]] = None) -> tuple[str, int]:
+        """
+        Render a chunk, completing the partial row shown last time.
+
+        Args:
+            data: Received bytes
+            label: Function returning the prefix of a row starting at a
+                byte index in data (optional)
+
+        Returns:
+            Tuple of (text to append, characters at the end of the view to
+            replace with it first)
+        """
+        replace = self.pending_chars
+        carried = len(self.pending)
+        data = self.pending + bytes(data)
+        width = self.width
+        hex_width = width * 3
+
+        # One C-level pass each for the hex and ASCII columns; a trailing
+        # space makes every byte exactly three characters wide
+        hex_text = data.hex(" ") + " "
+        ascii_text = data.translate(ASCII_TABLE).decode("ascii")
+        full = len(data) // width * width
+        offset = self.offset
+        if label is None:
+            rows = [
+                f"{offset + i:08x}  {hex_text[i * 3:i * 3 + hex_width]} |{ascii_text[i:i + width]}|\n"
+                for i in range(0, full, width)
+            ]
+        else:
+            # A carried partial row keeps the label it was first shown with
+            labels = [
+                self.pending_label if carried and not i else label(i - carried)
+                for i in range(0, len(data), width)
+            ]
+            rows = [
+                f"{labels[i // width]}{offset + i:08x}  "
+                f"{hex_text[i * 3:i * 3 + hex_width]} |{ascii_text[i:i + width]}|\n"
+                for i in range(0, full, width)
+            ]
+
+        self.offset = offset + full
+        self.pending = bytes(data[full:])
+        if self.pending:
+            self.pending_label = labels[-1] if label is not None else ""
+            tail = (
+                f"{self.pending_label}{self.offset:08x}  {hex_text[full * 3:].ljust(hex_width)} "
+                f"|{ascii_text[full:].ljust(width)}|\n"
+            )
+            rows.append(tail)
+            self.pending_chars = len(tail)
+        else:
+            self.pending_chars = 0
+        return "".join(rows), replace
+
+    def parse(self, text: str) -> Optional[bytes]:
+        """
+        Recover the bytes from rendered hexdump text.
+
+        Args:
+            text: Hexdump text, e.g. the receive view's contents
+
+        Returns:
+            The bytes, or None if a line is not a hexdump row
+        """
+        chunks = []
+        for line in text.splitlines():
+            if not line:
+                continue
+            match = HEXDUMP_LINE.match(line)
+            if match is None:
+                return None
+            chunks.append(bytes.fromhex(match.group(1)))
+        return b"".join(chunks)
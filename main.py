@@ -1,26 +1,37 @@
+import codecs
+import itertools
 import os
 import platform
 import sys
-from typing import Dict, List, Optional, Any
+import time
+from functools import partial
+from typing import Dict, Iterable, Optional
 
 from PySide6.QtCore import QEvent, QObject, QTimer, Qt
-from PySide6.QtGui import QCloseEvent, QIcon, QIntValidator, QKeyEvent, QTextCursor
+from PySide6.QtGui import QAction, QCloseEvent, QIcon, QIntValidator, QKeyEvent, QTextCursor
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
+    QComboBox,
     QFileDialog,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QWidget,
 )
 
-from about import About
+from cycle_sender import CycleSender
+import decoders
 import globalvar as gl
-from serial_manager import SerialManager
-from data_handler import DataConverter, DataSender, DataReceiver
-from file_handler import FileHandler
+from file_sender import FileSender
+from framing import build_assembler
 from logwrapper import logger
+from port_watcher import PortWatcher
+from port_session import PortSession
+from reader_engine import ReaderEngine
+from timestamps import stamp_labeler
 from togglebt import ToggleButton
 from ui.mainwindow_ui import Ui_MainWindow
 
@@ -35,10 +46,11 @@ class MainWindow(QMainWindow):
         self.log.info("PyCOM application starting")
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
-        self.about = About()
+        self.about: Optional[QWidget] = None  # Built on first use
         self.initialize_variables()
         self.initialize_gui()
-        self.scan_serial_ports()
+        # Enumerate and watch ports in the background so the window shows at once
+        self.port_watcher.start()
 
     def initialize_variables(self) -> None:
         """
@@ -47,27 +59,31 @@ class MainWindow(QMainWindow):
         # Initialize received data file path
         self.received_data_file: str = ""
 
-        # Initialize data structures for sending
-        self.multi_dict: Dict[str, List[int]] = {}  # {"m1": [is_checked, is_sent]}
-        self.json_send_list: List[List[Any]] = []  # [selected, cycle_ms, sent, data]
-
-        # Initialize core components
-        self.message_box: QMessageBox = QMessageBox()
-        self.serial_manager: SerialManager = SerialManager()
-        self.data_converter: DataConverter = DataConverter("gbk")  # Default encoding
-        self.data_sender: DataSender = DataSender(self.serial_manager, self.data_converter)
-        self.file_handler: FileHandler = FileHandler(self.data_converter)
-
-        # Initialize and start the receive thread
-        self.data_receiver: DataReceiver = DataReceiver(self.serial_manager, self)
-        self.data_receiver.port_closed.connect(self._post_close_port)
-        self.data_receiver.start()
+        # Initialize core components. Only the static QMessageBox helpers
+        # are used, so no message box widget is built up front.
+        self.message_box = QMessageBox
+        self.encoding: str = "gbk"  # Default encoding, shared by all ports
+        self.checksum: str = ""  # Checksum appended to sent payloads, shared by all ports
+        self.framing_params: Dict[str, str] = dict(gl.FRAMING_DEFAULT_PARAMS)  # Last typed per mode
+
+        # One reader thread for all ports where the OS can multiplex them
+        self.reader_engine: Optional[ReaderEngine] = None
+        if gl.RECEIVE_SHARED_READER and ReaderEngine.is_supported():
+            self.reader_engine = ReaderEngine(self)
+            self.reader_engine.start()
+
+        # Port enumeration and hotplug detection run off the GUI thread
+        self.port_watcher: PortWatcher = PortWatcher(self)
+        self.port_watcher.ports_changed.connect(self._update_port_list)
+        self.port_watcher.scan_finished.connect(self._post_port_scan)
+
+        # Initialize port sessions, one per port; the UI shows self.session.
+        # The first session is a placeholder until a port is selected.
+        self.sessions: Dict[str, PortSession] = {}
+        self.session: PortSession
+        self._switching_session: bool = False
 
         # Initialize timers
-        self.send_timer: QTimer = QTimer()
-        self.send_timer.timeout.connect(self._timer_data_send)
-        self.file_send_timer: QTimer = QTimer()
-        self.file_send_timer.timeout.connect(self._timer_json_file_data_send)
         self.receive_update_timer: QTimer = QTimer()
         self.receive_update_timer.timeout.connect(self._update_receive_ui)
         self.receive_update_timer.start(100)  # Update receive UI every 100ms
@@ -75,7 +91,11 @@ class MainWindow(QMainWindow):
         # Initialize keyboard limits for hex mode input validation
         self.key_limits: set = {
             *[getattr(Qt.Key, f"Key_{c}") for c in "0123456789ABCDEF"],
+            Qt.Key.Key_X,
             Qt.Key.Key_Space,
+            Qt.Key.Key_Comma,
+            Qt.Key.Key_Return,
+            Qt.Key.Key_Enter,
             Qt.Key.Key_Backspace,
             Qt.Key.Key_Delete,
             Qt.Key.Key_Right,
@@ -89,8 +109,9 @@ class MainWindow(QMainWindow):
             Qt.Key.Key_Shift,
         }
 
-        # Initialize status bar label
+        # Initialize status bar labels
         self.label_rwsize: QLabel
+        self.label_fprogress: QLabel
 
     def initialize_gui(self) -> None:
         """
@@ -113,6 +134,15 @@ class MainWindow(QMainWindow):
         Set up window title and icon.
         """
         self.setWindowTitle(f"{gl.GUI_INFO['proj']} {gl.GUI_INFO['version']}")
+        # Register the embedded images once the window is up
+        QTimer.singleShot(0, self._load_window_icon)
+
+    def _load_window_icon(self) -> None:
+        """
+        Load the Qt resources and set the window icon.
+        """
+        import resrc.resource_rc  # Registers the embedded images with Qt
+
         self.setWindowIcon(QIcon(":/icons/pycom"))
 
     def _setup_toggle_button(self) -> None:
@@ -142,28 +172,85 @@ class MainWindow(QMainWindow):
         self.ui.actionASCII.triggered.connect(lambda: self.action_encoding("ascii"))
         self.ui.actionUTF_8.triggered.connect(lambda: self.action_encoding("utf-8"))
         self.ui.actionGBK_GB2312.triggered.connect(lambda: self.action_encoding("gbk"))
+        for mode, action in self._framing_actions().items():
+            action.triggered.connect(partial(self.action_framing, mode))
+        self._setup_decoder_menu()
+        self._setup_checksum_menu()
+
+    def _setup_decoder_menu(self) -> None:
+        """
+        Connect the receive decoder menu, adding an entry for each plugin decoder.
+        """
+        decoders.load_decoder_plugins()
+        self.decoder_actions: Dict[str, QAction] = {
+            "": self.ui.actionDecoder_Off,
+            "Modbus RTU": self.ui.actionDecoder_Modbus_RTU,
+            "SLIP": self.ui.actionDecoder_SLIP,
+            "COBS": self.ui.actionDecoder_COBS,
+        }
+        for name in decoders.DECODERS:
+            if name not in self.decoder_actions:
+                action = self.ui.menuDecoder.addAction(name)
+                action.setCheckable(True)
+                self.decoder_actions[name] = action
+        for name, action in self.decoder_actions.items():
+            action.triggered.connect(partial(self.action_decoder, name))
+
+    def _setup_checksum_menu(self) -> None:
+        """
+        Connect the send checksum menu.
+        """
+        self.checksum_actions: Dict[str, QAction] = {
+            "": self.ui.actionChecksum_None,
+            "Sum8": self.ui.actionChecksum_Sum8,
+            "XOR8": self.ui.actionChecksum_XOR8,
+            "CRC-8": self.ui.actionChecksum_CRC_8,
+            "CRC-16/MODBUS": self.ui.actionChecksum_CRC_16_MODBUS,
+            "CRC-16/CCITT": self.ui.actionChecksum_CRC_16_CCITT,
+            "CRC-32": self.ui.actionChecksum_CRC_32,
+        }
+        for name, action in self.checksum_actions.items():
+            action.triggered.connect(partial(self.action_checksum, name))
 
     def _setup_serial_controls(self) -> None:
         """
         Set up serial port controls.
         """
-        self.ui.comboBox_BRate.addItems(gl.SERIAL_INFO["baudrate"])
-        self.ui.comboBox_BRate.setCurrentText("115200")
-        self.ui.comboBox_BSize.addItems(gl.SERIAL_INFO["bytesize"])
-        self.ui.comboBox_BSize.setCurrentText("8")
-        self.ui.comboBox_SBit.addItems(gl.SERIAL_INFO["stopbit"])
-        self.ui.comboBox_SBit.setCurrentText("1")
-        self.ui.comboBox_PBit.addItems(gl.SERIAL_INFO["paritybit"])
-        self.ui.comboBox_PBit.setCurrentText("None")
+        for key, combo in self._serial_setting_combos().items():
+            combo.addItems(gl.SERIAL_INFO[key])
+            combo.setCurrentText(gl.SESSION_DEFAULT_SETTINGS[key])
         self.ui.pushButton_Check.clicked.connect(self.scan_serial_ports)
+        self.ui.comboBox_SPort.currentTextChanged.connect(self.switch_session)
+
+    def _serial_setting_combos(self) -> Dict[str, QComboBox]:
+        """
+        Get the serial setting combo boxes by settings key.
+        """
+        return {
+            "baudrate": self.ui.comboBox_BRate,
+            "bytesize": self.ui.comboBox_BSize,
+            "stopbit": self.ui.comboBox_SBit,
+            "paritybit": self.ui.comboBox_PBit,
+        }
+
+    def _read_serial_settings(self) -> Dict[str, str]:
+        """
+        Get the serial settings shown in the UI.
+        """
+        return {key: combo.currentText() for key, combo in self._serial_setting_combos().items()}
 
     def _setup_receive_controls(self) -> None:
         """
         Set up receive options controls.
         """
+        self.session = self._create_session("")
+        self.session.receive_view.attach()
         self.ui.pushButton_RClear.clicked.connect(self.receive_clear)
         self.ui.pushButton_RSave.clicked.connect(self.receive_save)
         self.ui.checkBox_RHexmode.clicked.connect(self.set_receive_hex_mode)
+        self.ui.checkBox_RRecord.clicked.connect(self.set_receive_record_mode)
+        self.ui.comboBox_RTime.addItems(list(gl.RECEIVE_TIMESTAMP_OPTIONS))
+        self.ui.comboBox_RTime.currentTextChanged.connect(self.set_receive_timestamp)
 
     def _setup_single_send_controls(self) -> None:
         """
@@ -207,6 +294,10 @@ class MainWindow(QMainWindow):
         """
         Set up status bar with data size information.
         """
+        self.label_fprogress = QLabel("")
+        self.label_fprogress.setStyleSheet("color:blue")
+        self.label_fprogress.hide()
+        self.ui.statusbar.addPermanentWidget(self.label_fprogress, stretch=0)
         self.label_rwsize = QLabel("")
         self.label_rwsize.setStyleSheet("color:blue")
         self.ui.statusbar.addPermanentWidget(self.label_rwsize, stretch=0)
@@ -223,7 +314,7 @@ class MainWindow(QMainWindow):
         """
         # Remove any existing temporary messages
         for widget in self.ui.statusbar.findChildren(QLabel):
-            if widget not in [self.label_rwsize]:
+            if widget not in [self.label_rwsize, self.label_fprogress]:
                 widget.deleteLater()
 
         # Create and add the message label
@@ -237,26 +328,152 @@ class MainWindow(QMainWindow):
 
     ########################## port function ############################
 
-    def scan_serial_ports(self) -> bool:
+    def scan_serial_ports(self) -> None:
         """
-        Scan the serial ports and add them to the combo box.
+        Rescan the serial ports in the background.
+        Plugged and unplugged adapters are picked up without a rescan.
         """
-        if hasattr(self, 'ui') and hasattr(self.ui, 'comboBox_SPort'):
-            self.ui.comboBox_SPort.clear()
-            ports_list = self.serial_manager.scan_ports()
-            if ports_list:
-                self.ui.comboBox_SPort.addItems(ports_list)
-                self.show_status_message(f"Found {len(ports_list)} serial ports", "green")
-                return True
-            else:
-                self.show_status_message("Failed to enumerate ports", "yellow")
-                return False
-        return False
+        self.port_watcher.rescan()
+
+    def _update_port_list(self, added: list, removed: list) -> None:
+        """
+        Add and remove the ports that appeared or disappeared, keeping the selection.
+        """
+        combo = self.ui.comboBox_SPort
+        current = combo.currentText()
+        combo.blockSignals(True)
+        for device in removed:
+            # Keep open ports listed; they close themselves on the read error
+            session = self.sessions.get(device)
+            if session is None or not session.is_open():
+                self._remove_port_item(device)
+        for info in added:
+            index = combo.findText(info.device)
+            if index < 0:
+                index = next(
+                    (i for i in range(combo.count()) if combo.itemText(i) > info.device), combo.count()
+                )
+                combo.insertItem(index, info.device)
+            combo.setItemData(index, f"{info.description}\n{info.hwid}", Qt.ItemDataRole.ToolTipRole)
+        if combo.findText(current) >= 0:
+            combo.setCurrentText(current)
+        combo.blockSignals(False)
+        self.switch_session(combo.currentText())
+
+    def _remove_port_item(self, device: str) -> None:
+        """
+        Remove a port from the combo box if it is listed.
+        """
+        index = self.ui.comboBox_SPort.findText(device)
+        if index >= 0:
+            self.ui.comboBox_SPort.removeItem(index)
+
+    def _post_port_scan(self, count: int) -> None:
+        """
+        Drop stale entries after a full scan and report the result.
+        """
+        combo = self.ui.comboBox_SPort
+        current = combo.currentText()
+        combo.blockSignals(True)
+        for device in [combo.itemText(i) for i in range(combo.count())]:
+            session = self.sessions.get(device)
+            if self.port_watcher.get_port_info(device) is None and not (session and session.is_open()):
+                self._remove_port_item(device)
+        combo.blockSignals(False)
+        if combo.currentText() != current:
+            self.switch_session(combo.currentText())
+        if count:
+            self.show_status_message(f"Found {count} serial ports", "green")
+        else:
+            self.show_status_message("Failed to enumerate ports", "yellow")
+
+    def _create_session(self, port: str) -> PortSession:
+        """
+        Create the session of a port, starting from the settings shown in the UI.
+        """
+        session = PortSession(
+            port,
+            self.ui.textEdit_Receive,
+            self.encoding,
+            self._read_serial_settings(),
+            reader_engine=self.reader_engine,
+            parent=self,
+        )
+        if self.checksum:
+            session.data_converter.set_checksum(self.checksum)
+        session.data_receiver.port_closed.connect(partial(self._post_close_port, session))
+        session.data_transmitter.frame_sent.connect(self._update_rwsize_status)
+        self.sessions[port] = session
+        return session
+
+    def switch_session(self, port: str) -> None:
+        """
+        Show the session of the selected port, creating it on first use.
+        Sessions that are not shown keep receiving and sending.
+        """
+        port = port.strip()
+        previous = self.session
+        if port == previous.port:
+            return
+
+        if not previous.is_open():
+            previous.settings = self._read_serial_settings()
+        session = self.sessions.get(port) or self._create_session(port)
+        self.session = session
+        self._show_session()
+
+        # The placeholder session is only needed until a port is selected
+        if not previous.port:
+            self.sessions.pop("", None)
+            previous.shutdown()
+        self.log.info(f"Showing port session {port or '(none)'}")
+
+    def _show_session(self) -> None:
+        """
+        Update the UI to show the current session's settings, state and data.
+        """
+        session = self.session
+        session.receive_view.attach()
+
+        self._switching_session = True
+        for key, combo in self._serial_setting_combos().items():
+            combo.setCurrentText(session.settings[key])
+        self.toggle_btn.setChecked(session.is_open())
+        self._switching_session = False
+        self._set_components_state(session.is_open())
+
+        self.ui.checkBox_RHexmode.setChecked(session.receive_hex_mode)
+        self.ui.checkBox_RRecord.setChecked(session.data_receiver.is_capturing())
+        self.ui.comboBox_RTime.setCurrentIndex(
+            list(gl.RECEIVE_TIMESTAMP_OPTIONS.values()).index(session.receive_timestamp_digits)
+        )
+        self._show_send_state()
+        self._show_framing()
+        self._show_decoder()
+        self._update_rwsize_status()
+
+    def _show_send_state(self) -> None:
+        """
+        Update the cycle and file send controls for the current session.
+        """
+        for source, check_box, line_edit in (
+            ("single", self.ui.checkBox_sCycle, self.ui.lineEdit_sCycle),
+            ("multi", self.ui.checkBox_mCycle, self.ui.lineEdit_mCycle),
+        ):
+            cycling = self.session.is_cycling(source)
+            check_box.setChecked(cycling)
+            line_edit.setEnabled(not cycling)
+
+        sending = self.session.is_sending_file()
+        self.ui.pushButton_fSend.setText("Stop" if sending else "Send")
+        self.label_fprogress.setVisible(sending)
 
     def port_toggle(self) -> None:
         """
         Toggle the serial port open and close.
         """
+        if self._switching_session:
+            return
         if self.toggle_btn.isChecked():
             self.open_port()
         else:
@@ -266,13 +483,12 @@ class MainWindow(QMainWindow):
         """
         Set the state of the UI components based on the port state.
         """
+        # The port combo box stays enabled to switch between port sessions
         widgets_list1 = [
-            self.ui.pushButton_Check,
             self.ui.comboBox_BRate,
             self.ui.comboBox_BSize,
             self.ui.comboBox_SBit,
             self.ui.comboBox_PBit,
-            self.ui.comboBox_SPort,
         ]
         widgets_list2 = [
             self.ui.pushButton_sSend,
@@ -295,7 +511,8 @@ class MainWindow(QMainWindow):
         """
         Open the serial port with the parameters set in the UI.
         """
-        port = self.ui.comboBox_SPort.currentText().strip()
+        session = self.session
+        port = session.port
         if not port:
             if self.toggle_btn.isChecked():
                 self.toggle_btn.setChecked(False)
@@ -319,7 +536,7 @@ class MainWindow(QMainWindow):
 
         # Open port using SerialManager
         try:
-            success, msg = self.serial_manager.open_port(
+            success, msg = session.serial_manager.open_port(
                 port, baudrate, bytesize, stopbits, parity, timeout
             )
         except Exception as e:
@@ -336,72 +553,36 @@ class MainWindow(QMainWindow):
             self.show_status_message(f"Error: {msg}", "red")
             return False
 
+        session.start()
+        session.settings = self._read_serial_settings()
         self._set_components_state(True)
         self.show_status_message(f"Port {port} opened successfully", "green")
-
-        # Start the receive update timer
-        self.receive_update_timer.start(100)
-
         return True
 
     def close_port(self) -> None:
         """
-        Close the serial port.
+        Close the serial port of the current session.
         """
-        self.log.info("Closing serial port")
-        # Check and deactivate cycle send if active
-        if self.ui.checkBox_sCycle.isChecked():
-            self.ui.checkBox_sCycle.click()
-        if self.ui.checkBox_mCycle.isChecked():
-            self.ui.checkBox_mCycle.click()
-
-        # Stop the file send timer
-        self.file_send_timer.stop()
-
-        # Stop the receive update timer
-        self.receive_update_timer.stop()
+        session = self.session
+        self.log.info(f"Closing serial port {session.port}")
+        # Stop cycle, json and file sends on this port
+        session.stop_senders()
+        self._show_send_state()
 
         # Check if the serial instance is open
-        if self.serial_manager.is_open():
+        if session.is_open():
             # Trigger the serial close function in receive thread
-            self.data_receiver.request_close_port()
+            session.data_receiver.request_close_port()
 
-    def _post_close_port(self) -> None:
+    def _post_close_port(self, session: PortSession) -> None:
         """
-        Post processing after closing the serial port.
+        Post processing after closing the serial port of a session.
         """
-        if not self.serial_manager.is_open():
+        if session is self.session and not session.is_open():
             if self.toggle_btn.isChecked():
                 self.toggle_btn.setChecked(False)
             self._set_components_state(False)
 
-    ########################## single and multi send function ############################
-
-    def _timer_data_send(self) -> bool:
-        """
-        Send data based on the current state of single and multi cycle sends.
-        """
-        # Check if both single and multi cycle sends are activated
-        if self.ui.checkBox_sCycle.isChecked() and self.ui.checkBox_mCycle.isChecked():
-            # Deactivate both cycle sends
-            self.ui.checkBox_sCycle.click()
-            self.ui.checkBox_mCycle.click()
-            msg: str = (
-                "Both single cycle send and multi cycle send are activated.\n\n"
-                "Deactivate them all, please try again"
-            )
-            self.log.error(msg)
-            self.message_box.warning(self, "Warning", msg)
-            return False
-
-        # Check if single cycle send is activated
-        if self.ui.checkBox_sCycle.isChecked():
-            self._single_cycle_send()
-        # Check if multi cycle send is activated
-        elif self.ui.checkBox_mCycle.isChecked():
-            self._multi_cycle_send()
-        return True
-
     ########################## single send function ############################
 
     def single_send_clear(self) -> None:
@@ -410,15 +591,9 @@ class MainWindow(QMainWindow):
         """
         self.ui.textEdit_sSend.clear()
         self.ui.textEdit_sSend.moveCursor(QTextCursor.MoveOperation.Start)
-        self.data_sender.reset_counter()
+        self.session.data_sender.reset_counter()
         self._update_rwsize_status()
 
-    def _single_cycle_send(self) -> None:
-        success = self.single_data_send()
-        if not success and self.ui.checkBox_sCycle.isChecked():
-            self.ui.checkBox_sCycle.click()
-            return
-
     def single_data_send(self) -> bool:
         """
         Send data from the single send text edit widget to the serial port.
@@ -427,7 +602,7 @@ class MainWindow(QMainWindow):
         newline_state = self.ui.checkBox_sNewline.isChecked()
         is_hex = self.ui.checkBox_sHexmode.isChecked()
 
-        if not self.serial_manager.is_open():
+        if not self.session.serial_manager.is_open():
             self.message_box.information(self, "Info", "Please open a serial port first")
             return False
         if not text:
@@ -435,9 +610,11 @@ class MainWindow(QMainWindow):
 
         # Use DataSender to send data
         try:
-            success, _ = self.data_sender.send_data(text, is_hex, newline_state)
+            success, _ = self.session.data_sender.send_data(text, is_hex, newline_state)
             if success:
                 self._update_rwsize_status()
+            elif is_hex:
+                self._show_hex_error(text)
             return success
         except Exception as e:
             error_msg = f"Error sending data: {str(e)}"
@@ -445,6 +622,14 @@ class MainWindow(QMainWindow):
             self.message_box.warning(self, "Error", error_msg)
             return False
 
+    def _show_hex_error(self, text: str) -> None:
+        """
+        Show where a hex string stops being valid in the status bar.
+        """
+        success, _, error_offset = self.session.data_converter.parse_hex(text)
+        if not success:
+            self.show_status_message(f"Invalid hex data at offset {error_offset}", "red")
+
     def set_single_cycle_mode(self) -> bool:
         """
         Set the cycle mode of the send text edit widget.
@@ -467,10 +652,10 @@ class MainWindow(QMainWindow):
         try:
             if hexmode_state:
                 # Convert text to hex
-                str_text = self.data_converter.text_to_hex(text)
+                str_text = self.session.data_converter.text_to_hex(text)
             else:
                 # Convert hex to text
-                success, str_text = self.data_converter.hex_to_text(text)
+                success, str_text = self.session.data_converter.hex_to_text(text)
                 if not success:
                     self.show_status_message("Incorrect hex format data, can't convert to text format", "yellow")
                     self.ui.checkBox_sHexmode.setChecked(True)
@@ -522,7 +707,7 @@ class MainWindow(QMainWindow):
                         is_single_send_hex or is_multi_send_hex
                     ) and key_event.key() not in self.key_limits:
                         # Show temporary red hint in status bar
-                        self.show_status_message("Hex mode: Please input 0-9, a-f, A-F", "red")
+                        self.show_status_message("Hex mode: Please input 0-9, a-f, A-F, 0x, comma or space", "red")
                         return True
 
             return super().eventFilter(obj, event)
@@ -536,7 +721,7 @@ class MainWindow(QMainWindow):
         """
         Send data based on the sequence provided (e.g., "m1", "m2").
         """
-        if not self.serial_manager.is_open():
+        if not self.session.serial_manager.is_open():
             self.message_box.information(self, "Info", "Please open a serial port first")
             return False
 
@@ -553,50 +738,17 @@ class MainWindow(QMainWindow):
         is_hex_mode: bool = self.ui.checkBox_mHexMode.isChecked()
 
         # Use DataSender to send data
-        success, bytes_sent = self.data_sender.send_data(text, is_hex_mode, newline_state)
+        success, bytes_sent = self.session.data_sender.send_data(text, is_hex_mode, newline_state)
         if success:
             self._update_rwsize_status()
+        elif is_hex_mode:
+            self._show_hex_error(text)
         return success
 
-    def _multi_cycle_send(self) -> None:
-        """
-        Send the data in the text edit widget if the button is checked and the text edit is not empty.
-        """
-        # multi_dict: {"m{x}": [0, 0]}, first 0 means checked status, second 0 means send status
-        for i in range(1, gl.MAX_MULTI_SEND_CHANNELS + 1):
-            key = f"m{i}"
-            is_checked = getattr(self.ui, f"checkBox_{key}").isChecked()
-            has_text = bool(getattr(self.ui, f"lineEdit_{key}").text().strip())
-            # Only add the entry if both conditions: checked and has text
-            self.multi_dict[key][0] = 1 if is_checked and has_text else 0
-
-        # Check if at least one item in multi_dict is checked (i.e., the first element is 1)
-        if not any(item[0] for item in self.multi_dict.values()):
-            self.message_box.information(self, "Info", "No item checked or no data input")
-            self.ui.checkBox_mCycle.setChecked(False)
-            return
-
-        for item in self.multi_dict:
-            if self.multi_dict[item][0] == 1 and self.multi_dict[item][1] == 0:
-                success = self.multi_common_send(item)
-                if not success and self.ui.checkBox_mCycle.isChecked():
-                    self.ui.checkBox_mCycle.click()
-                    return
-                self.multi_dict[item][1] = 1
-                break
-
-        if all(item[1] for item in self.multi_dict.values() if item[0]):
-            for item in self.multi_dict.values():
-                item[1] = 0
-
     def set_multi_cycle_mode(self) -> bool:
         """
         Set the cycle mode for the multi send feature.
         """
-        if self.ui.checkBox_mCycle.isChecked():
-            # Initialize multi_dict
-            self.multi_dict = {f"m{i}": [0, 0] for i in range(1, gl.MAX_MULTI_SEND_CHANNELS + 1)}
-
         return self._set_cyclemode(self.ui.checkBox_mCycle, self.ui.lineEdit_mCycle, "multi")
 
     def set_multi_hex_mode(self) -> None:
@@ -614,7 +766,7 @@ class MainWindow(QMainWindow):
 
                 if text:
                     # Convert text to hex
-                    hex_str = self.data_converter.text_to_hex(text)
+                    hex_str = self.session.data_converter.text_to_hex(text)
                     line_edit.clear()
                     line_edit.insert(hex_str)
         else:
@@ -625,7 +777,7 @@ class MainWindow(QMainWindow):
                 text = line_edit.text().strip()
 
                 if text:
-                    success, text_str = self.data_converter.hex_to_text(text)
+                    success, text_str = self.session.data_converter.hex_to_text(text)
                     if success:
                         line_edit.clear()
                         line_edit.insert(text_str)
@@ -653,7 +805,7 @@ class MainWindow(QMainWindow):
         dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         dialog.setViewMode(QFileDialog.ViewMode.Detail)
         dialog.setWindowTitle("Open File")
-        dialog.setNameFilter("TXT File(*.txt *.json)")
+        dialog.setNameFilter("TXT File(*.txt *.json);;All Files(*)")
         if not dialog.exec():
             return False
         file_name: str = dialog.selectedFiles()[0]
@@ -666,8 +818,13 @@ class MainWindow(QMainWindow):
     def file_send(self) -> bool:
         """
         Send data from a file to the serial port.
+        Clicking Send again while a file is streaming stops it.
         """
-        if not self.serial_manager.is_open():
+        if self.session.is_sending_file():
+            self.session.file_sender.requestInterruption()
+            return False
+
+        if not self.session.serial_manager.is_open():
             self.message_box.information(self, "Info", "Please open a serial port first")
             return False
 
@@ -676,7 +833,7 @@ class MainWindow(QMainWindow):
             self.message_box.information(self, "Info", "the file is not existed")
             return False
 
-        file_type = self.file_handler.get_file_type(selected_file)
+        file_type = self.session.file_handler.get_file_type(selected_file)
 
         if file_type == "json":
             return self._process_json_file(selected_file)
@@ -688,64 +845,67 @@ class MainWindow(QMainWindow):
         Process a JSON file and send its content to the serial port.
         """
         # Read JSON file
-        success, json_data = self.file_handler.read_json_file(file_path)
+        success, json_data = self.session.file_handler.read_json_file(file_path)
         if not success or not json_data:
             self.message_box.critical(self, "Error", "Error reading JSON file")
             return False
 
-        # Process JSON data for sending
-        success, send_list = self.file_handler.process_json_send_data(json_data)
+        # Compile the selected items into a send plan
+        success, plan = self.session.file_handler.compile_send_plan(json_data)
         if not success:
-            self.message_box.critical(self, "Error", "Not every item is hex digit, please check.")
+            self.message_box.critical(
+                self, "Error", "Invalid hex data or directive in the JSON file, please check the log."
+            )
             return False
 
-        self.json_send_list = send_list
-        cycle_time = json_data.get("cycle_ms", 0)
-
-        # Send data according to cycle time
-        if cycle_time > 0:
-            self.file_send_timer.start(cycle_time)
-        else:
-            for item in self.json_send_list:
-                if item[0] == 1:  # if selected
-                    success, _ = self.data_sender.send_bytes(item[3])
-                    if success:
-                        self._update_rwsize_status()
+        # Send the plan in the background, at cycle_ms intervals if set
+        self._stop_cycle_sender(self.session.json_cycle_sender)
+        self.session.json_cycle_sender = self._start_cycle_sender(plan, "json", skip_when_busy=False)
         return True
 
     def _process_text_file(self, file_path: str) -> bool:
         """
-        Process a text file and send its content to the serial port.
+        Stream a text or binary file to the serial port in the background.
         """
-        success, content = self.file_handler.read_text_file(file_path)
-        if not success:
-            self.message_box.critical(self, "Error", "Error of opening file")
+        session = self.session
+        if not session.is_open():
             return False
 
-        if self.serial_manager.is_open():
-            success, _ = self.data_sender.send_file_content(content)
-            if success:
-                self._update_rwsize_status()
-            return success
-        return False
+        text_mode = session.file_handler.get_file_type(file_path) == "txt"
+        session.file_sender = FileSender(
+            session.data_sender, file_path, text_mode, session.file_handler, parent=self
+        )
+        session.file_sender.progress.connect(partial(self._update_file_send_progress, session))
+        session.file_sender.finished_sending.connect(partial(self._post_file_send, session))
+        self.ui.pushButton_fSend.setText("Stop")
+        self.label_fprogress.setText("  File: 0%  ")
+        self.label_fprogress.show()
+        session.file_sender.start()
+        return True
 
-    def _timer_json_file_data_send(self) -> None:
+    def _update_file_send_progress(
+        self, session: PortSession, sent: int, total: int, rate: float, eta: float
+    ) -> None:
         """
-        Send the data in the json_send_list.
+        Show file send progress, throughput and ETA in the status bar.
         """
-        for item in self.json_send_list:
-            if item[0] == 1 and item[2] == 0:  # selected and not sent
-                success: bool
-                _: int
-                success, _ = self.data_sender.send_bytes(item[3])
-                if success:
-                    self._update_rwsize_status()
-                item[2] = 1  # mark as sent
-                break
+        if session is not self.session:
+            return
+        percent = sent * 100 // total if total else 100
+        self.label_fprogress.setText(
+            f"  File: {percent}%  {rate / 1024:.1f} KB/s  ETA {eta:.0f}s  "
+        )
+        self._update_rwsize_status()
 
-        # Check if all selected items have been sent
-        if all(item[2] == 1 for item in self.json_send_list if item[0] == 1):
-            self.file_send_timer.stop()
+    def _post_file_send(self, session: PortSession, success: bool, msg: str) -> None:
+        """
+        Post processing after a file send finished, failed or was stopped.
+        """
+        if session is self.session:
+            self.ui.pushButton_fSend.setText("Send")
+            self.label_fprogress.hide()
+            self._update_rwsize_status()
+        self.show_status_message(f"{session.port}: {msg}", "green" if success else "yellow")
 
     ########################## receive function ############################
 
@@ -754,40 +914,103 @@ class MainWindow(QMainWindow):
         Toggle hex mode for the receive text edit widget.
         """
         hexmode_state = self.ui.checkBox_RHexmode.isChecked()
-        text = self.ui.textEdit_Receive.toPlainText()
-        if not text:
+        session = self.session
+        session.receive_hex_mode = hexmode_state
+        if session.frame_assembler is not None or session.decoder_thread is not None:
+            # Frames already shown keep their form, new ones follow the mode
             return False
 
-        try:
-            if hexmode_state:
-                # Convert text to hex
-                str_text = self.data_converter.text_to_hex(text) + " "
-            else:
-                # Convert hex to text
-                success, str_text = self.data_converter.hex_to_text(text)
+        converter = session.data_converter
+        dumper = session.hex_dumper
+        dumper.reset()
+        width = dumper.width
+        carry = b""
+        decoder = codecs.getincrementaldecoder(converter.encoding)("replace")
+
+        def to_hex(text: str, final: bool) -> str:
+            # Whole rows only until the end, where the partial row stays pending
+            nonlocal carry
+            data = carry + text.encode(converter.encoding, "replace")
+            cut = len(data) if final else len(data) // width * width
+            carry = data[cut:]
+            return dumper.render(data[:cut])[0]
+
+        def to_text(text: str, final: bool) -> Optional[str]:
+            # Hexdump rows, or plain hex as shown before hexdump rendering
+            data = dumper.parse(text)
+            if data is None:
+                success, data, _ = converter.parse_hex(text)
                 if not success:
-                    self.log.error("Error converting receive data")
-                    self.ui.checkBox_RHexmode.setChecked(not hexmode_state)
-                    return False
+                    return None
+            return decoder.decode(data, final)
 
-            self.ui.textEdit_Receive.clear()
-            self.ui.textEdit_Receive.insertPlainText(str_text)
-            self.ui.textEdit_Receive.moveCursor(QTextCursor.MoveOperation.End)
-            return True
+        # The whole session is converted, so a saved file has one rendering
+        try:
+            success = session.receive_view.convert(to_hex if hexmode_state else to_text)
         except Exception as e:
             self.log.error(f"Error converting receive data: {e}")
+            success = False
+        if not success:
+            self.log.error("Error converting receive data")
+            dumper.reset()
             self.ui.checkBox_RHexmode.setChecked(not hexmode_state)
+            session.receive_hex_mode = not hexmode_state
+        return success
+
+    def set_receive_timestamp(self, option: str) -> None:
+        """
+        Set the arrival time labels of received lines and hexdump rows.
+
+        Args:
+            option: Time combo box text, a key of gl.RECEIVE_TIMESTAMP_OPTIONS
+        """
+        self.session.receive_timestamp_digits = gl.RECEIVE_TIMESTAMP_OPTIONS.get(option, 0)
+
+    def set_receive_record_mode(self) -> bool:
+        """
+        Start or stop streaming raw received bytes to a capture file.
+        """
+        if not self.ui.checkBox_RRecord.isChecked():
+            self.session.data_receiver.stop_capture()
+            self.show_status_message("Recording stopped", "green")
+            return True
+
+        dialog = QFileDialog(self)
+        dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        dialog.setViewMode(QFileDialog.ViewMode.Detail)
+        dialog.setWindowTitle("Record To File")
+        dialog.setNameFilter("Binary File(*.bin);;All Files(*)")
+        if not dialog.exec() or not dialog.selectedFiles()[0]:
+            self.ui.checkBox_RRecord.setChecked(False)
             return False
 
+        capture_file: str = dialog.selectedFiles()[0]
+        success, msg = self.session.data_receiver.start_capture(capture_file)
+        if not success:
+            self.ui.checkBox_RRecord.setChecked(False)
+            self.show_status_message(f"Error: {msg}", "red")
+            return False
+
+        self.received_data_file = capture_file
+        self.show_status_message(msg, "green")
+        return True
+
     def _set_cyclemode(self, check_box: QCheckBox, line_edit: QLineEdit, send_source: str) -> bool:
         """
         Common cycle mode setting logic.
         """
         if not check_box.isChecked():
-            self.send_timer.stop()
+            self._stop_cycle_sender(self.session.cycle_sender)
             line_edit.setEnabled(True)
             return True
 
+        if self.session.cycle_sender is not None and self.session.cycle_sender.isRunning():
+            msg = "Another cycle send is already running.\n\nPlease stop it first"
+            self.log.error(msg)
+            self.message_box.warning(self, "Warning", msg)
+            check_box.setChecked(False)
+            return False
+
         cycle_text = line_edit.text()
         if not cycle_text:
             self.message_box.information(self, "Info", "Please set cycle time first")
@@ -804,7 +1027,7 @@ class MainWindow(QMainWindow):
             check_box.setChecked(False)
             return False
 
-        if not self.serial_manager.is_open():
+        if not self.session.serial_manager.is_open():
             self.message_box.information(self, "Info", "Please open a serial port first")
             check_box.setChecked(False)
             return False
@@ -817,7 +1040,13 @@ class MainWindow(QMainWindow):
                 )
                 check_box.setChecked(False)
                 return False
-            self.send_timer.start(cycle_time)
+            steps = self._build_cycle_steps(send_source, cycle_time)
+            if steps is None:
+                check_box.setChecked(False)
+                return False
+            name = "multi" if send_source == "multi" else "single"
+            self.session.cycle_sender = self._start_cycle_sender(steps, name, check_box, line_edit)
+            self.session.cycle_source = name
             line_edit.setEnabled(False)
             return True
         except ValueError:
@@ -832,37 +1061,187 @@ class MainWindow(QMainWindow):
             check_box.setChecked(False)
             return False
 
+    def _build_cycle_steps(self, send_source: str, cycle_time: int) -> Optional[Iterable]:
+        """
+        Encode the single or multi send data once for the cycle sender.
+
+        The payloads are captured when the cycle starts; toggle cycle mode
+        to pick up edits.
+        """
+        if send_source == "multi":
+            is_hex = self.ui.checkBox_mHexMode.isChecked()
+            newline_state = self.ui.checkBox_mNewLine.isChecked()
+            texts = [
+                getattr(self.ui, f"lineEdit_m{i}").text()
+                for i in range(1, gl.MAX_MULTI_SEND_CHANNELS + 1)
+                if getattr(self.ui, f"checkBox_m{i}").isChecked()
+                and getattr(self.ui, f"lineEdit_m{i}").text().strip()
+            ]
+            if not texts:
+                self.message_box.information(self, "Info", "No item checked or no data input")
+                return None
+        else:
+            is_hex = self.ui.checkBox_sHexmode.isChecked()
+            newline_state = self.ui.checkBox_sNewline.isChecked()
+            texts = [send_source]
+
+        payloads = []
+        for text in texts:
+            success, payload = self.session.data_converter.prepare_send_data(text, is_hex, newline_state)
+            if not success:
+                if is_hex:
+                    self._show_hex_error(text)
+                return None
+            payloads.append((payload, cycle_time))
+        return itertools.cycle(payloads)
+
+    def _start_cycle_sender(
+        self,
+        steps: Iterable,
+        name: str,
+        check_box: Optional[QCheckBox] = None,
+        line_edit: Optional[QLineEdit] = None,
+        skip_when_busy: bool = True,
+    ) -> CycleSender:
+        """
+        Start a cycle sender thread for the given steps on the current session.
+        """
+        session = self.session
+        sender = CycleSender(session.data_sender, steps, name, skip_when_busy, parent=self)
+        sender.cycle_finished.connect(partial(self._post_cycle_send, session, check_box, line_edit))
+        sender.start()
+        return sender
+
+    def _post_cycle_send(
+        self,
+        session: PortSession,
+        check_box: Optional[QCheckBox],
+        line_edit: Optional[QLineEdit],
+        status: str,
+        summary: str,
+    ) -> None:
+        """
+        Post processing after a cycle send finished, failed or was stopped.
+        """
+        if session is self.session:
+            if status == "failed" and check_box is not None and check_box.isChecked():
+                check_box.setChecked(False)
+                line_edit.setEnabled(True)
+            self._update_rwsize_status()
+        self.show_status_message(
+            f"{session.port}: cycle send {status}, {summary}", "red" if status == "failed" else "", 5000
+        )
+
+    def _stop_cycle_sender(self, sender: Optional[CycleSender]) -> None:
+        """
+        Stop a running cycle sender and wait for the thread to finish.
+        """
+        if sender is not None and sender.isRunning():
+            sender.requestInterruption()
+            if not sender.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                self.log.warning("Cycle sender thread may not have stopped properly")
+
     def _update_receive_ui(self) -> None:
         """
-        Update receive text edit widget with data from the receive queue.
+        Update the receive views of all sessions with data from their receive queues.
         Optimized for batch updates to reduce UI operations.
         """
-        data_list = self.data_receiver.get_data_from_queue()
-        if not data_list:
-            return
+        shown_updated = False
+        now_ns = time.monotonic_ns()
+        for session in self.sessions.values():
+            receiver = session.data_receiver
+            received_data, stamps = receiver.get_stamped_data_from_queue()
+            decoder_thread = session.decoder_thread
+            if decoder_thread is not None:
+                # Decoded in the decoder thread, rows are shown a tick later
+                if received_data:
+                    decoder_thread.submit(bytes(received_data), stamps)
+                rows = decoder_thread.take_rows()
+                if rows:
+                    session.receive_view.append(self._render_decoded(session, rows))
+                    shown_updated = shown_updated or session is self.session
+                continue
+            assembler = session.frame_assembler
+            if assembler is not None:
+                # One entry per complete frame; partial frames wait for the rest
+                frames = assembler.feed(received_data, stamps) if received_data else []
+                frames += assembler.poll(now_ns)
+                if frames:
+                    session.receive_view.append(self._render_frames(session, frames))
+                    shown_updated = shown_updated or session is self.session
+                continue
+            if not received_data:
+                continue
+
+            # Lines and rows are labelled with their first byte's arrival time
+            digits = session.receive_timestamp_digits
+            label = stamp_labeler(stamps, receiver.clock, digits) if digits else None
+
+            # Convert the whole drained block at once; hexdump rows continue
+            # across blocks, so the last partial row is rewritten when it fills
+            replace_chars = 0
+            if session.receive_hex_mode:
+                combined_text, replace_chars = session.hex_dumper.render(received_data, label)
+            elif label is not None:
+                combined_text = session.line_stamper.render(
+                    received_data, label, session.data_converter.bytes_to_text
+                )
+            else:
+                combined_text = session.data_converter.bytes_to_text(received_data)
+                session.line_stamper.at_line_start = received_data[-1] == 0x0A
+
+            # Single UI update operation, bounded by the view's scrollback limit
+            session.receive_view.append(combined_text, replace_chars)
+            shown_updated = shown_updated or session is self.session
 
-        hex_status: bool = self.ui.checkBox_RHexmode.isChecked()
+        if shown_updated:
+            self._update_rwsize_status()
+
+    def _render_frames(self, session: PortSession, frames: list) -> str:
+        """
+        Render received frames one per line.
 
-        # Batch process all data into a single string
-        all_text_parts = []
-        for received_data in data_list:
-            if hex_status:
-                all_text_parts.append(self.data_converter.bytes_to_hex(received_data))
+        Args:
+            session: Session the frames were received on
+            frames: (payload, arrival stamp) tuples from its frame assembler
+
+        Returns:
+            Text to append to the receive view
+        """
+        digits = session.receive_timestamp_digits
+        clock = session.data_receiver.clock
+        converter = session.data_converter
+        # Start on a new line if unframed text left one open
+        lines = [] if session.line_stamper.at_line_start else [""]
+        for payload, stamp_ns in frames:
+            label = clock.label(stamp_ns, digits) if digits else ""
+            if session.receive_hex_mode:
+                body = converter.bytes_to_hex(payload)
             else:
-                all_text_parts.append(self.data_converter.bytes_to_text(received_data))
+                body = converter.bytes_to_text(payload).rstrip("\r\n")
+            lines.append(label + body)
+        session.line_stamper.at_line_start = True
+        return "\n".join(lines) + "\n"
 
-        # Join all parts with appropriate separator
-        if hex_status:
-            combined_text = " ".join(all_text_parts) + " "
-        else:
-            combined_text = "".join(all_text_parts)
+    def _render_decoded(self, session: PortSession, rows: list) -> str:
+        """
+        Render decoded frames one per line, the raw bytes next to their description.
 
-        # Single UI update operation
-        self.ui.textEdit_Receive.moveCursor(QTextCursor.MoveOperation.End)
-        self.ui.textEdit_Receive.insertPlainText(combined_text)
-        self.ui.textEdit_Receive.moveCursor(QTextCursor.MoveOperation.End)
+        Args:
+            session: Session the frames were received on
+            rows: (arrival stamp, raw frame, description) tuples from its decoder
 
-        self._update_rwsize_status()
+        Returns:
+            Text to append to the receive view
+        """
+        digits = session.receive_timestamp_digits
+        clock = session.data_receiver.clock
+        lines = [] if session.line_stamper.at_line_start else [""]
+        for stamp_ns, raw, text in rows:
+            label = clock.label(stamp_ns, digits) if digits else ""
+            lines.append(f"{label}{raw.hex(' ').upper()}  | {text}")
+        session.line_stamper.at_line_start = True
+        return "\n".join(lines) + "\n"
 
     def receive_save(self) -> bool:
         """
@@ -880,33 +1259,61 @@ class MainWindow(QMainWindow):
             self.log.info("No file be selected to save the received datas")
             return False
         self.log.info(f"file: {self.received_data_file}")
-        text = self.ui.textEdit_Receive.toPlainText()
-        try:
-            with open(self.received_data_file, "w+", encoding="utf-8") as fp:
-                fp.write(text)
+        # The spool holds the whole session, including lines scrolled out of view
+        success, msg = self.session.receive_view.save(self.received_data_file)
+        if success:
             self.log.info(f"Successfully saved received data to {self.received_data_file}")
             self.show_status_message("Successfully saved received data", "green")
             return True
-        except (OSError, IOError) as e:
-            self.log.error(f"Error writing data to file: {str(e)}")
-            self.show_status_message("Error writing data into file", "red")
-            return False
+        self.log.error(f"Error writing data to file: {msg}")
+        self.show_status_message("Error writing data into file", "red")
+        return False
 
     def receive_clear(self) -> None:
         """
         Clear the receive text edit widget.
         """
-        self.ui.textEdit_Receive.clear()
-        self.data_receiver.reset_counter()
+        self.session.receive_view.clear()
+        self.session.hex_dumper.reset()
+        self.session.line_stamper.reset()
+        if self.session.frame_assembler is not None:
+            self.session.frame_assembler.reset()
+        if self.session.decoder_thread is not None:
+            # Restart the thread so no block queued before the clear is decoded
+            self.session.set_decoder(self.session.decoder_name)
+        self.session.data_converter.reset_decoder()
+        self.session.data_receiver.clear_queue()
+        self.session.data_receiver.reset_counter()
         self._update_rwsize_status()
 
     def _update_rwsize_status(self) -> None:
         """
         Update the status bar with send/receive data size.
         """
-        total_send = self.data_sender.get_total_sent()
-        total_receive = self.data_receiver.get_total_received()
+        total_send = self.session.data_sender.get_total_sent()
+        total_receive = self.session.data_receiver.get_total_received()
         datasize_text = f"  Send: {total_send}  |  Receive: {total_receive}  "
+        transmit = self.session.data_transmitter.get_stats()
+        if transmit["frames"]:
+            datasize_text += (
+                f"|  Tx queue: {transmit['queue_depth']}  "
+                f"write: {transmit['avg_write_ms']:.1f}/{transmit['max_write_ms']:.1f} ms  "
+            )
+        for sender in (self.session.cycle_sender, self.session.json_cycle_sender):
+            if sender is not None and sender.isRunning():
+                jitter = sender.get_jitter_stats(with_p99=False)
+                if jitter["count"]:
+                    datasize_text += f"|  Jitter: {jitter['avg_us']:.0f}/{jitter['max_us']:.0f} µs  "
+        if self.session.frame_assembler is not None:
+            framing = self.session.frame_assembler.get_stats()
+            datasize_text += f"|  Frames: {framing['frames']}  "
+            if framing["frames"]:
+                datasize_text += f"size: {framing['min_size']}/{framing['avg_size']:.0f}/{framing['max_size']} B  "
+            if framing["errors"] or framing["oversized"]:
+                datasize_text += f"errors: {framing['errors']}  oversized: {framing['oversized']}  "
+        if self.session.decoder_thread is not None:
+            decoder = self.session.decoder_thread.decoder
+            datasize_text += f"|  {decoder.name}: {decoder.frames} frames, {decoder.errors} errors  "
         self.label_rwsize.setText(datasize_text)
 
     ########################## menu function ############################
@@ -942,8 +1349,12 @@ class MainWindow(QMainWindow):
 
     def action_about(self) -> None:
         """
-        Show the about dialog.
+        Show the about dialog, building it on first use.
         """
+        if self.about is None:
+            from about import About
+
+            self.about = About()
         self.about.show()
 
     def action_encoding(self, encode: str) -> None:
@@ -957,8 +1368,100 @@ class MainWindow(QMainWindow):
         }
         for key, action in actions.items():
             action.setChecked(key == encode)
-        # Update encoding in data converter
-        self.data_converter.set_encoding(encode)
+        # Update encoding in the data converters of all sessions
+        self.encoding = encode
+        for session in self.sessions.values():
+            session.data_converter.set_encoding(encode)
+
+    def action_checksum(self, name: str) -> None:
+        """
+        Set the checksum appended to single, multi and JSON script sends of all ports.
+
+        Cycles already running keep the payloads they started with.
+
+        Args:
+            name: Name from checksum.CHECKSUMS, or "" for none
+        """
+        for key, action in self.checksum_actions.items():
+            action.setChecked(key == name)
+        self.checksum = name
+        for session in self.sessions.values():
+            session.data_converter.set_checksum(name)
+
+    def _framing_actions(self) -> Dict[str, QAction]:
+        """
+        Get the receive framing menu actions by framing mode ("" for off).
+        """
+        return {
+            "": self.ui.actionFraming_Off,
+            "delimiter": self.ui.actionFraming_Delimiter,
+            "length": self.ui.actionFraming_Length,
+            "fixed": self.ui.actionFraming_Fixed,
+            "gap": self.ui.actionFraming_Gap,
+        }
+
+    def action_framing(self, mode: str) -> bool:
+        """
+        Set how the current port's received bytes are cut into frames.
+
+        Args:
+            mode: One of framing.FRAMING_MODES, or "" to show the raw stream
+        """
+        session = self.session
+        success = True
+        if not mode:
+            session.frame_assembler = None
+        else:
+            prompts = {
+                "delimiter": "Frame delimiter (hex):",
+                "length": "Length field (offset,size,big|little,adjust):",
+                "fixed": "Frame size (bytes):",
+                "gap": "Idle gap between frames (ms):",
+            }
+            param, success = QInputDialog.getText(
+                self, "Receive Framing", prompts[mode], text=self.framing_params[mode]
+            )
+            if success:
+                try:
+                    session.frame_assembler = build_assembler(mode, param.strip())
+                    self.framing_params[mode] = param.strip()
+                except ValueError as e:
+                    self.show_status_message(f"Invalid framing: {e}", "red")
+                    success = False
+
+        if success:
+            session.framing_mode = mode
+            self.log.info(f"{session.port or 'Receive'} framing: {mode or 'off'}")
+        self._show_framing()
+        self._update_rwsize_status()
+        return success
+
+    def _show_framing(self) -> None:
+        """
+        Check the framing menu entry of the current session.
+        """
+        for mode, action in self._framing_actions().items():
+            action.setChecked(mode == self.session.framing_mode)
+
+    def action_decoder(self, name: str) -> None:
+        """
+        Set the protocol decoder of the current port.
+
+        Args:
+            name: Registered decoder name, or "" to show received data undecoded
+        """
+        session = self.session
+        session.set_decoder(name)
+        self.log.info(f"{session.port or 'Receive'} decoder: {name or 'off'}")
+        self._show_decoder()
+        self._update_rwsize_status()
+
+    def _show_decoder(self) -> None:
+        """
+        Check the decoder menu entry of the current session.
+        """
+        for name, action in self.decoder_actions.items():
+            action.setChecked(name == self.session.decoder_name)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -976,62 +1479,33 @@ class MainWindow(QMainWindow):
 
         # 1. Stop timers first
         try:
-            if hasattr(self, "send_timer"):
-                self.send_timer.stop()
-                self.log.debug("Send timer stopped")
-            if hasattr(self, "file_send_timer"):
-                self.file_send_timer.stop()
-                self.log.debug("File send timer stopped")
             if hasattr(self, "receive_update_timer"):
                 self.receive_update_timer.stop()
                 self.log.debug("Receive update timer stopped")
         except Exception as e:
             self.log.error(f"Error stopping timers: {str(e)}")
 
-        # 2. Stop receive thread
-        try:
-            if hasattr(self, "data_receiver") and self.data_receiver.isRunning():
-                self.data_receiver.requestInterruption()
-                self.data_receiver.quit()
-                if self.data_receiver.wait(gl.THREAD_WAIT_TIMEOUT_MS):
-                    self.log.debug("Data receiver thread stopped gracefully")
-                else:
-                    self.log.warning("Data receiver thread may not have stopped properly")
-        except Exception as e:
-            self.log.error(f"Error stopping receive thread: {str(e)}")
-
-        # 3. Close serial port
-        try:
-            if hasattr(self, "serial_manager") and self.serial_manager.is_open():
-                success, msg = self.serial_manager.close_port()
-                if success:
-                    self.log.debug(f"Serial port closed successfully: {msg}")
-                else:
-                    self.log.warning(f"Error closing serial port: {msg}")
-        except Exception as e:
-            self.log.error(f"Error closing serial port: {str(e)}")
-
-        # 4. Clean up objects
+        if hasattr(self, "port_watcher"):
+            self.port_watcher.stop()
+
+        # 2. Stop the senders and threads of every port, stop recording and close the ports
+        for port, session in list(self.sessions.items()):
+            try:
+                session.shutdown()
+                self.log.debug(f"Port session {port or '(none)'} shut down")
+            except Exception as e:
+                self.log.error(f"Error shutting down port session {port}: {str(e)}")
+        if hasattr(self, "sessions"):
+            self.sessions.clear()
+        if getattr(self, "reader_engine", None) is not None:
+            self.reader_engine.stop()
+            self.log.debug("Reader engine stopped")
+
+        # 3. Clean up objects
         try:
-            if hasattr(self, "data_receiver"):
-                self.data_receiver.deleteLater()
-                self.log.debug("Data receiver deleted")
-            if hasattr(self, "about"):
+            if getattr(self, "about", None) is not None:
                 self.about.close()
                 self.log.debug("About dialog closed")
-            # Clean up other resources
-            if hasattr(self, "serial_manager"):
-                del self.serial_manager
-                self.log.debug("Serial manager deleted")
-            if hasattr(self, "data_converter"):
-                del self.data_converter
-                self.log.debug("Data converter deleted")
-            if hasattr(self, "data_sender"):
-                del self.data_sender
-                self.log.debug("Data sender deleted")
-            if hasattr(self, "file_handler"):
-                del self.file_handler
-                self.log.debug("File handler deleted")
         except Exception as e:
             self.log.error(f"Error cleaning up objects: {str(e)}")
 
@@ -0,0 +1,190 @@
+"""
+Port session module.
+
+This module provides a PortSession class that bundles everything one serial
+port needs, so the main window can run several ports side by side.
+"""
+
+from typing import Optional
+
+from PySide6.QtWidgets import QPlainTextEdit
+
+import globalvar as gl
+from cycle_sender import CycleSender
+from data_handler import DataConverter, DataReceiver, DataSender, DataTransmitter
+from decoder_thread import DecoderThread
+from decoders import create_decoder
+from file_handler import FileHandler
+from file_sender import FileSender
+from framing import FrameAssembler
+from hexdump import HexDumper
+from logwrapper import logger
+from reader_engine import ReaderEngine
+from receive_view import ReceiveView
+from serial_manager import SerialManager
+from timestamps import LineStamper
+
+
+class PortSession:
+    """
+    One serial port with its own configuration, threads, counters and display.
+
+    The transmit thread is only started when the port is first opened, so
+    ports that are merely selected cost no threads. Where a shared reader
+    engine is given the port is read by it; otherwise the session starts a
+    receiver thread of its own. Each
+    session keeps its own receive document, capture, counters and cycle,
+    script and file senders, and keeps running while another session is
+    shown.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        editor: QPlainTextEdit,
+        encoding: str = "gbk",
+        settings: Optional[dict] = None,
+        reader_engine: Optional[ReaderEngine] = None,
+        parent=None,
+    ) -> None:
+        """
+        Initialize the port session.
+
+        Args:
+            port: Serial port name
+            editor: Receive widget the session's view is shown in
+            encoding: Text encoding (default: "gbk")
+            settings: Serial settings as combo box texts (default: gl.SESSION_DEFAULT_SETTINGS)
+            reader_engine: Shared engine reading the port (default: a receiver thread of its own)
+            parent: Parent QObject for the session's threads (optional)
+        """
+        self.port = port
+        self.settings: dict[str, str] = dict(settings or gl.SESSION_DEFAULT_SETTINGS)
+        self.log = logger.logger
+
+        self.reader_engine = reader_engine
+        self.serial_manager = SerialManager()
+        self.data_converter = DataConverter(encoding)
+        self.data_transmitter = DataTransmitter(self.serial_manager, parent=parent)
+        self.data_sender = DataSender(self.serial_manager, self.data_converter, self.data_transmitter)
+        self.data_receiver = DataReceiver(self.serial_manager, parent)
+        self.file_handler = FileHandler(self.data_converter)
+        self.receive_view = ReceiveView(editor)
+
+        # Display state restored when the session is shown again
+        self.receive_hex_mode = False
+        self.hex_dumper = HexDumper()
+        self.receive_timestamp_digits = 0  # 0: no arrival time labels, 3: ms, 6: µs
+        self.line_stamper = LineStamper()
+        self.framing_mode = ""  # "" for the raw stream, else a framing.FRAMING_MODES entry
+        self.frame_assembler: Optional[FrameAssembler] = None
+        self.decoder_name = ""  # "" for no protocol decoder, else a decoders.DECODERS name
+        self.decoder_thread: Optional[DecoderThread] = None
+
+        # Senders created per send
+        self.cycle_sender: Optional[CycleSender] = None
+        self.cycle_source = ""  # "single" or "multi"
+        self.json_cycle_sender: Optional[CycleSender] = None
+        self.file_sender: Optional[FileSender] = None
+
+    def start(self) -> None:
+        """
+        Start the transmit thread and the receive side if they are not running.
+
+        With a reader engine the receiver is handed to the engine, which
+        picks the port up at once if it is open, instead of starting a
+        thread of its own.
+        """
+        if self.reader_engine is not None:
+            self.reader_engine.add(self.data_receiver)
+        elif not self.data_receiver.isRunning():
+            self.data_receiver.start()
+        if not self.data_transmitter.isRunning():
+            self.data_transmitter.start()
+
+    def is_open(self) -> bool:
+        """
+        Check if the session's port is open.
+
+        Returns:
+            True if open
+        """
+        return self.serial_manager.is_open()
+
+    def is_cycling(self, source: str) -> bool:
+        """
+        Check if a single or multi cycle send is running.
+
+        Args:
+            source: "single" or "multi"
+
+        Returns:
+            True if that cycle send is running
+        """
+        return (
+            self.cycle_source == source
+            and self.cycle_sender is not None
+            and self.cycle_sender.isRunning()
+        )
+
+    def is_sending_file(self) -> bool:
+        """
+        Check if a file is being streamed.
+
+        Returns:
+            True if the file sender is running
+        """
+        return self.file_sender is not None and self.file_sender.isRunning()
+
+    def stop_senders(self) -> None:
+        """Stop the cycle, script and file senders and drop queued frames."""
+        for sender in (self.cycle_sender, self.json_cycle_sender, self.file_sender):
+            if sender is not None and sender.isRunning():
+                sender.requestInterruption()
+                if not sender.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                    self.log.warning(f"{self.port}: sender thread may not have stopped properly")
+        self.data_transmitter.clear()
+
+    def set_decoder(self, name: str) -> None:
+        """
+        Decode received data with a protocol decoder in a thread of its own.
+
+        Args:
+            name: Registered decoder name, or "" to stop decoding
+
+        Raises:
+            KeyError: If no decoder is registered under name
+        """
+        decoder = create_decoder(name) if name else None
+        if self.decoder_thread is not None:
+            self.decoder_thread.stop()
+            self.decoder_thread.deleteLater()
+            self.decoder_thread = None
+        if decoder is not None:
+            self.decoder_thread = DecoderThread(decoder)
+            self.decoder_thread.start()
+        self.decoder_name = name
+
+    def shutdown(self) -> None:
+        """Stop all threads and the capture, close the port and release the view."""
+        self.stop_senders()
+        self.set_decoder("")
+        if self.reader_engine is not None:
+            self.reader_engine.remove(self.data_receiver)
+
+        for thread in (self.data_transmitter, self.data_receiver):
+            if thread.isRunning():
+                thread.requestInterruption()
+                thread.quit()
+                if not thread.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                    self.log.warning(f"{self.port}: {type(thread).__name__} thread may not have stopped properly")
+
+        self.data_receiver.stop_capture()
+        if self.serial_manager.is_open():
+            success, msg = self.serial_manager.close_port()
+            if not success:
+                self.log.warning(f"Error closing serial port {self.port}: {msg}")
+
+        self.data_receiver.deleteLater()
+        self.data_transmitter.deleteLater()
+        self.receive_view.close()
@@ -0,0 +1,296 @@
+"""
+Port watcher module.
+
+This module provides a PortWatcher thread that keeps a cached list of
+serial ports with their USB metadata up to date in the background. On
+Linux it reacts to device nodes appearing and disappearing in /dev through
+inotify, reading the metadata of just the changed ports; elsewhere it
+rescans periodically.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import selectors
+import struct
+import sys
+import threading
+import time
+from typing import Optional
+
+import serial.tools.list_ports
+from serial.tools.list_ports_common import ListPortInfo
+from PySide6.QtCore import QThread, Signal
+
+import globalvar as gl
+from logwrapper import logger
+
+# inotify(7) constants and event header (wd, mask, cookie, len)
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    """
+    Minimal inotify wrapper over libc through ctypes, for watching /dev.
+    """
+
+    def __init__(self, path: str, mask: int) -> None:
+        """
+        Start watching a directory.
+
+        Args:
+            path: Directory to watch
+            mask: inotify event mask
+
+        Raises:
+            OSError: If inotify is unavailable or the watch cannot be added
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+
+    def read_names(self) -> list[tuple[int, str]]:
+        """
+        Read the pending events.
+
+        Returns:
+            List of (mask, file name) in arrival order
+        """
+        events = []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            _, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            events.append((mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        """Stop watching."""
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class PortWatcher(QThread):
+    """
+    Keeps the serial port list and its metadata current in a separate thread.
+
+    The cache maps each device to pyserial's ListPortInfo (description,
+    VID/PID, serial number, hwid). A full scan fills it on start and on
+    rescan(); with inotify, later changes only read the metadata of the
+    nodes that were created, so a plugged or replugged adapter shows up
+    within gl.PORT_WATCH_SETTLE_MS. Without inotify the port list is
+    rescanned every gl.PORT_POLL_INTERVAL_MS and diffed against the cache.
+
+    Signals:
+        ports_changed: (added ListPortInfo list, removed device list)
+        scan_finished: Number of ports after a full scan
+    """
+
+    ports_changed = Signal(list, list)
+    scan_finished = Signal(int)
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize the port watcher.
+
+        Args:
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.ports: dict[str, ListPortInfo] = {}
+        self.rescan_requested = True
+        self.log = logger.logger
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+    def get_port_info(self, device: str) -> Optional[ListPortInfo]:
+        """
+        Get the cached metadata of a port.
+
+        Args:
+            device: Port name
+
+        Returns:
+            ListPortInfo, or None if the port is not known
+        """
+        return self.ports.get(device)
+
+    def rescan(self) -> None:
+        """Request a full scan, e.g. when the user clicks Check."""
+        self.rescan_requested = True
+        self._wake()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and wait for it."""
+        if self.isRunning():
+            self.requestInterruption()
+            self._wake()
+            if not self.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                self.log.warning("Port watcher thread may not have stopped properly")
+                return
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def run(self) -> None:
+        """
+        Run the watch loop.
+        """
+        threading.current_thread().name = "PortWatcherThread"
+        inotify = self._open_inotify()
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        if inotify is not None:
+            selector.register(inotify.fd, selectors.EVENT_READ)
+            timeout = None
+        else:
+            timeout = gl.PORT_POLL_INTERVAL_MS / 1000
+        self.log.info(f"Port watcher started ({'inotify' if inotify else 'polling'})")
+
+        try:
+            while not self.isInterruptionRequested():
+                if self.rescan_requested:
+                    self.rescan_requested = False
+                    self._full_scan(report=True)
+
+                events = selector.select(timeout)
+                if self.isInterruptionRequested():
+                    break
+                if not events:
+                    self._full_scan(report=False)
+                    continue
+
+                names: list[tuple[int, str]] = []
+                for key, _ in events:
+                    if key.fd == self._wake_r:
+                        self._drain_wake_pipe()
+                    elif inotify is not None:
+                        # Let a burst of node changes (hubs, multi-port adapters) settle
+                        self.msleep(gl.PORT_WATCH_SETTLE_MS)
+                        names += inotify.read_names()
+                if names:
+                    self._apply_events(names)
+        finally:
+            selector.close()
+            if inotify is not None:
+                inotify.close()
+            self.log.info("Port watcher stopped")
+
+    def _open_inotify(self) -> Optional[Inotify]:
+        """Watch /dev with inotify if this is Linux, else return None for polling."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return Inotify(gl.PORT_WATCH_DIR, IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO)
+        except (OSError, AttributeError) as e:
+            self.log.warning(f"inotify unavailable, polling for ports instead: {e}")
+            return None
+
+    def _drain_wake_pipe(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _full_scan(self, report: bool) -> None:
+        """
+        Enumerate all ports and emit the difference to the cache.
+
+        Args:
+            report: Emit scan_finished (for scans the user asked for)
+        """
+        start = time.perf_counter()
+        try:
+            infos = {info.device: info for info in serial.tools.list_ports.comports()}
+        except Exception as e:
+            self.log.error(f"Error scanning ports: {str(e)}")
+            infos = {}
+        added = [info for device, info in infos.items() if device not in self.ports]
+        removed = [device for device in self.ports if device not in infos]
+        self.ports = infos
+        if report:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.log.info(f"Found {len(infos)} serial ports in {elapsed_ms:.1f} ms")
+        if added or removed:
+            self.ports_changed.emit(added, removed)
+        if report:
+            self.scan_finished.emit(len(infos))
+
+    def _apply_events(self, names: list[tuple[int, str]]) -> None:
+        """
+        Update the cache from inotify events, reading metadata only for new nodes.
+
+        Args:
+            names: (mask, file name) events for the watched directory
+        """
+        ports = dict(self.ports)
+        for mask, name in names:
+            device = os.path.join(gl.PORT_WATCH_DIR, name)
+            if not any(fnmatch.fnmatchcase(name, pattern) for pattern in gl.PORT_WATCH_PATTERNS):
+                continue
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                ports.pop(device, None)
+            elif os.path.exists(device):
+                info = self._read_port_info(device)
+                if info is not None:
+                    ports[device] = info
+
+        added = [info for device, info in ports.items() if device not in self.ports]
+        removed = [device for device in self.ports if device not in ports]
+        self.ports = ports
+        if added or removed:
+            self.log.info(
+                f"Ports changed: +{[info.device for info in added]} -{removed}"
+            )
+            self.ports_changed.emit(added, removed)
+
+    def _read_port_info(self, device: str) -> Optional[ListPortInfo]:
+        """
+        Read the metadata of one port from sysfs, as comports() would.
+
+        Args:
+            device: Device path
+
+        Returns:
+            ListPortInfo, or None if this is a non-present internal port
+        """
+        from serial.tools.list_ports_linux import SysFS
+
+        try:
+            info = SysFS(device)
+        except (OSError, ValueError) as e:
+            self.log.warning(f"Cannot read metadata of {device}: {e}")
+            return None
+        # comports() hides non-present internal serial ports the same way
+        return None if info.subsystem == "platform" else info
@@ -0,0 +1,305 @@
+"""
+Headless command line entry point.
+
+Captures a port to disk, sends data or replays a JSON send script without
+the GUI. Only the Qt-free modules are imported, so this starts quickly,
+uses little memory and runs on machines without a display:
+
+    python -m pycom capture /dev/ttyUSB0 -o rx.bin --max-bytes 10000000
+    python -m pycom send /dev/ttyUSB0 "AT" --newline --cycle 1000 --count 10
+    python -m pycom send /dev/ttyUSB0 "01 03 00 00 00 02" --hex --checksum CRC-16/MODBUS
+    python -m pycom send /dev/ttyUSB0 --file firmware.bin
+    python -m pycom script /dev/ttyUSB0 demo/demo_soak_profile.json
+
+Stop with Ctrl-C or SIGTERM. Exit status is 0 on success, 1 on error.
+"""
+
+import argparse
+import itertools
+import logging
+import signal
+import sys
+import threading
+import time
+from typing import Iterable, Optional
+
+import globalvar as gl
+from capture import CaptureWriter
+from checksum import CHECKSUMS
+from data_converter import DataConverter
+from file_handler import FileHandler
+from logwrapper import logger
+from scheduler import JitterStats, run_schedule
+from serial_manager import SerialManager
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
+
+    Returns:
+        Argument parser with capture, send and script subcommands
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("port", help="serial port, e.g. /dev/ttyUSB0 or COM3")
+    common.add_argument("-b", "--baud", type=int, default=115200, help="baud rate (default: 115200)")
+    common.add_argument("--bytesize", type=int, choices=(5, 6, 7, 8), default=8)
+    common.add_argument("--parity", choices=("N", "E", "O", "M", "S"), default="N")
+    common.add_argument("--stopbits", type=float, choices=(1, 1.5, 2), default=1)
+    common.add_argument("--encoding", default="gbk", help="text encoding (default: gbk)")
+    common.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+
+    parser = argparse.ArgumentParser(
+        prog="pycom", description=f"{gl.GUI_INFO['proj']} {gl.GUI_INFO['version']} headless mode"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    capture = commands.add_parser("capture", parents=[common], help="record received bytes")
+    capture.add_argument("-o", "--output", help="capture file (default: raw bytes to stdout)")
+    capture.add_argument("--max-bytes", type=int, default=0, help="rotate after this many bytes")
+    capture.add_argument("--max-seconds", type=float, default=0, help="rotate after this many seconds")
+    capture.add_argument("--duration", type=float, default=0, help="stop after this many seconds")
+    capture.add_argument(
+        "--no-index", action="store_true", help="do not write the .idx file of chunk arrival times"
+    )
+
+    send = commands.add_parser("send", parents=[common], help="send data once or cyclically")
+    send.add_argument("data", nargs="?", help="text, or hex with --hex")
+    send.add_argument("--hex", action="store_true", help="data is hex")
+    send.add_argument("--newline", action="store_true", help="append a newline")
+    send.add_argument("--checksum", choices=list(CHECKSUMS), help="append this checksum of the data")
+    send.add_argument("--cycle", type=int, default=0, help="resend every CYCLE ms")
+    send.add_argument("--count", type=int, default=0, help="sends with --cycle (0: until stopped)")
+    send.add_argument("--file", help="send the raw bytes of a file instead of data")
+
+    script = commands.add_parser("script", parents=[common], help="run a JSON send script")
+    script.add_argument("script", help="JSON script, as used by the GUI's file send")
+
+    return parser
+
+
+def open_serial(args: argparse.Namespace) -> Optional[SerialManager]:
+    """
+    Open the port given on the command line.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Serial manager with the port open, or None on failure
+    """
+    stopbits = int(args.stopbits) if args.stopbits in (1, 2) else args.stopbits
+    serial_manager = SerialManager()
+    success, msg = serial_manager.open_port(
+        args.port, args.baud, args.bytesize, stopbits, args.parity
+    )
+    if not success:
+        print(f"pycom: {args.port}: {msg}", file=sys.stderr)
+        return None
+    return serial_manager
+
+
+def run_capture(args: argparse.Namespace, serial_manager: SerialManager, stop: threading.Event) -> int:
+    """
+    Record received bytes to a (rotating) capture file or stdout.
+
+    Args:
+        args: Parsed arguments
+        serial_manager: Serial manager with the port open
+        stop: Set to stop recording
+
+    Returns:
+        Exit status
+    """
+    writer: Optional[CaptureWriter] = None
+    if args.output:
+        writer = CaptureWriter(args.output, args.max_bytes, args.max_seconds, index=not args.no_index)
+        success, msg = writer.open()
+        if not success:
+            print(f"pycom: {msg}", file=sys.stderr)
+            return 1
+    out = sys.stdout.buffer
+
+    wait_timeout = gl.RECEIVE_WAIT_TIMEOUT_MS / 1000
+    deadline = time.monotonic() + args.duration if args.duration else None
+    total = 0
+    try:
+        while not stop.is_set() and (deadline is None or time.monotonic() < deadline):
+            data = serial_manager.read_available(wait_timeout)
+            if writer is None:
+                if data:
+                    out.write(data)
+                    out.flush()
+            elif data:
+                writer.write(data, time.monotonic_ns())
+            else:
+                writer.sync_if_due()
+            total += len(data)
+    except Exception as e:
+        print(f"pycom: read error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+    logger.logger.info(f"Captured {total} bytes from {args.port}")
+    return 0
+
+
+def run_send(args: argparse.Namespace, serial_manager: SerialManager, stop: threading.Event) -> int:
+    """
+    Send a file, or data once or on a cycle.
+
+    Args:
+        args: Parsed arguments
+        serial_manager: Serial manager with the port open
+        stop: Set to stop sending
+
+    Returns:
+        Exit status
+    """
+    if args.file:
+        return send_file(args.file, serial_manager, stop)
+    if args.data is None:
+        print("pycom: send needs data or --file", file=sys.stderr)
+        return 1
+
+    converter = DataConverter(args.encoding)
+    converter.set_checksum(args.checksum or "")
+    success, payload = converter.prepare_send_data(args.data, args.hex, args.newline)
+    if not success:
+        print(f"pycom: invalid {'hex ' if args.hex else ''}data: {args.data!r}", file=sys.stderr)
+        return 1
+
+    if args.cycle <= 0:
+        steps = [(payload, 0)]
+    elif args.count:
+        # The first send goes out at once, the rest every cycle ms
+        steps = itertools.chain([(payload, 0)], itertools.repeat((payload, args.cycle), args.count - 1))
+    else:
+        steps = itertools.chain([(payload, 0)], itertools.repeat((payload, args.cycle)))
+    return run_steps(steps, serial_manager, stop)
+
+
+def send_file(file_path: str, serial_manager: SerialManager, stop: threading.Event) -> int:
+    """
+    Stream a file's raw bytes to the port in chunks.
+
+    Args:
+        file_path: Path of the file to send
+        serial_manager: Serial manager with the port open
+        stop: Set to stop sending
+
+    Returns:
+        Exit status
+    """
+    buffer = bytearray(gl.FILE_SEND_CHUNK_SIZE)
+    view = memoryview(buffer)
+    sent = 0
+    try:
+        with open(file_path, "rb") as fp:
+            while not stop.is_set():
+                size = fp.readinto(buffer)
+                if not size:
+                    break
+                if serial_manager.write(view[:size]) != size:
+                    print("pycom: serial write failed", file=sys.stderr)
+                    return 1
+                sent += size
+    except OSError as e:
+        print(f"pycom: {e}", file=sys.stderr)
+        return 1
+
+    logger.logger.info(f"Sent file {file_path}: {sent} bytes")
+    return 0
+
+
+def run_script(args: argparse.Namespace, serial_manager: SerialManager, stop: threading.Event) -> int:
+    """
+    Compile a JSON send script and run it on the scheduler.
+
+    Args:
+        args: Parsed arguments
+        serial_manager: Serial manager with the port open
+        stop: Set to stop the script
+
+    Returns:
+        Exit status
+    """
+    file_handler = FileHandler(DataConverter(args.encoding))
+    success, json_data = file_handler.read_json_file(args.script)
+    if not success or not json_data:
+        print(f"pycom: cannot read JSON script {args.script}", file=sys.stderr)
+        return 1
+
+    success, plan = file_handler.compile_send_plan(json_data)
+    if not success:
+        print("pycom: invalid hex data or directive in the JSON script, see the log", file=sys.stderr)
+        return 1
+    return run_steps(plan, serial_manager, stop)
+
+
+def run_steps(
+    steps: Iterable[tuple[bytes, float]], serial_manager: SerialManager, stop: threading.Event
+) -> int:
+    """
+    Write (payload, interval_ms) steps on their deadlines.
+
+    Args:
+        steps: Iterable of (payload, interval_ms), e.g. a SendPlan
+        serial_manager: Serial manager with the port open
+        stop: Set to stop sending
+
+    Returns:
+        Exit status
+    """
+    stats = JitterStats()
+
+    def send(payload: bytes) -> bool:
+        return serial_manager.write(payload) == len(payload)
+
+    status = run_schedule(steps, send, stop.is_set, stats)
+    logger.logger.info(f"Send {status}: {stats}")
+    if status == "failed":
+        print("pycom: serial write failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def set_console_log_level(level: int) -> None:
+    """Set the level of the log's console handler, leaving the log file as is."""
+    for handler in logger.logger.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setLevel(level)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run a headless command.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit status
+    """
+    args = build_parser().parse_args(argv)
+    set_console_log_level(logging.INFO if args.verbose else logging.WARNING)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    serial_manager = open_serial(args)
+    if serial_manager is None:
+        return 1
+
+    commands = {"capture": run_capture, "send": run_send, "script": run_script}
+    try:
+        return commands[args.command](args, serial_manager, stop)
+    finally:
+        serial_manager.close_port()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
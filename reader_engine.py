@@ -0,0 +1,248 @@
+"""
+Reader engine module.
+
+This module provides a ReaderEngine thread that reads every open serial
+port from one selectors loop (epoll on Linux, kqueue on macOS), instead of
+one blocking receiver thread per port.
+"""
+
+import os
+import selectors
+import threading
+import time
+from typing import Optional
+
+from PySide6.QtCore import QThread
+
+import globalvar as gl
+from data_handler import DataReceiver
+from logwrapper import logger
+
+
+class ReaderEngine(QThread):
+    """
+    Services the receive side of any number of ports from a single thread.
+
+    Receivers are added once and stay registered while their port is
+    open; each readable port is read with one non-blocking read and its
+    data dispatched into that receiver's own ring buffer and capture, so
+    the per-port display, counters and recording work exactly as with a
+    dedicated receiver thread. Close requests are carried out on this
+    thread, so a port is never closed under a read in progress.
+
+    Registration changes, close requests and stop are signalled through a
+    self-pipe that is part of the selector, so the loop never has to poll
+    for them. With no open port the loop blocks without a timeout.
+    """
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize the reader engine.
+
+        Args:
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self.selector = selectors.DefaultSelector()
+        self.receivers: list[DataReceiver] = []
+        self.registered: dict[DataReceiver, int] = {}
+        self.condition = threading.Condition()
+        self.requested = 0  # wake requests so far
+        self.synced = 0  # wake requests the loop has acted on
+        self.wakeups = 0
+        self.log = logger.logger
+
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Check if serial ports can be multiplexed on this platform.
+
+        Returns:
+            True on POSIX, where serial ports have pollable descriptors
+        """
+        return os.name == "posix"
+
+    def add(self, receiver: DataReceiver) -> None:
+        """
+        Let the engine read a receiver's port whenever it is open.
+
+        Call again after opening the port so it is registered at once.
+
+        Args:
+            receiver: Data receiver to service
+        """
+        with self.condition:
+            if receiver not in self.receivers:
+                self.receivers.append(receiver)
+            receiver.engine = self
+        self.wake()
+
+    def remove(self, receiver: DataReceiver) -> None:
+        """
+        Stop servicing a receiver.
+
+        Blocks until the engine has unregistered the port, so the caller
+        may close it right away.
+
+        Args:
+            receiver: Data receiver to drop
+        """
+        with self.condition:
+            if receiver in self.receivers:
+                self.receivers.remove(receiver)
+            receiver.engine = None
+        self.wake(wait=True)
+
+    def wake(self, wait: bool = False) -> None:
+        """
+        Make the loop re-check its receivers for opened, closed or closing ports.
+
+        Args:
+            wait: Block until the loop has done so (at most gl.THREAD_WAIT_TIMEOUT_MS)
+        """
+        with self.condition:
+            self.requested += 1
+            request = self.requested
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Pipe already full of wake-ups
+        except OSError:
+            return  # Engine already shut down
+
+        if wait and self.isRunning() and QThread.currentThread() is not self:
+            with self.condition:
+                self.condition.wait_for(
+                    lambda: self.synced >= request or not self.isRunning(),
+                    gl.THREAD_WAIT_TIMEOUT_MS / 1000,
+                )
+
+    def stop(self) -> None:
+        """Stop the loop, wait for it and release the selector."""
+        if self.isRunning():
+            self.requestInterruption()
+            self.wake()
+            if not self.wait(gl.THREAD_WAIT_TIMEOUT_MS):
+                self.log.warning("Reader engine thread may not have stopped properly")
+                return
+        self.selector.close()
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def run(self) -> None:
+        """
+        Run the reader loop.
+
+        Waits on every open port at once and reads the ones that are
+        ready. On timeout each receiver gets an idle tick so captures are
+        still synced to disk on quiet lines.
+        """
+        threading.current_thread().name = "ReaderEngineThread"
+        self.log.info("Reader engine thread started")
+        idle_timeout = gl.RECEIVE_WAIT_TIMEOUT_MS / 1000
+        self._sync()
+
+        while not self.isInterruptionRequested():
+            events = self.selector.select(idle_timeout if self.registered else None)
+            ready_at = time.perf_counter()
+            self.wakeups += 1
+            resync = False
+
+            for key, _ in events:
+                receiver: Optional[DataReceiver] = key.data
+                if receiver is None:
+                    self._drain_wake_pipe()
+                    resync = True
+                    continue
+                receiver.read_ready(ready_at)
+                if receiver.close_port_flag:
+                    resync = True
+
+            if not events:
+                for receiver in self.registered:
+                    receiver.idle(ready_at)
+                # Retry close requests that failed earlier
+                resync = any(receiver.close_port_flag for receiver in self.registered)
+
+            if resync:
+                self._sync()
+
+        for fd in self.registered.values():
+            self._unregister(fd)
+        self.registered.clear()
+        with self.condition:
+            self.synced = self.requested
+            self.condition.notify_all()
+        self.log.info("Reader engine thread stopped")
+
+    def _drain_wake_pipe(self) -> None:
+        """Empty the self-pipe so the next wake-up is seen."""
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _sync(self) -> None:
+        """
+        Bring the selector in line with the receivers' ports.
+
+        Ports that were closed, reopened or dropped are unregistered first,
+        so a reused descriptor number is never mistaken for the old port.
+        Pending close requests are carried out, then newly opened ports
+        are registered.
+        """
+        with self.condition:
+            request = self.requested
+            receivers = list(self.receivers)
+
+        for receiver, fd in list(self.registered.items()):
+            if (
+                receiver not in receivers
+                or receiver.close_port_flag
+                or receiver.serial_manager.fileno() != fd
+            ):
+                self._unregister(fd)
+                del self.registered[receiver]
+
+        for receiver in receivers:
+            if receiver.close_port_flag and receiver.serial_manager.is_open():
+                receiver.service_close_request()
+            if receiver in self.registered or receiver.close_port_flag:
+                continue
+            fd = receiver.serial_manager.fileno()
+            if fd is not None:
+                self.selector.register(fd, selectors.EVENT_READ, receiver)
+                self.registered[receiver] = fd
+
+        with self.condition:
+            self.synced = request
+            self.condition.notify_all()
+
+    def _unregister(self, fd: int) -> None:
+        """Remove a descriptor from the selector, even if it was already closed."""
+        try:
+            self.selector.unregister(fd)
+        except (KeyError, ValueError, OSError):
+            pass
+
+    def get_stats(self) -> dict:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with ports (registered now), receivers and wakeups
+        """
+        return {
+            "ports": len(self.registered),
+            "receivers": len(self.receivers),
+            "wakeups": self.wakeups,
+        }
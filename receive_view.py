@@ -0,0 +1,248 @@
+"""
+Receive view module.
+
+This module provides a bounded receive display: the text widget only keeps
+a limited scrollback in memory while the full session is spooled to disk.
+"""
+
+import codecs
+import shutil
+import tempfile
+from typing import Callable, Optional
+
+from PySide6.QtGui import QTextCursor, QTextDocument
+from PySide6.QtWidgets import QPlainTextDocumentLayout, QPlainTextEdit
+
+import globalvar as gl
+from logwrapper import logger
+
+
+class ReceiveView:
+    """
+    Memory-capped receive display backed by a disk spool.
+
+    QPlainTextEdit only lays out the blocks that are visible, so appending
+    stays cheap as long as the document itself is bounded. The document is
+    capped both in lines (maximumBlockCount) and in characters, and every
+    appended chunk is also written to a temporary spool file so that data
+    scrolled out of the widget can still be saved.
+
+    Each view owns its document, so several views (one per port) can share
+    one widget: appends go to the document even while another view is
+    attached to the widget.
+    """
+
+    def __init__(
+        self,
+        editor: QPlainTextEdit,
+        max_lines: int = gl.RECEIVE_SCROLLBACK_LINES,
+        max_chars: int = gl.RECEIVE_SCROLLBACK_CHARS,
+    ) -> None:
+        """
+        Initialize the receive view.
+
+        Args:
+            editor: Plain text widget the view is shown in when attached
+            max_lines: Scrollback limit in lines (default: gl.RECEIVE_SCROLLBACK_LINES)
+            max_chars: Scrollback limit in characters (default: gl.RECEIVE_SCROLLBACK_CHARS)
+        """
+        self.editor = editor
+        self.max_chars = max_chars
+        self.log = logger.logger
+        # Not parented to the editor: setDocument() deletes a replaced
+        # document if the editor owns it
+        self.document = QTextDocument()
+        self.document.setDocumentLayout(QPlainTextDocumentLayout(self.document))
+        self.document.setDefaultFont(editor.font())
+        self.document.setUndoRedoEnabled(False)
+        self.document.setMaximumBlockCount(max_lines)
+        self.spool = tempfile.TemporaryFile(prefix="pycom_rx_")
+        self.spool_tail = ""  # Last line of the last append, as written to the spool
+
+    def attach(self) -> None:
+        """Show this view's document in the editor."""
+        self.editor.setDocument(self.document)
+        self.editor.moveCursor(QTextCursor.MoveOperation.End)
+
+    def is_attached(self) -> bool:
+        """
+        Check if this view is the one shown in the editor.
+
+        Returns:
+            True if the editor displays this view's document
+        """
+        return self.editor.document() is self.document
+
+    def _scroll_to_end(self) -> None:
+        """Keep the editor scrolled to the newest data while attached."""
+        if self.is_attached():
+            self.editor.moveCursor(QTextCursor.MoveOperation.End)
+
+    def append(self, text: str, replace_chars: int = 0) -> None:
+        """
+        Append text to the end of the view and the spool.
+
+        Args:
+            text: Text to append
+            replace_chars: Characters at the end to replace with the text,
+                e.g. a partial hexdump row that is now complete; at most the
+                last line of the previous append (default: 0)
+        """
+        if not text:
+            return
+
+        try:
+            # The spool holds UTF-8, so the replaced characters are measured
+            # in the bytes they were written as
+            if 0 < replace_chars <= len(self.spool_tail):
+                replaced = self.spool_tail[-replace_chars:].encode("utf-8", "replace")
+                self.spool.seek(-len(replaced), 2)
+                self.spool.truncate()
+            elif replace_chars:
+                self.log.warning(f"Cannot replace {replace_chars} characters in the receive spool")
+            self.spool.write(text.encode("utf-8", "replace"))
+            self.spool_tail = text[text.rfind("\n", 0, len(text) - 1) + 1:]
+        except (OSError, IOError) as e:
+            self.log.error(f"Error writing receive spool: {e}")
+
+        cursor = QTextCursor(self.document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if replace_chars:
+            cursor.movePosition(
+                QTextCursor.MoveOperation.Left,
+                QTextCursor.MoveMode.KeepAnchor,
+                min(replace_chars, self.document.characterCount() - 1),
+            )
+        cursor.insertText(text)
+        self._trim()
+        self._scroll_to_end()
+
+    def _trim(self) -> None:
+        """
+        Drop text from the start of the document once it exceeds max_chars.
+
+        Trims down to 90% of the limit so the cost is amortized over many
+        appends. Long single lines (e.g. hex mode) are not bounded by the
+        block count, so this is the limit that keeps them in check.
+        """
+        document = self.document
+        excess = document.characterCount() - self.max_chars
+        if excess <= 0:
+            return
+
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.movePosition(
+            QTextCursor.MoveOperation.Right,
+            QTextCursor.MoveMode.KeepAnchor,
+            excess + self.max_chars // 10,
+        )
+        # Prefer cutting at a line boundary; a single overlong line is cut as is
+        if cursor.block() != document.lastBlock():
+            cursor.movePosition(
+                QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor
+            )
+        cursor.removeSelectedText()
+
+    def text(self) -> str:
+        """
+        Get the text currently held in the view (not the spooled history).
+
+        Returns:
+            Visible scrollback text
+        """
+        return self.document.toPlainText()
+
+    def convert(self, convert: Callable[[str, bool], Optional[str]]) -> bool:
+        """
+        Re-render the whole session, e.g. when the display mode changes.
+
+        The spool is converted chunk by chunk into a new spool and the view
+        is replaced by the tail of the result, so the saved file and the
+        scrollback always show the same rendering.
+
+        Args:
+            convert: Function taking spooled text, cut at line ends, and
+                whether it is the last chunk, and returning the converted
+                text, or None if the text cannot be converted
+
+        Returns:
+            True if converted, False if the session was left as it was
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        carry = ""
+        tail = ""
+        try:
+            converted = tempfile.TemporaryFile(prefix="pycom_rx_")
+            self.spool.flush()
+            self.spool.seek(0)
+            while True:
+                block = self.spool.read(gl.RECEIVE_SPOOL_CONVERT_CHUNK)
+                final = not block
+                text = carry + decoder.decode(block, final)
+                carry = ""
+                if not final:
+                    cut = text.rfind("\n") + 1
+                    text, carry = text[:cut], text[cut:]
+                output = convert(text, final)
+                if output is None:
+                    converted.close()
+                    return False
+                converted.write(output.encode("utf-8", "replace"))
+                tail = (tail + output)[-self.max_chars:]
+                if final:
+                    break
+        except (OSError, IOError) as e:
+            self.log.error(f"Error converting receive spool: {e}")
+            return False
+        finally:
+            self.spool.seek(0, 2)
+
+        self.spool.close()
+        self.spool = converted
+        if len(tail) == self.max_chars:
+            tail = tail[tail.find("\n") + 1:]  # Start the scrollback at a line
+        self.document.setPlainText(tail)
+        self.spool_tail = tail[tail.rfind("\n", 0, len(tail) - 1) + 1:]
+        self._trim()
+        self._scroll_to_end()
+        return True
+
+    def clear(self) -> None:
+        """Clear the view and discard the spooled history."""
+        self.document.clear()
+        self.spool_tail = ""
+        try:
+            self.spool.seek(0)
+            self.spool.truncate()
+        except (OSError, IOError) as e:
+            self.log.error(f"Error clearing receive spool: {e}")
+
+    def save(self, file_path: str) -> tuple[bool, str]:
+        """
+        Save the whole session, including data no longer displayed.
+
+        Args:
+            file_path: Destination file path
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            self.spool.flush()
+            self.spool.seek(0)
+            with open(file_path, "wb") as fp:
+                shutil.copyfileobj(self.spool, fp)
+            return True, f"Saved received data to {file_path}"
+        except (OSError, IOError) as e:
+            self.log.error(f"Error saving receive spool: {e}")
+            return False, str(e)
+        finally:
+            self.spool.seek(0, 2)
+
+    def close(self) -> None:
+        """Close and delete the spool file."""
+        try:
+            self.spool.close()
+        except (OSError, IOError) as e:
+            self.log.error(f"Error closing receive spool: {e}")
@@ -0,0 +1,121 @@
+"""
+Ring buffer module.
+
+This module provides a byte-capacity ring buffer for passing received data
+from the reader thread to the UI thread without per-chunk locking.
+"""
+
+
+class RingBuffer:
+    """
+    Single-producer, single-consumer byte ring buffer.
+
+    The storage is a preallocated bytearray. The producer only ever advances
+    the write counter and the consumer only ever advances the read counter,
+    so no lock is needed as long as there is exactly one thread on each side.
+    Both counters grow monotonically; positions are taken modulo capacity.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Buffer size in bytes
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        # Consumer-owned area that drain() copies into, so the returned view
+        # stays valid while the producer reuses the ring space.
+        self._drain_buffer = bytearray(capacity)
+        self._drain_view = memoryview(self._drain_buffer)
+        self._write_count = 0  # advanced by the producer only
+        self._read_count = 0  # advanced by the consumer only
+
+    def __len__(self) -> int:
+        """Return the number of bytes waiting to be drained."""
+        return self._write_count - self._read_count
+
+    def written(self) -> int:
+        """
+        Get the stream position of the producer.
+
+        Returns:
+            Total bytes written since the buffer was created
+        """
+        return self._write_count
+
+    def drained(self) -> int:
+        """
+        Get the stream position of the consumer.
+
+        Returns:
+            Total bytes drained or cleared since the buffer was created
+        """
+        return self._read_count
+
+    def free_space(self) -> int:
+        """
+        Get the number of bytes that can be written without dropping.
+
+        Returns:
+            Free space in bytes
+        """
+        return self.capacity - (self._write_count - self._read_count)
+
+    def write(self, data: bytes) -> int:
+        """
+        Write data into the buffer (producer side).
+
+        Data that does not fit is not written; the caller decides how to
+        account for it.
+
+        Args:
+            data: Bytes-like object to write
+
+        Returns:
+            Number of bytes written
+        """
+        size = min(len(data), self.capacity - (self._write_count - self._read_count))
+        if size <= 0:
+            return 0
+
+        start = self._write_count % self.capacity
+        first = min(size, self.capacity - start)
+        self._view[start : start + first] = data[:first]
+        if first < size:
+            self._view[: size - first] = data[first:size]
+
+        # Publish only after the bytes are in place
+        self._write_count += size
+        return size
+
+    def drain(self) -> memoryview:
+        """
+        Take all buffered data as one contiguous view (consumer side).
+
+        The returned view is only valid until the next call to drain().
+
+        Returns:
+            Memoryview of the drained bytes (empty if nothing is buffered)
+        """
+        size = self._write_count - self._read_count
+        if size <= 0:
+            return self._drain_view[:0]
+
+        start = self._read_count % self.capacity
+        first = min(size, self.capacity - start)
+        self._drain_view[:first] = self._view[start : start + first]
+        if first < size:
+            self._drain_view[first:size] = self._view[: size - first]
+
+        self._read_count += size
+        return self._drain_view[:size]
+
+    def clear(self) -> None:
+        """Discard all buffered data (consumer side)."""
+        self._read_count = self._write_count
@@ -0,0 +1,229 @@
+"""
+Scheduler module.
+
+This module provides drift-free cycle scheduling on absolute monotonic
+deadlines and jitter statistics. It has no Qt dependency so it can drive
+both the GUI's cycle sender thread and headless tools.
+"""
+
+import itertools
+import time
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional
+
+import globalvar as gl
+
+
+class JitterStats:
+    """
+    Collects how late each scheduled send happened relative to its deadline.
+
+    Min, max and average are exact over the whole run; the p99 is taken
+    over the most recent samples so memory stays bounded on long runs.
+    """
+
+    def __init__(self, max_samples: int = gl.SCHEDULER_JITTER_SAMPLES) -> None:
+        """
+        Initialize the statistics.
+
+        Args:
+            max_samples: Samples kept for percentiles (default: gl.SCHEDULER_JITTER_SAMPLES)
+        """
+        self.samples: deque = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.overruns = 0
+
+    def record(self, lateness: float) -> None:
+        """
+        Record one send.
+
+        Args:
+            lateness: Seconds between the deadline and the actual send
+        """
+        self.samples.append(lateness)
+        self.count += 1
+        self.total += lateness
+        self.minimum = min(self.minimum, lateness)
+        self.maximum = max(self.maximum, lateness)
+
+    def summary(self, with_p99: bool = True) -> dict:
+        """
+        Get the jitter summary in microseconds.
+
+        Args:
+            with_p99: Sort the kept samples for the p99; without it the
+                summary is cheap enough to read while the run goes on
+
+        Returns:
+            Dictionary with count, overruns, min_us, avg_us, max_us and p99_us
+            (p99_us only with with_p99)
+        """
+        count = self.count
+        if not count:
+            stats = {"count": 0, "overruns": self.overruns, "min_us": 0.0, "avg_us": 0.0, "max_us": 0.0}
+        else:
+            stats = {
+                "count": count,
+                "overruns": self.overruns,
+                "min_us": round(self.minimum * 1e6, 1),
+                "avg_us": round(self.total / count * 1e6, 1),
+                "max_us": round(self.maximum * 1e6, 1),
+            }
+        if with_p99:
+            ordered = sorted(self.samples)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] if ordered else 0.0
+            stats["p99_us"] = round(p99 * 1e6, 1)
+        return stats
+
+    def __str__(self) -> str:
+        s = self.summary()
+        return (
+            f"jitter min/avg/max/p99: {s['min_us']}/{s['avg_us']}/{s['max_us']}/{s['p99_us']} us"
+            f" over {s['count']} sends"
+        )
+
+
+class SendPlan:
+    """
+    Compiled send script, expanded lazily into scheduler steps.
+
+    The plan is a list of nodes holding encoded payloads once each:
+        ("send", payload, interval_ms, repeat): send payload repeat times,
+            interval_ms before each send
+        ("loop", count, nodes): run nodes count times (0: forever)
+
+    Iterating yields (payload, interval_ms) steps for run_schedule() from
+    nested generators, so memory stays constant however many steps the
+    loops and repeats expand to, and each step is O(1) for a given
+    nesting depth. The cursor counts the steps yielded so far.
+    """
+
+    def __init__(self, nodes: list[tuple]) -> None:
+        """
+        Initialize the plan.
+
+        Args:
+            nodes: "send" and "loop" nodes in send order
+        """
+        self.nodes = nodes
+        self.cursor = 0
+
+    def __iter__(self) -> Iterator[tuple[bytes, float]]:
+        self.cursor = 0
+        for step in self._expand(self.nodes):
+            self.cursor += 1
+            yield step
+
+    def _expand(self, nodes: list[tuple]) -> Iterator[tuple[bytes, float]]:
+        """Yield the steps of nodes, expanding repeats and loops on the fly."""
+        for node in nodes:
+            if node[0] == "loop":
+                _, count, children = node
+                passes = itertools.count() if count == 0 else range(count)
+                for _ in passes:
+                    yield from self._expand(children)
+            else:
+                _, payload, interval_ms, repeat = node
+                for _ in range(repeat):
+                    yield payload, interval_ms
+
+    def total_steps(self, nodes: Optional[list[tuple]] = None) -> Optional[int]:
+        """
+        Count the steps the plan expands to without expanding it.
+
+        Args:
+            nodes: Nodes to count (default: the whole plan)
+
+        Returns:
+            Number of steps, or None if the plan loops forever
+        """
+        total = 0
+        for node in self.nodes if nodes is None else nodes:
+            if node[0] == "loop":
+                inner = self.total_steps(node[2])
+                if inner is None or node[1] == 0:
+                    return None
+                total += node[1] * inner
+            else:
+                total += node[3]
+        return total
+
+
+def wait_until(deadline: float, should_stop: Callable[[], bool]) -> bool:
+    """
+    Wait until a time.perf_counter() deadline.
+
+    Sleeps coarsely until shortly before the deadline, then yields in a
+    tight loop for the last gl.SCHEDULER_SPIN_S, because OS sleep alone
+    overshoots by far more than the precision we want.
+
+    Args:
+        deadline: Target time.perf_counter() value
+        should_stop: Callable polled while waiting
+
+    Returns:
+        False if should_stop() became true before the deadline
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return True
+        if should_stop():
+            return False
+        if remaining > gl.SCHEDULER_SPIN_S:
+            time.sleep(min(remaining - gl.SCHEDULER_SPIN_S, gl.SCHEDULER_MAX_SLEEP_S))
+        else:
+            time.sleep(0)
+
+
+def run_schedule(
+    steps: Iterable[tuple[bytes, float]],
+    send: Callable[[bytes], bool],
+    should_stop: Callable[[], bool],
+    stats: JitterStats,
+) -> str:
+    """
+    Send each payload on its absolute deadline.
+
+    Each step is (payload, interval_ms), the delay since the previous
+    deadline; a zero interval sends immediately and is not counted in the
+    jitter. Deadlines are accumulated from the start time rather than
+    from the previous send, so errors never add up. If a send is more than
+    one interval late (e.g. the machine was suspended) the schedule is
+    re-anchored instead of bursting to catch up.
+
+    Args:
+        steps: Iterable of (payload, interval_ms)
+        send: Callable writing one payload, returning success
+        should_stop: Callable polled between and during waits
+        stats: Jitter statistics to update
+
+    Returns:
+        "done" when steps ran out, "stopped" if stopped, "failed" if a send failed
+    """
+    deadline = time.perf_counter()
+    for payload, interval_ms in steps:
+        if not interval_ms:
+            # No deadline to keep: send as soon as possible
+            if should_stop():
+                return "stopped"
+            deadline = time.perf_counter()
+        else:
+            interval = interval_ms / 1000
+            deadline += interval
+            if not wait_until(deadline, should_stop):
+                return "stopped"
+
+            now = time.perf_counter()
+            lateness = now - deadline
+            stats.record(lateness)
+            if lateness > interval:
+                stats.overruns += 1
+                deadline = now
+
+        if not send(payload):
+            return "failed"
+    return "done"
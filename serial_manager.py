@@ -5,8 +5,9 @@ This module provides a SerialManager class for managing serial port operations
 including opening, closing, and configuring serial ports.
 """
 
+import os
+import select
 import serial
-import serial.tools.list_ports
 from typing import Optional
 
 import globalvar as gl
@@ -24,23 +25,12 @@ class SerialManager:
     def __init__(self) -> None:
         """Initialize the serial manager."""
         self.serial_instance: serial.Serial = serial.Serial()
+        # Reusable read buffer: the read methods fill it in place and return
+        # memoryview slices of it, valid until the next read on this manager
+        self.read_buffer = bytearray(gl.RECEIVE_READ_CHUNK)
+        self.read_view = memoryview(self.read_buffer)
         self.log = logger.logger
 
-    def scan_ports(self) -> list[str]:
-        """
-        Scan and return available serial ports.
-
-        Returns:
-            List of available port names.
-        """
-        try:
-            ports_list = [port.device for port in serial.tools.list_ports.comports()]
-            self.log.info(f"Found {len(ports_list)} serial ports")
-            return ports_list
-        except Exception as e:
-            self.log.error(f"Error scanning ports: {str(e)}")
-            return []
-
     def open_port(
         self,
         port: str,
@@ -144,21 +134,153 @@ class SerialManager:
             self.log.error(f"Serial write error: {str(e)}")
             return 0
 
-    def read_all(self) -> bytes:
+    def read_waiting(self) -> memoryview:
         """
-        Read all available data from the serial port.
+        Read exactly the bytes waiting in the driver, without blocking.
+
+        Unlike pyserial's readall(), this does not wait for the read
+        timeout to expire, and the bytes are read into the reusable
+        read buffer instead of a new bytes object.
 
         Returns:
-            Bytes read from the port, empty bytes if failed
+            View of the bytes read (at most len(read_buffer)), valid until
+            the next read; empty if nothing was waiting or failed
         """
         if not self.is_open():
-            return b""
+            return self.read_view[:0]
 
         try:
-            return self.serial_instance.readall()
+            waiting = self.serial_instance.in_waiting
+            if not waiting:
+                return self.read_view[:0]
+            return self._readinto(waiting)
         except (serial.SerialException, OSError, IOError) as e:
             self.log.error(f"Serial read error: {str(e)}")
-            return b""
+            return self.read_view[:0]
+
+    def _readinto(self, size: int) -> memoryview:
+        """
+        Read up to size bytes into the read buffer.
+
+        On POSIX this is one os.readv() straight into the buffer; pyserial's
+        readinto() would read into a new bytes object and copy it over.
+
+        Args:
+            size: Maximum bytes to read
+
+        Returns:
+            View of the bytes read
+
+        Raises:
+            serial.SerialException: If the port reported data but returned
+                none (disconnected or multiple access on port)
+        """
+        view = self.read_view[: min(size, len(self.read_buffer))]
+        fd = self.fileno()
+        if fd is None:
+            return view[: self.serial_instance.readinto(view) or 0]
+
+        try:
+            count = os.readv(fd, [view])
+        except BlockingIOError:
+            return view[:0]
+        if not count:
+            raise serial.SerialException(
+                "device reports readiness to read but returned no data "
+                "(device disconnected or multiple access on port?)"
+            )
+        return view[:count]
+
+    def out_waiting(self) -> int:
+        """
+        Get the number of bytes waiting in the driver's output queue.
+
+        Returns:
+            Bytes not yet transmitted, 0 if unknown or the port is closed
+        """
+        if not self.is_open():
+            return 0
+
+        try:
+            return self.serial_instance.out_waiting
+        except (serial.SerialException, OSError, IOError, NotImplementedError):
+            return 0
+
+    def fileno(self) -> Optional[int]:
+        """
+        Get the OS file descriptor of the open port.
+
+        Returns:
+            File descriptor, or None if the port is closed or the platform
+            does not expose a pollable descriptor (e.g. Windows)
+        """
+        if not self.is_open():
+            return None
+
+        try:
+            return self.serial_instance.fileno()
+        except (AttributeError, OSError, serial.SerialException):
+            return None
+
+    def read_available(self, timeout: float) -> memoryview:
+        """
+        Block until data arrives and return everything that is waiting.
+
+        Returns as soon as the first bytes are available, like
+        read_waiting() but sleeping in the kernel while the port is idle.
+
+        Args:
+            timeout: Maximum time to wait for data in seconds
+
+        Returns:
+            View into the read buffer of the bytes read, valid until the
+            next read; empty on timeout
+
+        Raises:
+            serial.SerialException: If the device fails while reading, so the
+                caller can close the port instead of spinning on a dead fd
+        """
+        view = self.read_view
+        if not self.is_open():
+            return view[:0]
+
+        fd = self.fileno()
+        if fd is not None:
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                return view[:0]
+            return self._readinto(self.serial_instance.in_waiting or 1)
+
+        # No pollable descriptor: let the driver block on the first byte
+        # for up to the port timeout, then take whatever else is queued.
+        count = self.serial_instance.readinto(view[:1]) or 0
+        if count:
+            waiting = min(self.serial_instance.in_waiting, len(view) - 1)
+            if waiting:
+                count += self.serial_instance.readinto(view[1 : 1 + waiting]) or 0
+        return view[:count]
+
+    def read_ready(self, max_bytes: int = gl.RECEIVE_READ_CHUNK) -> memoryview:
+        """
+        Read what is waiting on a port a selector reported readable.
+
+        One non-blocking os.readv() into the read buffer, instead of the
+        in_waiting ioctl plus the select() inside pyserial's read().
+
+        Args:
+            max_bytes: Maximum bytes to read (default: gl.RECEIVE_READ_CHUNK)
+
+        Returns:
+            View into the read buffer of the bytes read, valid until the
+            next read; empty if nothing was waiting
+
+        Raises:
+            serial.SerialException: If the device reports readiness but
+                returns no data (disconnected or multiple access on port)
+        """
+        if self.fileno() is None:
+            return self.read_view[:0]
+        return self._readinto(max_bytes)
 
     def get_instance(self) -> serial.Serial:
         """
@@ -0,0 +1,133 @@
+"""
+Timestamps module.
+
+This module turns the time.monotonic_ns() stamps the reader thread puts on
+received chunks into wall-clock labels, and prefixes received text with
+the arrival time of each line. It has no Qt dependency.
+"""
+
+import bisect
+import time
+from typing import Callable
+
+
+class ReceiveClock:
+    """
+    Maps time.monotonic_ns() stamps to wall-clock time.
+
+    The wall clock is read once, together with the monotonic clock, when
+    the clock is created; every stamp is then placed relative to that
+    anchor. Chunks therefore only carry one integer, and the intervals
+    between them stay exact even if the system clock is adjusted later.
+    """
+
+    def __init__(self) -> None:
+        """Anchor the monotonic clock to the current wall-clock time."""
+        self.anchor_wall_ns = time.time_ns()
+        self.anchor_monotonic_ns = time.monotonic_ns()
+
+    def wall_ns(self, monotonic_ns: int) -> int:
+        """
+        Convert a monotonic stamp to wall-clock time.
+
+        Args:
+            monotonic_ns: time.monotonic_ns() value
+
+        Returns:
+            Nanoseconds since the epoch
+        """
+        return self.anchor_wall_ns + monotonic_ns - self.anchor_monotonic_ns
+
+    def label(self, monotonic_ns: int, digits: int = 3) -> str:
+        """
+        Format a monotonic stamp as a local time label.
+
+        Args:
+            monotonic_ns: time.monotonic_ns() value
+            digits: Digits after the seconds, 3 for ms or 6 for µs
+
+        Returns:
+            Label such as "[12:34:56.789] "
+        """
+        seconds, ns = divmod(self.wall_ns(monotonic_ns), 1_000_000_000)
+        fraction = ns // 10 ** (9 - digits)
+        return f"[{time.strftime('%H:%M:%S', time.localtime(seconds))}.{fraction:0{digits}d}] "
+
+
+def stamp_labeler(
+    stamps: list[tuple[int, int]], clock: ReceiveClock, digits: int
+) -> Callable[[int], str]:
+    """
+    Build a function labelling a byte of a drained block with its chunk's arrival time.
+
+    Args:
+        stamps: (index in the block, time.monotonic_ns()) of each chunk in
+            the block, in order, as from DataReceiver.get_stamped_data_from_queue()
+        clock: Clock the stamps were taken against
+        digits: Digits after the seconds, 3 for ms or 6 for µs
+
+    Returns:
+        Function taking a byte index and returning its label
+    """
+    indexes = [index for index, _ in stamps]
+    labels: dict[int, str] = {}
+
+    def label(index: int) -> str:
+        # Lines starting in the same chunk share its label
+        i = max(bisect.bisect_right(indexes, index) - 1, 0)
+        if i not in labels:
+            labels[i] = clock.label(stamps[i][1], digits) if stamps else ""
+        return labels[i]
+
+    return label
+
+
+class LineStamper:
+    """
+    Prefixes each received line with the arrival time of its first byte.
+
+    The block is split at newline bytes before decoding, so each line
+    starts where its first byte arrived. Decoding goes through the
+    caller's incremental decoder, which keeps multi-byte characters intact
+    across the splits; a line still open at the end of a block is
+    continued without a new label by the next one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stamper at the start of a line."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Start again at the beginning of a line."""
+        self.at_line_start = True
+
+    def render(
+        self,
+        data: bytes,
+        label: Callable[[int], str],
+        decode: Callable[[bytes], str],
+    ) -> str:
+        """
+        Decode a block, labelling each line that starts in it.
+
+        Args:
+            data: Received bytes
+            label: Function returning the label for a byte index in data
+            decode: Incremental decoder, e.g. DataConverter.bytes_to_text
+
+        Returns:
+            Labelled text
+        """
+        data = bytes(data)
+        parts = []
+        pos = 0
+        size = len(data)
+        while pos < size:
+            end = data.find(b"\n", pos)
+            end = size if end < 0 else end + 1
+            if self.at_line_start:
+                parts.append(label(pos))
+            parts.append(decode(data[pos:end]))
+            self.at_line_start = data[end - 1] == 0x0A
+            pos = end
+        return "".join(parts)
@@ -21,7 +21,6 @@ from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame,
     QMenu, QMenuBar, QPlainTextEdit, QPushButton,
     QSizePolicy, QStatusBar, QTabWidget, QTextEdit,
     QWidget)
-import resrc.resource_rc
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -55,6 +54,57 @@ class Ui_MainWindow(object):
         self.actionGBK_GB2312.setObjectName(u"actionGBK_GB2312")
         self.actionGBK_GB2312.setCheckable(True)
         self.actionGBK_GB2312.setChecked(False)
+        self.actionFraming_Off = QAction(MainWindow)
+        self.actionFraming_Off.setObjectName(u"actionFraming_Off")
+        self.actionFraming_Off.setCheckable(True)
+        self.actionFraming_Off.setChecked(True)
+        self.actionFraming_Delimiter = QAction(MainWindow)
+        self.actionFraming_Delimiter.setObjectName(u"actionFraming_Delimiter")
+        self.actionFraming_Delimiter.setCheckable(True)
+        self.actionFraming_Length = QAction(MainWindow)
+        self.actionFraming_Length.setObjectName(u"actionFraming_Length")
+        self.actionFraming_Length.setCheckable(True)
+        self.actionFraming_Fixed = QAction(MainWindow)
+        self.actionFraming_Fixed.setObjectName(u"actionFraming_Fixed")
+        self.actionFraming_Fixed.setCheckable(True)
+        self.actionFraming_Gap = QAction(MainWindow)
+        self.actionFraming_Gap.setObjectName(u"actionFraming_Gap")
+        self.actionFraming_Gap.setCheckable(True)
+        self.actionDecoder_Off = QAction(MainWindow)
+        self.actionDecoder_Off.setObjectName(u"actionDecoder_Off")
+        self.actionDecoder_Off.setCheckable(True)
+        self.actionDecoder_Off.setChecked(True)
+        self.actionDecoder_Modbus_RTU = QAction(MainWindow)
+        self.actionDecoder_Modbus_RTU.setObjectName(u"actionDecoder_Modbus_RTU")
+        self.actionDecoder_Modbus_RTU.setCheckable(True)
+        self.actionDecoder_SLIP = QAction(MainWindow)
+        self.actionDecoder_SLIP.setObjectName(u"actionDecoder_SLIP")
+        self.actionDecoder_SLIP.setCheckable(True)
+        self.actionDecoder_COBS = QAction(MainWindow)
+        self.actionDecoder_COBS.setObjectName(u"actionDecoder_COBS")
+        self.actionDecoder_COBS.setCheckable(True)
+        self.actionChecksum_None = QAction(MainWindow)
+        self.actionChecksum_None.setObjectName(u"actionChecksum_None")
+        self.actionChecksum_None.setCheckable(True)
+        self.actionChecksum_None.setChecked(True)
+        self.actionChecksum_Sum8 = QAction(MainWindow)
+        self.actionChecksum_Sum8.setObjectName(u"actionChecksum_Sum8")
+        self.actionChecksum_Sum8.setCheckable(True)
+        self.actionChecksum_XOR8 = QAction(MainWindow)
+        self.actionChecksum_XOR8.setObjectName(u"actionChecksum_XOR8")
+        self.actionChecksum_XOR8.setCheckable(True)
+        self.actionChecksum_CRC_8 = QAction(MainWindow)
+        self.actionChecksum_CRC_8.setObjectName(u"actionChecksum_CRC_8")
+        self.actionChecksum_CRC_8.setCheckable(True)
+        self.actionChecksum_CRC_16_MODBUS = QAction(MainWindow)
+        self.actionChecksum_CRC_16_MODBUS.setObjectName(u"actionChecksum_CRC_16_MODBUS")
+        self.actionChecksum_CRC_16_MODBUS.setCheckable(True)
+        self.actionChecksum_CRC_16_CCITT = QAction(MainWindow)
+        self.actionChecksum_CRC_16_CCITT.setObjectName(u"actionChecksum_CRC_16_CCITT")
+        self.actionChecksum_CRC_16_CCITT.setCheckable(True)
+        self.actionChecksum_CRC_32 = QAction(MainWindow)
+        self.actionChecksum_CRC_32.setObjectName(u"actionChecksum_CRC_32")
+        self.actionChecksum_CRC_32.setCheckable(True)
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.groupBox = QGroupBox(self.centralwidget)
@@ -283,7 +333,7 @@ class Ui_MainWindow(object):
         self.groupBox_3.setGeometry(QRect(200, 3, 546, 306))
         self.groupBox_3.setAutoFillBackground(False)
         self.groupBox_3.setFlat(False)
-        self.textEdit_Receive = QTextEdit(self.groupBox_3)
+        self.textEdit_Receive = QPlainTextEdit(self.groupBox_3)
         self.textEdit_Receive.setObjectName(u"textEdit_Receive")
         self.textEdit_Receive.setGeometry(QRect(5, 20, 536, 251))
         self.textEdit_Receive.setStyleSheet(u"background-color: rgb(199, 237, 204);")
@@ -294,6 +344,12 @@ class Ui_MainWindow(object):
         self.checkBox_RHexmode = QCheckBox(self.groupBox_3)
         self.checkBox_RHexmode.setObjectName(u"checkBox_RHexmode")
         self.checkBox_RHexmode.setGeometry(QRect(270, 275, 85, 26))
+        self.checkBox_RRecord = QCheckBox(self.groupBox_3)
+        self.checkBox_RRecord.setObjectName(u"checkBox_RRecord")
+        self.checkBox_RRecord.setGeometry(QRect(180, 275, 85, 26))
+        self.comboBox_RTime = QComboBox(self.groupBox_3)
+        self.comboBox_RTime.setObjectName(u"comboBox_RTime")
+        self.comboBox_RTime.setGeometry(QRect(70, 275, 100, 26))
         self.pushButton_RClear = QPushButton(self.groupBox_3)
         self.pushButton_RClear.setObjectName(u"pushButton_RClear")
         self.pushButton_RClear.setGeometry(QRect(370, 275, 71, 26))
@@ -324,6 +380,15 @@ class Ui_MainWindow(object):
         font2.setPointSize(9)
         font2.setBold(False)
         self.menuEncoding_Type.setFont(font2)
+        self.menuFraming = QMenu(self.menuSetting)
+        self.menuFraming.setObjectName(u"menuFraming")
+        self.menuFraming.setFont(font2)
+        self.menuDecoder = QMenu(self.menuSetting)
+        self.menuDecoder.setObjectName(u"menuDecoder")
+        self.menuDecoder.setFont(font2)
+        self.menuChecksum = QMenu(self.menuSetting)
+        self.menuChecksum.setObjectName(u"menuChecksum")
+        self.menuChecksum.setFont(font2)
         MainWindow.setMenuBar(self.menubar)
         self.statusbar = QStatusBar(MainWindow)
         self.statusbar.setObjectName(u"statusbar")
@@ -337,11 +402,33 @@ class Ui_MainWindow(object):
         self.menuFile.addAction(self.actionExit)
         self.menuAbout.addAction(self.actionAbout)
         self.menuSetting.addAction(self.menuEncoding_Type.menuAction())
+        self.menuSetting.addAction(self.menuFraming.menuAction())
+        self.menuSetting.addAction(self.menuDecoder.menuAction())
+        self.menuSetting.addAction(self.menuChecksum.menuAction())
         self.menuEncoding_Type.addAction(self.actionASCII)
         self.menuEncoding_Type.addSeparator()
         self.menuEncoding_Type.addAction(self.actionUTF_8)
         self.menuEncoding_Type.addSeparator()
         self.menuEncoding_Type.addAction(self.actionGBK_GB2312)
+        self.menuFraming.addAction(self.actionFraming_Off)
+        self.menuFraming.addSeparator()
+        self.menuFraming.addAction(self.actionFraming_Delimiter)
+        self.menuFraming.addAction(self.actionFraming_Length)
+        self.menuFraming.addAction(self.actionFraming_Fixed)
+        self.menuFraming.addAction(self.actionFraming_Gap)
+        self.menuDecoder.addAction(self.actionDecoder_Off)
+        self.menuDecoder.addSeparator()
+        self.menuDecoder.addAction(self.actionDecoder_Modbus_RTU)
+        self.menuDecoder.addAction(self.actionDecoder_SLIP)
+        self.menuDecoder.addAction(self.actionDecoder_COBS)
+        self.menuChecksum.addAction(self.actionChecksum_None)
+        self.menuChecksum.addSeparator()
+        self.menuChecksum.addAction(self.actionChecksum_Sum8)
+        self.menuChecksum.addAction(self.actionChecksum_XOR8)
+        self.menuChecksum.addAction(self.actionChecksum_CRC_8)
+        self.menuChecksum.addAction(self.actionChecksum_CRC_16_MODBUS)
+        self.menuChecksum.addAction(self.actionChecksum_CRC_16_CCITT)
+        self.menuChecksum.addAction(self.actionChecksum_CRC_32)
 
         self.retranslateUi(MainWindow)
 
@@ -364,6 +451,22 @@ class Ui_MainWindow(object):
         self.actionUTF_8.setText(QCoreApplication.translate("MainWindow", u"UTF-8", None))
         self.actionASCII.setText(QCoreApplication.translate("MainWindow", u"ASCII", None))
         self.actionGBK_GB2312.setText(QCoreApplication.translate("MainWindow", u"GBK/GB2312", None))
+        self.actionFraming_Off.setText(QCoreApplication.translate("MainWindow", u"Off", None))
+        self.actionFraming_Delimiter.setText(QCoreApplication.translate("MainWindow", u"Delimiter...", None))
+        self.actionFraming_Length.setText(QCoreApplication.translate("MainWindow", u"Length Prefix...", None))
+        self.actionFraming_Fixed.setText(QCoreApplication.translate("MainWindow", u"Fixed Size...", None))
+        self.actionFraming_Gap.setText(QCoreApplication.translate("MainWindow", u"Idle Gap...", None))
+        self.actionDecoder_Off.setText(QCoreApplication.translate("MainWindow", u"Off", None))
+        self.actionDecoder_Modbus_RTU.setText(QCoreApplication.translate("MainWindow", u"Modbus RTU", None))
+        self.actionDecoder_SLIP.setText(QCoreApplication.translate("MainWindow", u"SLIP", None))
+        self.actionDecoder_COBS.setText(QCoreApplication.translate("MainWindow", u"COBS", None))
+        self.actionChecksum_None.setText(QCoreApplication.translate("MainWindow", u"None", None))
+        self.actionChecksum_Sum8.setText(QCoreApplication.translate("MainWindow", u"Sum8", None))
+        self.actionChecksum_XOR8.setText(QCoreApplication.translate("MainWindow", u"XOR8", None))
+        self.actionChecksum_CRC_8.setText(QCoreApplication.translate("MainWindow", u"CRC-8", None))
+        self.actionChecksum_CRC_16_MODBUS.setText(QCoreApplication.translate("MainWindow", u"CRC-16/MODBUS", None))
+        self.actionChecksum_CRC_16_CCITT.setText(QCoreApplication.translate("MainWindow", u"CRC-16/CCITT", None))
+        self.actionChecksum_CRC_32.setText(QCoreApplication.translate("MainWindow", u"CRC-32", None))
         self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"Settings", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"SerialPort", None))
         self.label_2.setText(QCoreApplication.translate("MainWindow", u"BaudRate", None))
@@ -409,16 +512,20 @@ class Ui_MainWindow(object):
         self.label_6.setText(QCoreApplication.translate("MainWindow", u" File:", None))
         self.pushButton_fSelect.setText(QCoreApplication.translate("MainWindow", u"Select", None))
         self.pushButton_fSend.setText(QCoreApplication.translate("MainWindow", u"Send", None))
-        self.label_8.setText(QCoreApplication.translate("MainWindow", u"support: 1. txt file   2. customized json file", None))
+        self.label_8.setText(QCoreApplication.translate("MainWindow", u"support: 1. txt/binary file   2. customized json file", None))
         self.SendTab.setTabText(self.SendTab.indexOf(self.file), QCoreApplication.translate("MainWindow", u"File", None))
         self.SendTab.setTabText(self.SendTab.indexOf(self.guide), QCoreApplication.translate("MainWindow", u"Guide", None))
         self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"Receive", None))
         self.checkBox_RHexmode.setText(QCoreApplication.translate("MainWindow", u"HexMode", None))
+        self.checkBox_RRecord.setText(QCoreApplication.translate("MainWindow", u"Record", None))
         self.pushButton_RClear.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
         self.pushButton_RSave.setText(QCoreApplication.translate("MainWindow", u"Save", None))
         self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
         self.menuAbout.setTitle(QCoreApplication.translate("MainWindow", u"About", None))
         self.menuSetting.setTitle(QCoreApplication.translate("MainWindow", u"Settings", None))
         self.menuEncoding_Type.setTitle(QCoreApplication.translate("MainWindow", u"Encoding Set", None))
+        self.menuFraming.setTitle(QCoreApplication.translate("MainWindow", u"Receive Framing", None))
+        self.menuDecoder.setTitle(QCoreApplication.translate("MainWindow", u"Receive Decoder", None))
+        self.menuChecksum.setTitle(QCoreApplication.translate("MainWindow", u"Send Checksum", None))
     # retranslateUi
 